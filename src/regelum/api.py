@@ -1,20 +1,19 @@
 from typing import List, Any, Optional
-from collections import defaultdict
 
 from loguru import logger
 
 from regelum.logging_config import configure_logging
 from regelum.core.runtime import GraphRuntime
 from regelum.core.node import RawNode
+from regelum.core.hybrid_adapters import ContinuousWrapper
+from regelum.core.time import EventQueue
 from regelum.compiler.pipeline import CompilerPipeline, CompilerConfig
 from regelum.compiler.passes import (
     StructuralPass,
     TypeCheckPass,
     CausalityPass,
     WriteConflictPass,
-    InitPass,
-    NonZenoPass,
-    ContinuousPass,
+    FusedNodeLocalPass,
 )
 from regelum.compiler.passes_sdf import SDFPass
 from regelum.compiler.report import CompilationReport
@@ -23,11 +22,25 @@ configure_logging()
 
 
 class Pipeline:
-    def __init__(self, mode: str = "pragmatic"):
+    def __init__(self, mode: str = "pragmatic", workers: int = 1):
         self.runtime = GraphRuntime()
+        self.runtime.workers = workers
         self.mode = mode
+        self.events = EventQueue()
         self._compiled = False
+        # Kept across compile() calls so unchanged Core nodes reuse their IR.
+        self._compiler: Optional[CompilerPipeline] = None
     
+    def close(self) -> None:
+        """Release the runtime's worker threads."""
+        self.runtime.close()
+
+    def __enter__(self) -> "Pipeline":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def add(self, *nodes: RawNode):
         for node in nodes:
             self.runtime.add_node(node)
@@ -46,56 +59,68 @@ class Pipeline:
              - If strict=False -> Skip/Warn.
            - If no outputs match -> Skip (StructuralPass will catch unconnected later).
         """
-        outputs_by_name = defaultdict(list)
+        # Most names map to exactly one output: store the (node, port) pair directly
+        # and only promote to a list on the first collision.
+        outputs_by_name: dict[str, Any] = {}
         nodes = list(self.runtime.nodes.values())
         
         # Index outputs
         for node in nodes:
             for name, port in node.outputs.items():
-                outputs_by_name[name].append((node, port))
+                entry = (node, port)
+                prev = outputs_by_name.get(name)
+                if prev is None:
+                    outputs_by_name[name] = entry
+                elif type(prev) is list:
+                    prev.append(entry)
+                else:
+                    outputs_by_name[name] = [prev, entry]
         
         # Connect inputs
+        edges = self.runtime.edges
         connections_made = 0
         for node in nodes:
             for name, port in node.inputs.items():
-                if port in self.runtime.edges:
+                if port in edges:
                     continue # Already connected
                 
-                if name in outputs_by_name:
-                    sources = outputs_by_name[name]
-                    if len(sources) == 1:
-                        src_node, src_port = sources[0]
-                        # Prevent self-loop auto-wiring if unintended? 
-                        # Usually valid in feedback, but maybe warn?
-                        # Let's allow it, CausalityPass will check it.
-                        self.runtime.connect(src_port, port)
-                        connections_made += 1
-                        logger.info(
-                            "Auto-wired {src}.{sport} -> {dst}.{dport}",
-                            src=src_node.id,
-                            sport=src_port.name,
-                            dst=node.id,
-                            dport=port.name,
-                        )
-                    elif len(sources) > 1:
-                        msg = f"Ambiguous auto-wire for port '{name}': found sources {[n.id for n, p in sources]}"
-                        if strict:
-                            raise ValueError(msg)
-                        else:
-                            logger.warning("{msg}. Skipping auto-wire.", msg=msg)
+                sources = outputs_by_name.get(name)
+                if sources is None:
+                    continue
+                if type(sources) is tuple:
+                    src_node, src_port = sources
+                    # Prevent self-loop auto-wiring if unintended? 
+                    # Usually valid in feedback, but maybe warn?
+                    # Let's allow it, CausalityPass will check it.
+                    self.runtime.connect(src_port, port)
+                    connections_made += 1
+                    logger.info(
+                        "Auto-wired {src}.{sport} -> {dst}.{dport}",
+                        src=src_node.id,
+                        sport=src_port.name,
+                        dst=node.id,
+                        dport=port.name,
+                    )
+                else:
+                    msg = f"Ambiguous auto-wire for port '{name}': found sources {[n.id for n, p in sources]}"
+                    if strict:
+                        raise ValueError(msg)
+                    else:
+                        logger.warning("{msg}. Skipping auto-wire.", msg=msg)
         
         logger.info("Auto-wiring completed. connections={count}", count=connections_made)
 
     def compile(self) -> bool:
-        compiler = CompilerPipeline(CompilerConfig(mode=self.mode))
-        compiler.add_pass(StructuralPass())
-        compiler.add_pass(TypeCheckPass())
-        compiler.add_pass(CausalityPass())
-        compiler.add_pass(WriteConflictPass())
-        compiler.add_pass(InitPass())
-        compiler.add_pass(NonZenoPass())
-        compiler.add_pass(ContinuousPass())
-        compiler.add_pass(SDFPass())
+        config = CompilerConfig(mode=self.mode, max_workers=self.runtime.workers)
+        compiler = self._compiler
+        if compiler is None or compiler.config != config:
+            compiler = self._compiler = CompilerPipeline(config)
+            compiler.add_pass(StructuralPass())
+            compiler.add_pass(TypeCheckPass())
+            compiler.add_pass(CausalityPass())
+            compiler.add_pass(WriteConflictPass())
+            compiler.add_pass(FusedNodeLocalPass())
+            compiler.add_pass(SDFPass())
         
         ir = compiler.build_ir(self.runtime)
         res = compiler.run_passes(ir)
@@ -115,5 +140,43 @@ class Pipeline:
                 raise RuntimeError("Pipeline compilation failed")
                 
         logger.info("Running pipeline ticks={ticks}", ticks=ticks)
-        for _ in range(ticks):
-            self.runtime.run_tick(inputs=inputs, dt=dt)
+        try:
+            for _ in range(ticks):
+                self.runtime.run_tick(inputs=inputs, dt=dt)
+        finally:
+            # Worker threads are scoped to one run so none outlive the pipeline.
+            self.runtime.close()
+
+    def run_events(self, until: float | None = None) -> None:
+        """
+        Event-driven execution over `self.events` (payload: optional inputs dict).
+        Continuous wrappers are propagated across the gap to each event with their held
+        inputs, then a single discrete tick applies the event. Wrappers see dt=0 in that
+        tick, so they only latch new inputs and publish their state.
+        """
+        if not self._compiled:
+            if not self.compile():
+                raise RuntimeError("Pipeline compilation failed")
+
+        wrappers = [n for n in self.runtime.nodes.values() if isinstance(n, ContinuousWrapper)]
+        hold_dt = {w.dt: 0.0 for w in wrappers}
+        processed = 0
+        try:
+            while self.events:
+                t_next = self.events.peek_time()
+                if until is not None and t_next > until:
+                    break
+                t_next, event = self.events.pop()
+                gap = t_next - self.runtime.current_time
+                if gap < 0.0:
+                    raise ValueError(f"Event at t={t_next} precedes current time {self.runtime.current_time}")
+                for wrapper in wrappers:
+                    wrapper.propagate(gap)
+                inputs = dict(hold_dt)
+                if event:
+                    inputs.update(event)
+                self.runtime.run_tick(inputs=inputs, dt=gap)
+                processed += 1
+        finally:
+            self.runtime.close()
+        logger.info("Event-driven run completed. events={count}", count=processed)
@@ -0,0 +1,126 @@
+"""
+Numba-compiled SCC search for very large causality graphs.
+
+Optional: `tarjan` is None unless numba is installed (`pip install regelum[jit]`). The
+kernel is the same Pearce search as `_causality_native.tarjan`, written over numpy int32
+arrays so it can be JIT-compiled; it emits SCCs, and the vertices within each SCC, in
+exactly the same order.
+"""
+
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
+
+# Below this many vertices the one-off compile (or cache load) costs more than it saves.
+JIT_MIN_VERTICES = 50_000
+
+
+def _tarjan_kernel(vertices: np.ndarray, offsets: np.ndarray, neighbors: np.ndarray):
+    """
+    Returns (members, bounds): SCC k is members[bounds[k]:bounds[k + 1]]. Plain Python
+    over numpy arrays; only fast once wrapped with njit.
+    """
+    n = offsets.shape[0] - 1
+    count = vertices.shape[0]
+    rindex = np.full(n, n, np.int32)
+    for k in range(count):
+        rindex[vertices[k]] = 0
+    is_root = np.zeros(n, np.uint8)
+    stack = np.empty(n, np.int32)
+    work_v = np.empty(n, np.int32)
+    work_i = np.empty(n, np.int32)
+    members = np.empty(count, np.int32)
+    bounds = np.zeros(count + 1, np.int32)
+    sp = 0
+    wp = 0
+    mp = 0
+    nb = 0
+    index = 1
+    component = n - 1
+
+    for k in range(count):
+        start = vertices[k]
+        if rindex[start] != 0:
+            continue
+        rindex[start] = index
+        index += 1
+        is_root[start] = 1
+        work_v[wp] = start
+        work_i[wp] = offsets[start]
+        wp += 1
+
+        while wp > 0:
+            v = work_v[wp - 1]
+            i = work_i[wp - 1]
+            end = offsets[v + 1]
+            r_v = rindex[v]
+            descended = False
+            while i < end:
+                w = neighbors[i]
+                i += 1
+                r_w = rindex[w]
+                if r_w == 0:
+                    work_i[wp - 1] = i
+                    rindex[v] = r_v
+                    rindex[w] = index
+                    index += 1
+                    is_root[w] = 1
+                    work_v[wp] = w
+                    work_i[wp] = offsets[w]
+                    wp += 1
+                    descended = True
+                    break
+                if r_w < r_v:
+                    r_v = r_w
+                    is_root[v] = 0
+            if descended:
+                continue
+
+            rindex[v] = r_v
+            wp -= 1
+            if is_root[v]:
+                index -= 1
+                members[mp] = v
+                mp += 1
+                while sp > 0 and r_v <= rindex[stack[sp - 1]]:
+                    sp -= 1
+                    w = stack[sp]
+                    rindex[w] = component
+                    index -= 1
+                    members[mp] = w
+                    mp += 1
+                rindex[v] = component
+                component -= 1
+                nb += 1
+                bounds[nb] = mp
+            else:
+                stack[sp] = v
+                sp += 1
+            if wp > 0:
+                parent = work_v[wp - 1]
+                if rindex[v] < rindex[parent]:
+                    rindex[parent] = rindex[v]
+                    is_root[parent] = 0
+    return members, bounds[: nb + 1]
+
+
+def _split(members: np.ndarray, bounds: np.ndarray) -> List[List[int]]:
+    flat = members.tolist()
+    b = bounds.tolist()
+    return [flat[b[k]:b[k + 1]] for k in range(len(b) - 1)]
+
+
+tarjan: Optional[Callable[[Sequence[int], np.ndarray, np.ndarray], List[List[int]]]] = None
+
+if njit is not None:  # pragma: no cover - depends on the environment
+    _compiled_kernel = njit(cache=True, nogil=True)(_tarjan_kernel)
+
+    def _jit_tarjan(vertices: Sequence[int], offsets: np.ndarray, neighbors: np.ndarray) -> List[List[int]]:
+        return _split(*_compiled_kernel(np.asarray(vertices, dtype=np.int32), offsets, neighbors))
+
+    tarjan = _jit_tarjan
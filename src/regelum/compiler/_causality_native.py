@@ -0,0 +1,213 @@
+"""
+Hot loops of CausalityPass over dense int vertex ids.
+
+Plain Python that is also mypyc-compatible: concrete list/dict/int annotations, no
+closures, no dynamic attribute access. Wheels built with the opt-in `mypyc` hatch
+build hook ship this module compiled; otherwise it is imported as-is.
+"""
+
+from array import array
+from collections import deque
+from typing import Callable, Optional, Sequence
+
+
+def tarjan(
+    vertices: list[int],
+    offsets: Sequence[int],
+    neighbors: Sequence[int],
+    on_scc: Optional[Callable[[list[int]], None]] = None,
+    skip_trivial: bool = False,
+) -> list[list[int]]:
+    """
+    Iterative SCC search over the subgraph induced by `vertices`, using Pearce's
+    space-efficient variant of Tarjan: one rindex array doubles as DFS number, lowlink
+    and component id, plus a root bit per vertex. CSR adjacency: successors of v are
+    neighbors[offsets[v]:offsets[v + 1]]. SCCs come out in reverse topological order;
+    with `on_scc` each is passed to the callback as soon as it closes and none are kept.
+    `skip_trivial` drops singleton SCCs without a self-loop before any list is built.
+    """
+    n = len(offsets) - 1
+    # rindex: 0 = unvisited, small values = live DFS numbers, values counting down from
+    # n - 1 = finished component ids. Non-members start at n, which reads as "finished"
+    # and is never smaller than a live number, so the search never leaves the subgraph.
+    rindex = array("i", [n]) * n
+    for v in vertices:
+        rindex[v] = 0
+    is_root = bytearray(n)
+    stack: list[int] = []
+    sccs: list[list[int]] = []
+    work_v: list[int] = []
+    work_i: list[int] = []
+    index = 1
+    component = n - 1
+
+    for start in vertices:
+        if rindex[start] != 0:
+            continue
+        rindex[start] = index
+        index += 1
+        is_root[start] = 1
+        work_v.append(start)
+        work_i.append(offsets[start])
+
+        while work_v:
+            v = work_v[-1]
+            i = work_i[-1]
+            end = offsets[v + 1]
+            r_v = rindex[v]
+            descended = False
+            while i < end:
+                w = neighbors[i]
+                i += 1
+                r_w = rindex[w]
+                if r_w == 0:
+                    work_i[-1] = i
+                    rindex[v] = r_v
+                    rindex[w] = index
+                    index += 1
+                    is_root[w] = 1
+                    work_v.append(w)
+                    work_i.append(offsets[w])
+                    descended = True
+                    break
+                if r_w < r_v:
+                    r_v = r_w
+                    is_root[v] = 0
+            if descended:
+                continue
+
+            # All successors of v are done: close its SCC or leave v for its root.
+            rindex[v] = r_v
+            work_v.pop()
+            work_i.pop()
+            if is_root[v]:
+                index -= 1
+                if skip_trivial and (not stack or r_v > rindex[stack[-1]]) and not _has_self_loop(v, offsets, neighbors):
+                    # Singleton SCC without a self-loop: close it without building a list.
+                    rindex[v] = component
+                    component -= 1
+                else:
+                    scc: list[int] = [v]
+                    while stack and r_v <= rindex[stack[-1]]:
+                        w = stack.pop()
+                        rindex[w] = component
+                        index -= 1
+                        scc.append(w)
+                    rindex[v] = component
+                    component -= 1
+                    if on_scc is None:
+                        sccs.append(scc)
+                    else:
+                        on_scc(scc)
+            else:
+                stack.append(v)
+            if work_v:
+                parent = work_v[-1]
+                if rindex[v] < rindex[parent]:
+                    rindex[parent] = rindex[v]
+                    is_root[parent] = 0
+    return sccs
+
+
+def _has_self_loop(v: int, offsets: Sequence[int], neighbors: Sequence[int]) -> bool:
+    for i in range(offsets[v], offsets[v + 1]):
+        if neighbors[i] == v:
+            return True
+    return False
+
+
+def cyclic_residual(offsets: Sequence[int], neighbors: Sequence[int]) -> list[int]:
+    """
+    Kahn's topological peeling; returns the vertices it cannot discharge, i.e. the
+    cycles and everything downstream of them (closed under successors).
+    """
+    n = len(offsets) - 1
+    indegree: list[int] = [0] * n
+    for w in neighbors:
+        indegree[w] += 1
+    queue: list[int] = [v for v in range(n) if indegree[v] == 0]
+    head = 0
+    while head < len(queue):
+        v = queue[head]
+        head += 1
+        for i in range(offsets[v], offsets[v + 1]):
+            w = neighbors[i]
+            indegree[w] -= 1
+            if indegree[w] == 0:
+                queue.append(w)
+    if len(queue) == n:
+        return []
+    return [v for v in range(n) if indegree[v] > 0]
+
+
+def trim_sinks(vertices: list[int], offsets: Sequence[int], neighbors: Sequence[int]) -> list[int]:
+    """
+    Reverse Kahn peeling restricted to `vertices`: drops those that cannot reach a cycle
+    inside the set (their successors all peel away). What is left lies on a cycle or on a
+    path between two cycles, which is all Tarjan needs to see.
+    """
+    n = len(offsets) - 1
+    member: list[bool] = [False] * n
+    for v in vertices:
+        member[v] = True
+    outdegree: list[int] = [0] * n
+    preds: dict[int, list[int]] = {}
+    for v in vertices:
+        for i in range(offsets[v], offsets[v + 1]):
+            w = neighbors[i]
+            if member[w]:
+                outdegree[v] += 1
+                if w in preds:
+                    preds[w].append(v)
+                else:
+                    preds[w] = [v]
+    queue: list[int] = [v for v in vertices if outdegree[v] == 0]
+    head = 0
+    while head < len(queue):
+        w = queue[head]
+        head += 1
+        member[w] = False
+        for v in preds.get(w, []):
+            outdegree[v] -= 1
+            if outdegree[v] == 0:
+                queue.append(v)
+    if not queue:
+        return vertices
+    return [v for v in vertices if member[v]]
+
+
+def run_worklist(
+    targets: list[int],
+    consumers: dict[int, list[int]],
+    evaluate: Callable[[int], object],
+    join: Callable[[object, object], tuple[object, bool, bool]],
+    env: dict[int, object],
+    bottom: object,
+    budget: int,
+) -> bool:
+    """
+    Gauss-Seidel fixpoint: unit `u` writes vertex targets[u] with evaluate(u), merged via
+    join; units reading a changed vertex are re-queued. Returns False on a join conflict
+    or when `budget` evaluations run out before the worklist drains.
+    """
+    count = len(targets)
+    worklist: deque[int] = deque(range(count))
+    queued: list[bool] = [True] * count
+    while worklist:
+        if budget <= 0:
+            return False
+        budget -= 1
+        u = worklist.popleft()
+        queued[u] = False
+        target = targets[u]
+
+        merged, changed, conflict = join(env.get(target, bottom), evaluate(u))
+        if conflict:
+            return False
+        if changed:
+            env[target] = merged
+            for consumer in consumers.get(target, []):
+                if not queued[consumer]:
+                    queued[consumer] = True
+                    worklist.append(consumer)
+    return True
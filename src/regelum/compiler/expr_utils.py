@@ -1,26 +1,78 @@
 from __future__ import annotations
 
-from typing import Any, Set
+from functools import partial
+from typing import Any, Dict, FrozenSet, Set, Tuple
+from weakref import ref
 
-from regelum.core.dsl import Expr, Var, If, BinOp, Cmp, Delay
+from regelum.core.dsl import Expr, Var, If, BinOp, Cmp
 
 
-def collect_expr_vars(expr: Expr[Any]) -> Set[str]:
+def _scan(expr: Expr[Any]) -> Tuple[Set[str], bool]:
+    """
+    One walk for both facts the compiler needs about an AST: the Var names it reads and
+    whether every leaf is a Var (no Const, Delay or other source).
+    """
     vars_: Set[str] = set()
-    if isinstance(expr, Var):
-        vars_.add(expr.name)
-    elif isinstance(expr, If):
-        vars_.update(collect_expr_vars(expr.cond))
-        vars_.update(collect_expr_vars(expr.then_))
-        vars_.update(collect_expr_vars(expr.else_))
-    elif isinstance(expr, BinOp):
-        vars_.update(collect_expr_vars(expr.left))
-        vars_.update(collect_expr_vars(expr.right))
-    elif isinstance(expr, Cmp):
-        vars_.update(collect_expr_vars(expr.left))
-        vars_.update(collect_expr_vars(expr.right))
-    elif isinstance(expr, Delay):
-        # Delay nodes break instant dependency, nothing to add.
-        pass
-    return vars_
+    only_vars = True
+    stack = [expr]
+    push = stack.append
+    while stack:
+        e = stack.pop()
+        t = type(e)
+        if t is Var:
+            vars_.add(e.name)
+        elif t is BinOp or t is Cmp:
+            push(e.left)
+            push(e.right)
+        elif t is If:
+            push(e.cond)
+            push(e.then_)
+            push(e.else_)
+        else:
+            # Const, Delay, ...: a leaf that is a source of its own. Delay nodes also break
+            # instant dependency, so they contribute no variables.
+            only_vars = False
+    return vars_, only_vars
+
+
+def collect_expr_vars(expr: Expr[Any]) -> Set[str]:
+    return _scan(expr)[0]
+
+
+# Keyed by id(): a WeakKeyDictionary would compare colliding keys with ==, which on DSL
+# nodes builds a Cmp. Each entry holds a weak reference whose callback evicts it, so
+# entries live exactly as long as their expression. DSL nodes are frozen, so a cached
+# result stays valid across compiles and reactions are walked once per process.
+# Passes running on worker threads read and write it concurrently without a lock; that
+# relies on each get, set and pop being a single atomic dict operation.
+_EXPR_VARS_CACHE: Dict[int, Tuple["ref[Expr[Any]]", FrozenSet[str], bool]] = {}
+
+
+def _evict(key: int, _: "ref[Expr[Any]]") -> None:
+    _EXPR_VARS_CACHE.pop(key, None)
+
+
+def _scanned(expr: Expr[Any]) -> Tuple["ref[Expr[Any]]", FrozenSet[str], bool]:
+    key = id(expr)
+    hit = _EXPR_VARS_CACHE.get(key)
+    if hit is None or hit[0]() is not expr:
+        vars_, only_vars = _scan(expr)
+        hit = _EXPR_VARS_CACHE[key] = (ref(expr, partial(_evict, key)), frozenset(vars_), only_vars)
+    return hit
+
+
+def expr_vars(expr: Expr[Any]) -> FrozenSet[str]:
+    """Memoized `collect_expr_vars`: each AST is walked once and the result shared."""
+    return _scanned(expr)[1]
+
+
+def reads_only_vars(expr: Expr[Any]) -> bool:
+    """
+    True if every leaf of `expr` is a Var. Under the 3-valued evaluator such an expression
+    stays BOTTOM while all its inputs are BOTTOM. Shares the `expr_vars` memo.
+    """
+    return _scanned(expr)[2]
+
 
+def clear_expr_vars_cache() -> None:
+    _EXPR_VARS_CACHE.clear()
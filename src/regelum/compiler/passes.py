@@ -1,24 +1,37 @@
+from array import array
 from collections import defaultdict
-from typing import List, Dict, Set, Any, Optional
+from itertools import chain
+from typing import Callable, List, Dict, Any, Optional, Sequence
 
-from regelum.ir.graph import IRGraph, IRReaction
-from regelum.compiler.pipeline import Pass, DiagnosticSink
-from regelum.core.ternary import V3, Presence
+import numpy as np
+
+from regelum.ir.graph import IRGraph, IRNode, IRReaction, IRVariable, KIND_PORT, KIND_REACTION, KIND_VAR, _digest, scope_reads
+from regelum.compiler.pipeline import CachedPass, DiagnosticSink
+from regelum.core.ternary import V3, P_BOTTOM, P_ABSENT, P_PRESENT
 from regelum.core.interpreter import eval_expr_3val
-from regelum.core.dsl import Expr, Var, If, BinOp, Cmp, Delay
+from regelum.core.dsl import Expr
+from regelum.compiler import _causality_jit as jit
+from regelum.compiler import _causality_native as native
+from regelum.compiler.expr_utils import expr_vars, reads_only_vars
 
 
-class StructuralPass(Pass):
+class StructuralPass(CachedPass):
     name = "StructuralPass"
-
-    def run(self, ir: IRGraph, diag: DiagnosticSink) -> None:
-        connected_dsts = set()
-        dst_counts = defaultdict(int)
-
-        for edge in ir.edges:
-            key = (edge.dst_node, edge.dst_port)
-            connected_dsts.add(key)
-            dst_counts[key] += 1
+    is_local = True
+    readonly = True
+
+    def fingerprint(self, ir: IRGraph) -> str:
+        return _digest((
+            [
+                (node_id, list(node.inputs), [name for name, meta in node.input_meta.items() if meta.has_default])
+                for node_id, node in ir.nodes.items()
+            ],
+            [(edge.dst_node, edge.dst_port) for edge in ir.edges],
+        ))
+
+    def analyze(self, ir: IRGraph, diag: DiagnosticSink) -> None:
+        dst_counts = ir.edge_index.dst_counts
+        connected_dsts = dst_counts.keys()
 
         for (node_id, port_name), count in dst_counts.items():
             if count > 1:
@@ -44,10 +57,17 @@ class StructuralPass(Pass):
                         )
 
 
-class TypeCheckPass(Pass):
+class TypeCheckPass(CachedPass):
     name = "TypeCheckPass"
+    readonly = True
+
+    def fingerprint(self, ir: IRGraph) -> str:
+        return _digest((
+            [(node_id, node.inputs, node.outputs) for node_id, node in ir.nodes.items()],
+            [(edge.src_node, edge.src_port, edge.dst_node, edge.dst_port) for edge in ir.edges],
+        ))
 
-    def run(self, ir: IRGraph, diag: DiagnosticSink) -> None:
+    def analyze(self, ir: IRGraph, diag: DiagnosticSink) -> None:
         for edge in ir.edges:
             src_node = ir.nodes.get(edge.src_node)
             dst_node = ir.nodes.get(edge.dst_node)
@@ -69,476 +89,629 @@ class TypeCheckPass(Pass):
                 )
 
 
-class ContinuousPass(Pass):
-    name = "ContinuousPass"
-
-    def run(self, ir: IRGraph, diag: DiagnosticSink) -> None:
-        for node in ir.nodes.values():
-            if node.kind != "Continuous":
-                continue
-            # Require dt input with default > 0 to avoid zero-time integration.
-            dt_meta = node.input_meta.get("dt")
-            if not dt_meta or not dt_meta.has_default:
-                diag.error(
-                    "CT001",
-                    f"Continuous node '{node.id}' must have input 'dt' with a positive default",
-                    location=str(node.id),
-                )
-                continue
-            if dt_meta.default_value is None or dt_meta.default_value <= 0:
-                diag.error(
-                    "CT002",
-                    f"Continuous node '{node.id}' has non-positive dt default: {dt_meta.default_value}",
-                    location=str(node.id),
-                )
-            # Check standard port names
-            if "state" not in node.outputs or "y" not in node.outputs:
-                diag.warning(
-                    "CT003",
-                    f"Continuous node '{node.id}' should expose 'state' and 'y' outputs",
-                    location=str(node.id),
-                )
-
-
-class WriteConflictPass(Pass):
+def _check_continuous_node(node: IRNode, diag: DiagnosticSink) -> None:
+    if node.kind != "Continuous":
+        return
+    # Require dt input with default > 0 to avoid zero-time integration.
+    dt_meta = node.input_meta.get("dt")
+    if not dt_meta or not dt_meta.has_default:
+        diag.error(
+            "CT001",
+            f"Continuous node '{node.id}' must have input 'dt' with a positive default",
+            location=str(node.id),
+        )
+        return
+    if dt_meta.default_value is None or dt_meta.default_value <= 0:
+        diag.error(
+            "CT002",
+            f"Continuous node '{node.id}' has non-positive dt default: {dt_meta.default_value}",
+            location=str(node.id),
+        )
+    # Check standard port names
+    if "state" not in node.outputs or "y" not in node.outputs:
+        diag.warning(
+            "CT003",
+            f"Continuous node '{node.id}' should expose 'state' and 'y' outputs",
+            location=str(node.id),
+        )
+
+
+class WriteConflictPass(CachedPass):
     name = "WriteConflictPass"
+    readonly = True
+
+    def fingerprint(self, ir: IRGraph) -> str:
+        return _digest((
+            [(node_id, [(r.id, r.writes_vars_set) for r in node.reactions]) for node_id, node in ir.nodes.items()],
+            {name: var.policy for name, var in ir.variables.items()},
+            ir.config.get("mode"),
+        ))
 
-    def run(self, ir: IRGraph, diag: DiagnosticSink) -> None:
+    def analyze(self, ir: IRGraph, diag: DiagnosticSink) -> None:
         strict = ir.config.get("mode") == "strict"
-        writers = defaultdict(list)
+        # First writer is stored as a bare tuple; only a second writer promotes it to a list.
+        writers: Dict[str, Any] = {}
+        writers_get = writers.get
 
         for node_id, node in ir.nodes.items():
             for r in node.reactions:
-                for var_name in r.writes_vars:
-                    writers[var_name].append((node_id, r.id))
+                writes = r.writes_vars_set
+                if not writes:
+                    continue
+                writer = (node_id, r.id)
+                for var_name in writes:
+                    prev = writers_get(var_name)
+                    if prev is None:
+                        writers[var_name] = writer
+                    elif type(prev) is tuple:
+                        writers[var_name] = [prev, writer]
+                    else:
+                        prev.append(writer)
 
+        variables = ir.variables
         for var_name, writer_list in writers.items():
-            if len(writer_list) > 1:
-                policy = "LWWPolicy"
-                if var_name in ir.variables:
-                    policy = ir.variables[var_name].policy
+            if type(writer_list) is list:
+                var = variables.get(var_name)
+                policy = var.policy if var is not None else "LWWPolicy"
 
                 if policy == "ErrorPolicy":
-                    diag.error(
+                    diag.error_lazy(
                         "WRITE001",
-                        f"Multiple writers for variable '{var_name}' with ErrorPolicy: {writer_list}",
+                        "Multiple writers for variable '{}' with ErrorPolicy: {}",
+                        var_name,
+                        writer_list,
                         location=str(var_name),
                     )
                 elif policy == "LWWPolicy":
-                    msg = f"Multiple writers for variable '{var_name}' with LWWPolicy. Determinism depends on schedule."
+                    msg = "Multiple writers for variable '{}' with LWWPolicy. Determinism depends on schedule."
                     if strict:
-                        diag.error(
+                        diag.error_lazy(
                             "WRITE002",
                             msg + " Strict mode requires explicit policy or single writer.",
+                            var_name,
                             location=str(var_name),
                         )
                     else:
-                        diag.warning("WRITE002", msg, location=str(var_name))
-
-
-class CausalityPass(Pass):
+                        diag.warning_lazy("WRITE002", msg, var_name, location=str(var_name))
+
+
+class _IdTable:
+    """
+    Interns causality-graph vertices as dense ints.
+    Keys are (kind, owner, member): (R, node, reaction), (P, node, port) or (V, variable, None).
+    Readable names are only formatted for diagnostics; `kinds` mirrors each key's kind
+    in a flat byte array so kind tests are a single index, and `reactions` holds the
+    IRReaction behind each reaction vertex (None for ports and variables).
+    """
+
+    __slots__ = ("ids", "keys", "kinds", "reactions")
+
+    def __init__(self) -> None:
+        self.ids: Dict[tuple, int] = {}
+        self.keys: List[tuple] = []
+        self.kinds = bytearray()
+        self.reactions: List[Optional[IRReaction]] = []
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def intern(
+        self, kind: int, owner: str, member: Optional[str] = None, reaction: Optional[IRReaction] = None
+    ) -> int:
+        key = (kind, owner, member)
+        i = self.ids.get(key)
+        if i is None:
+            i = len(self.keys)
+            self.ids[key] = i
+            self.keys.append(key)
+            self.kinds.append(kind)
+            self.reactions.append(reaction)
+        elif reaction is not None:
+            self.reactions[i] = reaction
+        return i
+
+    def get(self, kind: int, owner: str, member: Optional[str] = None) -> Optional[int]:
+        return self.ids.get((kind, owner, member))
+
+    def kind(self, i: int) -> int:
+        return self.kinds[i]
+
+    def name(self, i: int) -> str:
+        kind, owner, member = self.keys[i]
+        if kind == KIND_REACTION:
+            return f"R:{owner}:{member}"
+        if kind == KIND_PORT:
+            return f"P:{owner}.{member}"
+        return f"V:{owner}"
+
+    def names(self, group: List[int]) -> List[str]:
+        return [self.name(i) for i in group]
+
+
+class _CSR:
+    """
+    Forward adjacency in compressed sparse row form over dense vertex ids:
+    successors of v are neighbors[offsets[v]:offsets[v + 1]].
+    """
+
+    __slots__ = ("offsets", "neighbors")
+
+    def __init__(self, offsets: array, neighbors: array) -> None:
+        self.offsets = offsets
+        self.neighbors = neighbors
+
+    @classmethod
+    def from_arcs(cls, n: int, arcs: List[tuple[int, int]]) -> "_CSR":
+        degree = [0] * (n + 1)
+        for u, _ in arcs:
+            degree[u + 1] += 1
+        for v in range(n):
+            degree[v + 1] += degree[v]
+        offsets = array("i", degree)
+        cursor = degree[:-1]
+        neighbors = array("i", bytes(4 * len(arcs)))
+        for u, v in arcs:
+            neighbors[cursor[u]] = v
+            cursor[u] += 1
+        return cls(offsets, neighbors)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, v: int) -> array:
+        offsets = self.offsets
+        return self.neighbors[offsets[v]:offsets[v + 1]]
+
+    def as_numpy(self) -> tuple[np.ndarray, np.ndarray]:
+        """Zero-copy int32 views of (offsets, neighbors) for array kernels."""
+        return np.frombuffer(self.offsets, dtype=np.int32), np.frombuffer(self.neighbors, dtype=np.int32)
+
+
+class _NameList:
+    """
+    Formats a vertex group as its list of readable names only when rendered; `single`
+    renders a one-vertex group as the bare name.
+    """
+
+    __slots__ = ("ids", "group", "single")
+
+    def __init__(self, ids: _IdTable, group: List[int], single: bool = False) -> None:
+        self.ids = ids
+        self.group = group
+        self.single = single
+
+    def __str__(self) -> str:
+        if self.single:
+            return self.ids.name(self.group[0])
+        return str(self.ids.names(self.group))
+
+
+class CausalityPass(CachedPass):
     name = "CausalityPass"
 
-    def run(self, ir: IRGraph, diag: DiagnosticSink) -> None:
-        adj = defaultdict(list)
-        nodes = set()
-        reaction_map: Dict[str, IRReaction] = {}
+    def analyze(self, ir: IRGraph, diag: DiagnosticSink) -> None:
+        ids = _IdTable()
+        arcs: List[tuple[int, int]] = []
 
-        port_direction = {}
-        for edge in ir.edges:
-            port_direction[(edge.src_node, edge.src_port)] = "out"
-            port_direction[(edge.dst_node, edge.dst_port)] = "in"
+        edge_index = ir.edge_index
+        ports_in = edge_index.ports_in_by_node
+        ports_out = edge_index.ports_out_by_node
 
         for node_id, node in ir.nodes.items():
             if node.kind in ("Ext", "Raw", "Continuous"):
                 if not node.reactions:
                     continue
                 r = node.reactions[0]
-                rid = f"R:{node_id}:{r.id}"
-                nodes.add(rid)
-                reaction_map[rid] = r
+                rid = ids.intern(KIND_REACTION, node_id, r.id, r)
 
                 no_loop = bool(r.contract and r.contract.no_instant_loop)
 
-                known_inputs = set(node.inputs.keys())
-                known_outputs = set(node.outputs.keys())
-
-                for (nid, pname), direction in port_direction.items():
-                    if nid == node_id:
-                        if direction == "in":
-                            known_inputs.add(pname)
-                        elif direction == "out":
-                            known_outputs.add(pname)
-
-                for inp in known_inputs:
-                    pid = f"P:{node_id}.{inp}"
-                    nodes.add(pid)
+                # Declared ports plus any extra ones only the edges mention; membership is
+                # tested on the node's own port dicts instead of building merged sets.
+                declared_in = node.inputs
+                for inp in chain(declared_in, (p for p in ports_in.get(node_id, ()) if p not in declared_in)):
+                    pid = ids.intern(KIND_PORT, node_id, inp)
                     if not no_loop:
-                        adj[pid].append(rid)
+                        arcs.append((pid, rid))
 
-                for outp in known_outputs:
-                    pid = f"P:{node_id}.{outp}"
-                    nodes.add(pid)
-                    adj[rid].append(pid)
+                declared_out = node.outputs
+                for outp in chain(declared_out, (p for p in ports_out.get(node_id, ()) if p not in declared_out)):
+                    pid = ids.intern(KIND_PORT, node_id, outp)
+                    arcs.append((rid, pid))
             else:
                 for r in node.reactions:
-                    rid = f"R:{node_id}:{r.id}"
-                    nodes.add(rid)
-                    reaction_map[rid] = r
+                    rid = ids.intern(KIND_REACTION, node_id, r.id, r)
 
                     no_loop = bool(r.contract and r.contract.no_instant_loop)
 
-                    for v in r.reads_vars:
-                        is_delay = False
-                        if v in ir.variables:
-                            vid = f"V:{v}"
-                            var_meta = ir.variables[v]
-                            is_delay = bool(getattr(var_meta, "is_delay_buffer", False))
-                        else:
-                            vid = f"P:{node_id}.{v}"
-                        nodes.add(vid)
+                    scoped_reads = r.scoped_reads
+                    if scoped_reads is None:
+                        scoped_reads = scope_reads(node_id, r.reads_vars, ir.variables)
+                    for kind, owner, member, is_delay in scoped_reads:
+                        vid = ids.intern(kind, owner, member)
                         if not no_loop and not is_delay:
-                            adj[vid].append(rid)
+                            arcs.append((vid, rid))
 
                     for v in r.writes_vars:
-                        vid = f"V:{v}"
-                        nodes.add(vid)
-                        adj[rid].append(vid)
+                        vid = ids.intern(KIND_VAR, v)
+                        arcs.append((rid, vid))
 
                     if r.output_port:
                         if not r.has_delay_output:
-                            oid = f"P:{node_id}.{r.output_port}"
-                            nodes.add(oid)
-                            adj[rid].append(oid)
+                            oid = ids.intern(KIND_PORT, node_id, r.output_port)
+                            arcs.append((rid, oid))
 
-        delay_ports = set()
-        for node_id, node in ir.nodes.items():
-            for r in node.reactions:
-                if r.has_delay_output and r.output_port:
-                    delay_ports.add((node_id, r.output_port))
+        delay_ports = edge_index.delay_ports
+        for src, dsts in edge_index.adj_fwd.items():
+            if src in delay_ports:
+                continue
+            src_p = ids.get(KIND_PORT, *src)
+            if src_p is None:
+                continue
+            for dst in dsts:
+                dst_p = ids.get(KIND_PORT, *dst)
+                if dst_p is not None:
+                    arcs.append((src_p, dst_p))
 
-        for edge in ir.edges:
-            src_p = f"P:{edge.src_node}.{edge.src_port}"
-            dst_p = f"P:{edge.dst_node}.{edge.dst_port}"
-
-            if src_p in nodes and dst_p in nodes:
-                if (edge.src_node, edge.src_port) not in delay_ports:
-                    adj[src_p].append(dst_p)
-
-        sccs = self._tarjan(list(nodes), adj)
-
-        for scc in sccs:
-            if len(scc) > 1:
-                r_nodes = [n for n in scc if n.startswith("R:")]
-
-                is_core = True
-                for rn in r_nodes:
-                    _, nid, _ = rn.split(":", 2)
-                    if ir.nodes[nid].kind != "Core":
-                        is_core = False
-                        break
-
-                if not is_core:
-                    diag.error("CAUS001", f"Algebraic cycle involving non-Core nodes: {scc}", location="SCC")
-                else:
-                    bad_vars = self._non_monotone_vars(scc, ir)
-                    if bad_vars:
-                        diag.error(
-                            "CAUS004",
-                            f"Cycle requires non-monotone state(s): {bad_vars}. Use Delay or monotone policy.",
-                            location="SCC",
-                        )
-                        continue
-                    ranks_present = any(reaction_map[rn].nonzeno_rank for rn in r_nodes if rn in reaction_map)
-                    if ranks_present:
-                        continue
-                    if not self._check_constructive(scc, reaction_map, ir):
-                        diag.error("CAUS003", f"Non-constructive cycle detected: {scc}", location="SCC")
-
-            elif len(scc) == 1:
-                elem = scc[0]
-                if elem in adj[elem]:
-                    if elem.startswith("R:"):
-                        _, nid, _ = elem.split(":", 2)
-                        if ir.nodes[nid].kind == "Core":
-                            bad_vars = self._non_monotone_vars([elem], ir)
-                            if bad_vars:
-                                diag.error(
-                                    "CAUS004",
-                                    f"Self-loop touches non-monotone state(s): {bad_vars}",
-                                    location=elem,
-                                )
-                                continue
-                            reaction = reaction_map.get(elem)
-                            if reaction and reaction.nonzeno_rank:
-                                continue
-                            if not self._check_constructive([elem], reaction_map, ir):
-                                diag.error("CAUS003", f"Non-constructive self-loop: {elem}", location="SCC")
-                        else:
-                            diag.error("CAUS002", f"Self-loop detected: {elem}", location=elem)
-
-    def _collect_vars(self, expr: Expr[Any]) -> Set[str]:
-        vars_: Set[str] = set()
-        if isinstance(expr, Var):
-            vars_.add(expr.name)
-        elif isinstance(expr, If):
-            vars_.update(self._collect_vars(expr.cond))
-            vars_.update(self._collect_vars(expr.then_))
-            vars_.update(self._collect_vars(expr.else_))
-        elif isinstance(expr, BinOp):
-            vars_.update(self._collect_vars(expr.left))
-            vars_.update(self._collect_vars(expr.right))
-        elif isinstance(expr, Cmp):
-            vars_.update(self._collect_vars(expr.left))
-            vars_.update(self._collect_vars(expr.right))
-        elif isinstance(expr, Delay):
-            pass
-        return vars_
-
-    def _tarjan(self, vertices: List[str], adj: Dict[str, List[str]]) -> List[List[str]]:
-        index = {}
-        lowlink = {}
-        stack = []
-        on_stack = set()
-        sccs = []
-        idx = 0
-
-        def strongconnect(v):
-            nonlocal idx
-            index[v] = idx
-            lowlink[v] = idx
-            idx += 1
-            stack.append(v)
-            on_stack.add(v)
-
-            for w in adj[v]:
-                if w not in index:
-                    strongconnect(w)
-                    lowlink[v] = min(lowlink[v], lowlink[w])
-                elif w in on_stack:
-                    lowlink[v] = min(lowlink[v], index[w])
-
-            if lowlink[v] == index[v]:
-                scc = []
-                while True:
-                    w = stack.pop()
-                    on_stack.remove(w)
-                    scc.append(w)
-                    if w == v:
-                        break
-                sccs.append(scc)
-
-        for v in vertices:
-            if v not in index:
-                strongconnect(v)
-        return sccs
+        adj = _CSR.from_arcs(len(ids), arcs)
+
+        residual = self._cyclic_residual(adj)
+        if not residual:
+            # Kahn discharged every vertex: a DAG has no cycles or self-loops to diagnose.
+            return
+        # Downstream tails of the cycles only produce singleton SCCs without self-loops.
+        residual = native.trim_sinks(residual, adj.offsets, adj.neighbors)
+        # SCCs are diagnosed as the search closes them; no list of all SCCs is kept.
+        # Singletons without a self-loop (bridges between cycles) have nothing to report.
+        self._tarjan(
+            residual, adj, on_scc=lambda scc: self._diagnose_scc(scc, adj, ir, ids, diag), skip_trivial=True
+        )
+
+    def _diagnose_scc(self, scc: List[int], adj: _CSR, ir: IRGraph, ids: _IdTable, diag: DiagnosticSink) -> None:
+        if len(scc) > 1:
+            kinds = ids.kinds
+            r_nodes = [n for n in scc if kinds[n] == KIND_REACTION]
+
+            is_core = True
+            for rn in r_nodes:
+                nid = ids.keys[rn][1]
+                if ir.nodes[nid].kind != "Core":
+                    is_core = False
+                    break
+
+            if not is_core:
+                diag.error_lazy("CAUS001", "Algebraic cycle involving non-Core nodes: {}", _NameList(ids, scc), location="SCC")
+            else:
+                bad_vars = self._non_monotone_vars(scc, ir, ids)
+                if bad_vars:
+                    diag.error_lazy(
+                        "CAUS004",
+                        "Cycle requires non-monotone state(s): {}. Use Delay or monotone policy.",
+                        bad_vars,
+                        location="SCC",
+                    )
+                    return
+                reactions = ids.reactions
+                ranks_present = any(reactions[rn].nonzeno_rank for rn in r_nodes)
+                if ranks_present:
+                    return
+                if not self._check_constructive(scc, ir, ids):
+                    diag.error_lazy("CAUS003", "Non-constructive cycle detected: {}", _NameList(ids, scc), location="SCC")
+
+        elif len(scc) == 1:
+            elem = scc[0]
+            if elem in adj[elem]:
+                if ids.kinds[elem] == KIND_REACTION:
+                    nid = ids.keys[elem][1]
+                    if ir.nodes[nid].kind == "Core":
+                        bad_vars = self._non_monotone_vars([elem], ir, ids)
+                        if bad_vars:
+                            diag.error_lazy(
+                                "CAUS004",
+                                "Self-loop touches non-monotone state(s): {}",
+                                bad_vars,
+                                location=ids.name(elem),
+                            )
+                            return
+                        if ids.reactions[elem].nonzeno_rank:
+                            return
+                        if not self._check_constructive([elem], ir, ids):
+                            diag.error_lazy("CAUS003", "Non-constructive self-loop: {}", _NameList(ids, [elem], single=True), location="SCC")
+                    else:
+                        elem_name = ids.name(elem)
+                        diag.error_lazy("CAUS002", "Self-loop detected: {}", elem_name, location=elem_name)
+
+    def _vars_of(self, expr: Expr[Any]) -> frozenset[str]:
+        return expr_vars(expr)
+
+    @staticmethod
+    def _cyclic_residual(adj: _CSR) -> List[int]:
+        return native.cyclic_residual(adj.offsets, adj.neighbors)
+
+    def _tarjan(
+        self,
+        vertices: List[int],
+        adj: Sequence[Sequence[int]],
+        on_scc: Optional[Callable[[List[int]], None]] = None,
+        skip_trivial: bool = False,
+    ) -> List[List[int]]:
+        """
+        SCCs in reverse topological order; with `on_scc`, each is handed over as it closes
+        instead. `skip_trivial` leaves out singletons that have no self-loop.
+        """
+        if not isinstance(adj, _CSR):
+            adj = _CSR.from_arcs(len(adj), [(v, w) for v in range(len(adj)) for w in adj[v]])
+        if jit.tarjan is not None and len(vertices) >= jit.JIT_MIN_VERTICES:
+            sccs = jit.tarjan(vertices, *adj.as_numpy())
+            if skip_trivial:
+                sccs = [scc for scc in sccs if len(scc) > 1 or scc[0] in adj[scc[0]]]
+            if on_scc is None:
+                return sccs
+            for scc in sccs:
+                on_scc(scc)
+            return []
+        return native.tarjan(vertices, adj.offsets, adj.neighbors, on_scc, skip_trivial)
 
     @staticmethod
     def _join_values(old: V3[Any], new: V3[Any]) -> tuple[V3[Any], bool, bool]:
-        if new.presence == Presence.BOTTOM:
+        new_code = new.code
+        if new_code == P_BOTTOM:
             return old, False, False
 
-        if old.presence == Presence.BOTTOM:
+        old_code = old.code
+        if old_code == P_BOTTOM:
             return new, True, False
 
-        if old.presence == Presence.ABSENT:
-            if new.presence == Presence.ABSENT:
-                return old, False, False
-            if new.presence == Presence.PRESENT:
+        if old_code == P_ABSENT:
+            if new_code == P_PRESENT:
                 return new, True, False
             return old, False, False
 
-        if old.presence == Presence.PRESENT:
-            if new.presence == Presence.ABSENT:
-                return old, False, False
-            if new.presence == Presence.PRESENT:
+        if old_code == P_PRESENT:
+            if new_code == P_PRESENT:
                 if old.value == new.value:
                     return old, False, False
                 return new, True, False
 
         return old, False, False
 
-    def _check_constructive(self, scc: List[str], reaction_map: Dict[str, IRReaction], ir: IRGraph) -> bool:
-        scc_vars = {n for n in scc if n.startswith("V:") or n.startswith("P:")}
-        scc_reactions = [n for n in scc if n.startswith("R:")]
+    def _check_constructive(self, scc: List[int], ir: IRGraph, ids: _IdTable) -> bool:
+        kinds = ids.kinds
+        scc_vars = frozenset(n for n in scc if kinds[n] != KIND_REACTION)
+        scc_reactions = [n for n in scc if kinds[n] == KIND_REACTION]
 
-        env: Dict[str, V3[Any]] = {}
-        for name in scc_vars:
-            env[name] = self._baseline_value(name, ir)
+        env: Dict[int, V3[Any]] = {}
+        for n in scc_vars:
+            env[n] = self._baseline_value(ids.keys[n], ir)
 
         height_budget = 0
-        for name in scc_vars:
-            if name.startswith("V:"):
-                var_name = name.split(":", 1)[1]
+        for n in scc_vars:
+            kind, var_name, _ = ids.keys[n]
+            if kind == KIND_VAR:
                 var_meta = ir.variables.get(var_name)
                 if var_meta and var_meta.height_bound is not None:
                     height_budget += var_meta.height_bound
 
-        ITER_LIMIT = (height_budget + 1) if height_budget > 0 else 20
-        converged = False
-        for _ in range(ITER_LIMIT):
-            changed_any = False
-            current_env = env.copy()
-
-            for rid in scc_reactions:
-                r = reaction_map[rid]
-                _, nid, _ = rid.split(":", 2)
-
-                for global_var, expr in r.explicit_writes.items():
-                    local_env = {}
-                    ast_vars = self._collect_vars(expr)
-                    for v in ast_vars:
+        # Binding plans depend only on the SCC and the IR, so they are built once:
+        # (target, expr, scc_bindings, baseline_env). In-SCC names are read from the
+        # previous iterate by int id; everything else is a constant baseline.
+        plans: List[tuple[int, Expr[Any], List[tuple[str, int]], Dict[str, V3[Any]]]] = []
+        variables = ir.variables
+        for rid in scc_reactions:
+            r = ids.reactions[rid]
+            nid = ids.keys[rid][1]
+            targets: List[tuple[int, Expr[Any]]] = [
+                (ids.intern(KIND_VAR, global_var), expr) for global_var, expr in r.explicit_writes.items()
+            ]
+            if r.output_port and r.ast is not None:
+                targets.append((ids.intern(KIND_PORT, nid, r.output_port), r.ast))
+
+            # Local name -> (scoped id in the SCC, or None with its baseline), resolved once per
+            # reaction and shared by its output and explicit-write expressions.
+            scoping: Dict[str, tuple[Optional[int], Optional[V3[Any]]]] = {}
+            for target, expr in targets:
+                bindings: List[tuple[str, int]] = []
+                baseline_env: Dict[str, V3[Any]] = {}
+                for v in self._vars_of(expr):
+                    resolved = scoping.get(v)
+                    if resolved is None:
                         global_candidate = f"{nid}.{v}"
-
-                        if global_candidate in ir.variables:
-                            scoped_name = f"V:{global_candidate}"
+                        if global_candidate in variables:
+                            key = (KIND_VAR, global_candidate, None)
                         else:
-                            scoped_name = f"P:{global_candidate}"
-
-                        if scoped_name in scc_vars:
-                            local_env[v] = current_env.get(scoped_name, V3.bottom())
-                        else:
-                            local_env[v] = self._baseline_value(scoped_name, ir)
-
-                    val = eval_expr_3val(expr, local_env)
-                    var_key = f"V:{global_var}"
-                    old_val = env.get(var_key, V3.bottom())
-
-                    merged, changed, conflict = self._join_values(old_val, val)
-                    if conflict:
-                        return False
-                    if changed:
-                        env[var_key] = merged
-                        changed_any = True
-
-                if r.output_port and r.ast is not None:
-                    local_env = {}
-                    ast_vars = self._collect_vars(r.ast)
-                    for v in ast_vars:
-                        global_candidate = f"{nid}.{v}"
-                        if global_candidate in ir.variables:
-                            scoped_name = f"V:{global_candidate}"
+                            key = (KIND_PORT, nid, v)
+                        scoped = ids.ids.get(key)
+                        if scoped in scc_vars:
+                            resolved = (scoped, None)
                         else:
-                            scoped_name = f"P:{global_candidate}"
+                            resolved = (None, self._baseline_value(key, ir))
+                        scoping[v] = resolved
 
-                        if scoped_name in scc_vars:
-                            local_env[v] = current_env.get(scoped_name, V3.bottom())
-                        else:
-                            local_env[v] = self._baseline_value(scoped_name, ir)
-
-                    val = eval_expr_3val(r.ast, local_env)
-                    out_key = f"P:{nid}.{r.output_port}"
-                    old_val = env.get(out_key, V3.bottom())
-
-                    merged, changed, conflict = self._join_values(old_val, val)
-                    if conflict:
-                        return False
-                    if changed:
-                        env[out_key] = merged
-                        changed_any = True
-
-            for edge in ir.edges:
-                src_p = f"P:{edge.src_node}.{edge.src_port}"
-                dst_p = f"P:{edge.dst_node}.{edge.dst_port}"
-
-                if src_p in scc_vars and dst_p in scc_vars:
-                    val = env.get(src_p, V3.bottom())
-                    old_val = env.get(dst_p, V3.bottom())
-                    merged, changed, conflict = self._join_values(old_val, val)
-                    if conflict:
-                        return False
-                    if changed:
-                        env[dst_p] = merged
-                        changed_any = True
-
-            if not changed_any:
-                converged = True
-                break
-
-        if not converged:
+                    scoped, baseline = resolved
+                    if scoped is not None:
+                        bindings.append((v, scoped))
+                    else:
+                        baseline_env[v] = baseline
+                plans.append((target, expr, bindings, baseline_env))
+
+        # Forwarding edges inside the SCC, materialized once from its own ports (in SCC
+        # order, already deterministic) rather than from a scan of every edge in the graph.
+        scc_edges: List[tuple[int, int]] = []
+        adj_fwd = ir.edge_index.adj_fwd
+        port_ids = ids.ids
+        for src_p in scc:
+            if kinds[src_p] != KIND_PORT:
+                continue
+            _, owner, member = ids.keys[src_p]
+            for dst_node, dst_port in adj_fwd.get((owner, member), ()):
+                dst_p = port_ids.get((KIND_PORT, dst_node, dst_port))
+                if dst_p in scc_vars:
+                    scc_edges.append((src_p, dst_p))
+
+        # Gauss-Seidel worklist over units (plans, then SCC edges): a unit is re-evaluated
+        # only when a vertex it reads changed. Each unit writes exactly one vertex.
+        units: List[tuple[int, Optional[Expr[Any]], List[tuple[str, int]], Any]] = list(plans)
+        for src_p, dst_p in scc_edges:
+            units.append((dst_p, None, [], src_p))
+
+        consumers: Dict[int, List[int]] = defaultdict(list)
+        for ui, (_, expr, bindings, payload) in enumerate(units):
+            if expr is None:
+                consumers[payload].append(ui)
+            else:
+                for _, scoped in bindings:
+                    consumers[scoped].append(ui)
+
+        # Reachability pre-filter. A vertex can only leave BOTTOM if it starts non-BOTTOM, or
+        # a unit writing it has a constant leaf or a non-BOTTOM baseline read, or reads a
+        # vertex that can. If some SCC vertex is unreachable from every such source it stays
+        # BOTTOM, which already decides the check without running the fixpoint.
+        informed = {n for n in scc_vars if env[n].code != P_BOTTOM}
+        for target, expr, _, baseline_env in plans:
+            if not reads_only_vars(expr) or any(v.code != P_BOTTOM for v in baseline_env.values()):
+                informed.add(target)
+        frontier = list(informed)
+        while frontier:
+            for ui in consumers.get(frontier.pop(), ()):
+                target = units[ui][0]
+                if target not in informed:
+                    informed.add(target)
+                    frontier.append(target)
+        if not scc_vars <= informed:
+            return False
+
+        bottom = V3.bottom()
+
+        def evaluate(ui: int) -> V3[Any]:
+            _, expr, bindings, payload = units[ui]
+            if expr is None:
+                return env.get(payload, bottom)
+            # Binding names never collide with baseline names, so each unit's baseline dict
+            # doubles as its evaluation buffer: only the binding slots are refreshed, no copy.
+            for v, scoped in bindings:
+                payload[v] = env.get(scoped, bottom)
+            return eval_expr_3val(expr, payload)
+
+        ITER_LIMIT = (height_budget + 1) if height_budget > 0 else 20
+        targets = [unit[0] for unit in units]
+        if not native.run_worklist(
+            targets, dict(consumers), evaluate, self._join_values, env, bottom, ITER_LIMIT * len(units)
+        ):
             return False
         for v in scc_vars:
-            if env.get(v, V3.bottom()).presence == Presence.BOTTOM:
+            if env.get(v, V3.bottom()).code == P_BOTTOM:
                 return False
 
         return True
 
-    def _baseline_value(self, scoped_name: str, ir: IRGraph) -> V3[Any]:
-        if scoped_name.startswith("V:"):
-            name = scoped_name.split(":", 1)[1]
-            var = ir.variables.get(name)
+    def _baseline_value(self, key: tuple, ir: IRGraph) -> V3[Any]:
+        kind, owner, member = key
+        if kind == KIND_VAR:
+            var = ir.variables.get(owner)
             if var is None:
                 return V3.bottom()
             if var.has_init:
                 return V3.present(var.init_value)
             return V3.bottom()
 
-        if not scoped_name.startswith("P:"):
+        if kind != KIND_PORT:
             return V3.bottom()
 
-        rest = scoped_name.split(":", 1)[1]
-        if "." not in rest:
-            return V3.bottom()
-        node_id, port_name = rest.split(".", 1)
-        node = ir.nodes.get(node_id)
+        node = ir.nodes.get(owner)
         if node is None:
             return V3.bottom()
 
-        if port_name in node.input_meta:
-            meta = node.input_meta[port_name]
+        if member in node.input_meta:
+            meta = node.input_meta[member]
             if meta.has_default:
                 return V3.present(meta.default_value)
             return V3.absent()
 
         return V3.absent()
 
-    def _non_monotone_vars(self, scc: List[str], ir: IRGraph) -> List[str]:
+    def _non_monotone_vars(self, scc: List[int], ir: IRGraph, ids: _IdTable) -> List[str]:
         bad: List[str] = []
-        for node in scc:
-            if node.startswith("V:"):
-                name = node.split(":", 1)[1]
+        for n in scc:
+            kind, name, _ = ids.keys[n]
+            if kind == KIND_VAR:
                 var = ir.variables.get(name)
                 if var and not var.is_monotone:
                     bad.append(name)
         return bad
 
 
-class InitPass(Pass):
-    name = "InitPass"
+def _check_init_var(name: str, var: IRVariable, diag: DiagnosticSink) -> None:
+    if not var.has_init:
+        diag.error("INIT001", f"Variable '{name}' has no initial value", location=name)
+    if var.is_delay_buffer and not var.has_init:
+        diag.error(
+            "INIT002",
+            f"Delay-backed variable '{name}' must have an explicit default/init value.",
+            location=name,
+        )
 
-    def run(self, ir: IRGraph, diag: DiagnosticSink) -> None:
-        strict = ir.config.get("mode") == "strict"
-        if not strict:
-            return
 
-        for name, var in ir.variables.items():
-            if not var.has_init:
-                diag.error("INIT001", f"Variable '{name}' has no initial value", location=name)
-            if var.is_delay_buffer and not var.has_init:
-                diag.error(
-                    "INIT002",
-                    f"Delay-backed variable '{name}' must have an explicit default/init value.",
-                    location=name,
-                )
+def _check_nonzeno_node(node_id: str, node: IRNode, ir: IRGraph, diag: DiagnosticSink) -> None:
+    for reaction in node.reactions:
+        overlap = reaction.reads_vars_set & reaction.writes_vars_set
+        if not overlap or reaction.nonzeno_rank:
+            continue
+        overlap = {v for v in overlap if not getattr(ir.variables.get(v), "is_delay_buffer", False)}
+
+        if overlap:
+            diag.error(
+                "ZEN001",
+                f"Reaction '{node_id}.{reaction.id}' depends on {sorted(overlap)} without non-zeno rank.",
+                location=node_id,
+            )
+
+
+# Single-check passes for custom pipelines; the default pipeline runs all three checks
+# through FusedNodeLocalPass.
+class InitPass(CachedPass):
+    name = "InitPass"
+    readonly = True
+
+    def analyze(self, ir: IRGraph, diag: DiagnosticSink) -> None:
+        if ir.config.get("mode") == "strict":
+            for name, var in ir.variables.items():
+                _check_init_var(name, var, diag)
 
 
-class NonZenoPass(Pass):
+class NonZenoPass(CachedPass):
     name = "NonZenoPass"
+    is_local = True
+    readonly = True
 
-    def run(self, ir: IRGraph, diag: DiagnosticSink) -> None:
+    def analyze(self, ir: IRGraph, diag: DiagnosticSink) -> None:
         for node_id, node in ir.nodes.items():
-            for reaction in node.reactions:
-                overlap: Set[str] = set()
-                for var_name in reaction.reads_vars:
-                    if var_name in reaction.writes_vars:
-                        var_meta = ir.variables.get(var_name)
-                        if var_meta and getattr(var_meta, "is_delay_buffer", False):
-                            continue
-                        overlap.add(var_name)
-
-                if overlap and not reaction.nonzeno_rank:
-                    diag.error(
-                        "ZEN001",
-                        f"Reaction '{node_id}.{reaction.id}' depends on {sorted(overlap)} without non-zeno rank.",
-                        location=node_id,
-                    )
+            _check_nonzeno_node(node_id, node, ir, diag)
+
+
+class ContinuousPass(CachedPass):
+    name = "ContinuousPass"
+    is_local = True
+    readonly = True
+
+    def analyze(self, ir: IRGraph, diag: DiagnosticSink) -> None:
+        for node in ir.nodes.values():
+            _check_continuous_node(node, diag)
+
+
+class FusedNodeLocalPass(CachedPass):
+    """
+    InitPass, NonZenoPass and ContinuousPass in one walk: strict-mode init checks over
+    the variables, then the non-Zeno and continuous checks per node.
+    """
+
+    name = "FusedNodeLocalPass"
+    readonly = True
+
+    def analyze(self, ir: IRGraph, diag: DiagnosticSink) -> None:
+        if ir.config.get("mode") == "strict":
+            for name, var in ir.variables.items():
+                _check_init_var(name, var, diag)
+
+        for node_id, node in ir.nodes.items():
+            _check_nonzeno_node(node_id, node, ir, diag)
+            _check_continuous_node(node, diag)
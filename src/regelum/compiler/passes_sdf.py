@@ -5,6 +5,7 @@ from regelum.compiler.pipeline import Pass, DiagnosticSink
 
 class SDFPass(Pass):
     name = "SDFPass"
+    readonly = True
     
     def run(self, ir: IRGraph, diag: DiagnosticSink) -> None:
         # 1. Detect SDF nodes
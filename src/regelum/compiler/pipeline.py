@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional, Any, get_type_hints, Set
+from typing import Callable, Dict, List, Optional, Any, Sequence, Tuple, get_type_hints, Set
+from weakref import WeakKeyDictionary
 from enum import Enum
 from regelum.core.runtime import GraphRuntime
 from regelum.core.node import RawNode
@@ -8,14 +11,18 @@ from regelum.core.core_node import CoreNode
 from regelum.core.ext_node import ExtNode
 from regelum.core.hybrid_adapters import ContinuousWrapper
 from regelum.core.dsl import Expr, Var
-from regelum.ir.graph import IRGraph, IRNode, IRReaction, IREdge, IRVariable, IRPort
-from regelum.compiler.expr_utils import collect_expr_vars
+from regelum.ir.graph import IRGraph, IRNode, IRReaction, IREdge, IRVariable, IRPort, scope_reads
+from regelum.compiler.expr_utils import expr_vars
 
 class DiagnosticSeverity(Enum):
     ERROR = "ERROR"
     WARNING = "WARNING"
 
-@dataclass
+# Module-level aliases: one global load instead of a global plus an enum attribute.
+_SEV_ERROR = DiagnosticSeverity.ERROR
+_SEV_WARNING = DiagnosticSeverity.WARNING
+
+@dataclass(slots=True, frozen=True)
 class Diagnostic:
     severity: DiagnosticSeverity
     code: str
@@ -23,18 +30,87 @@ class Diagnostic:
     location: Optional[str] = None
 
 class DiagnosticSink:
-    def __init__(self):
-        self.diagnostics: List[Diagnostic] = []
+    """
+    Collects diagnostics. `error_lazy`/`warning_lazy` store (fmt, args) records that are
+    only formatted when `diagnostics` is read; severity checks never format.
+
+    With `max_diagnostics`, the sink saturates at that many records: further warnings are
+    only counted in `dropped`, errors are always kept.
+    """
+
+    def __init__(self, max_diagnostics: Optional[int] = None):
+        self._records: List[Any] = []  # Diagnostic or (severity, code, fmt, args, location)
+        self._append = self._records.append
+        self.max_diagnostics = max_diagnostics
+        self.dropped = 0
+
+    @property
+    def diagnostics(self) -> List[Diagnostic]:
+        records = self._records
+        for i, rec in enumerate(records):
+            if type(rec) is tuple:
+                severity, code, fmt, args, location = rec
+                records[i] = Diagnostic(severity, code, fmt.format(*args), location)
+        return records
+
+    @diagnostics.setter
+    def diagnostics(self, value: List[Diagnostic]) -> None:
+        self._records = value
+        self._append = value.append
+
+    @property
+    def saturated(self) -> bool:
+        cap = self.max_diagnostics
+        return cap is not None and len(self._records) >= cap
+
+    def merge(self, other: "DiagnosticSink") -> None:
+        """Append `other`'s records in order, keeping lazy ones unformatted."""
+        self.extend_records(other._records)
+        self.dropped += other.dropped
+
+    def extend_records(self, records: Sequence[Any]) -> None:
+        if self.max_diagnostics is None:
+            self._records.extend(records)
+            return
+        for rec in records:
+            severity = rec[0] if type(rec) is tuple else rec.severity
+            if severity is _SEV_ERROR or not self.saturated:
+                self._append(rec)
+            else:
+                self.dropped += 1
+
+    def has_errors(self) -> bool:
+        for rec in self._records:
+            severity = rec[0] if type(rec) is tuple else rec.severity
+            if severity is _SEV_ERROR:
+                return True
+        return False
 
     def error(self, code: str, message: str, location: Optional[str] = None):
-        self.diagnostics.append(Diagnostic(DiagnosticSeverity.ERROR, code, message, location))
+        self._append(Diagnostic(_SEV_ERROR, code, message, location))
 
     def warning(self, code: str, message: str, location: Optional[str] = None):
-        self.diagnostics.append(Diagnostic(DiagnosticSeverity.WARNING, code, message, location))
+        if self.max_diagnostics is not None and self.saturated:
+            self.dropped += 1
+            return
+        self._append(Diagnostic(_SEV_WARNING, code, message, location))
+
+    def error_lazy(self, code: str, fmt: str, *args: Any, location: Optional[str] = None):
+        self._append((_SEV_ERROR, code, fmt, args, location))
+
+    def warning_lazy(self, code: str, fmt: str, *args: Any, location: Optional[str] = None):
+        if self.max_diagnostics is not None and self.saturated:
+            self.dropped += 1
+            return
+        self._append((_SEV_WARNING, code, fmt, args, location))
 
 @dataclass
 class CompilerConfig:
     mode: str = "best_effort" 
+    max_workers: int = 1
+    # Warnings past this many diagnostics are counted, not stored; once the cap is hit and
+    # errors are present, the remaining passes are skipped.
+    max_diagnostics: Optional[int] = 1000
 
 @dataclass
 class CompileResult:
@@ -44,153 +120,285 @@ class CompileResult:
 
 class Pass(ABC):
     name: str
+    # Local passes only inspect each node together with its incoming edges, so they
+    # can run on node shards and their diagnostics concatenated.
+    is_local: bool = False
+    # Read-only passes never mutate the IR, so consecutive ones may run concurrently,
+    # each into its own sink.
+    readonly: bool = False
 
     @abstractmethod
     def run(self, ir: IRGraph, diag: DiagnosticSink) -> None:
         ...
 
 
+class CachedPass(Pass):
+    """
+    Pass whose diagnostics depend only on the IR contents. Results are memoized per pass
+    class in a small LRU keyed by `fingerprint(ir)`, so recompiling an unchanged graph
+    replays them instead of re-running `analyze`. Passes that read only part of the IR
+    narrow `fingerprint` to that part, so edits elsewhere keep their cache warm.
+    """
+
+    cache_size: int = 32
+    _cache: "OrderedDict[str, tuple[Any, ...]]"  # DiagnosticSink records
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._cache = OrderedDict()
+
+    @abstractmethod
+    def analyze(self, ir: IRGraph, diag: DiagnosticSink) -> None:
+        ...
+
+    def fingerprint(self, ir: IRGraph) -> str:
+        """Digest of everything `analyze` reads; the whole IR unless overridden."""
+        return ir.fingerprint()
+
+    def run(self, ir: IRGraph, diag: DiagnosticSink) -> None:
+        cache = type(self)._cache
+        fp = self.fingerprint(ir)
+        hit = cache.get(fp)
+        if hit is not None:
+            cache.move_to_end(fp)
+            diag.extend_records(hit)
+            return
+        local = DiagnosticSink()
+        self.analyze(ir, local)
+        cache[fp] = tuple(local._records)
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        diag.merge(local)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls._cache.clear()
+
+
+# Annotation strings per node class: get_type_hints walks the MRO and evaluates string
+# annotations, and the result is the same for every instance of a class.
+_PORT_TYPES_CACHE: "WeakKeyDictionary[type, Dict[str, str]]" = WeakKeyDictionary()
+
+
+def _port_types(cls: type) -> Dict[str, str]:
+    types = _PORT_TYPES_CACHE.get(cls)
+    if types is None:
+        types = {name: str(hint) for name, hint in get_type_hints(cls).items()}
+        _PORT_TYPES_CACHE[cls] = types
+    return types
+
+
+def _core_node_ir(node_id: Any, node: CoreNode, kind: str, ir: IRGraph, policy_traits: Dict[int, tuple]) -> IRNode:
+    """Registers the node's state variables on `ir` and lowers each CoreReaction."""
+    for var in node._state_vars.values():
+        policy = var.write_policy
+        traits = policy_traits.get(id(policy))
+        if traits is None:
+            traits = policy_traits[id(policy)] = (
+                type(policy).__name__,
+                policy.allows_multiwriter(),
+                policy.is_monotone(),
+                policy.height_bound(),
+            )
+        policy_name, allows_multiwriter, is_monotone, height_bound = traits
+        has_init = var.init is not None
+        ir.variables[var.name] = IRVariable(
+            name=var.name,
+            policy=policy_name,
+            has_init=has_init,
+            allows_multiwriter=allows_multiwriter,
+            is_monotone=is_monotone,
+            height_bound=height_bound,
+            is_delay_buffer=getattr(var, "is_delay_buffer", False),
+            init_value=var.init if has_init else None,
+        )
+
+    inputs: Dict[str, str] = {}
+    outputs: Dict[str, str] = {}
+    input_meta: Dict[str, IRPort] = {}
+    output_meta: Dict[str, IRPort] = {}
+    port_types = _port_types(type(node))
+    for name, port in node.inputs.items():
+        inputs[name] = port_types.get(name, "Any")
+        default = getattr(port, "default", None)
+        input_meta[name] = IRPort(name, getattr(port, "rate", None), default is not None, default)
+    for name, port in node.outputs.items():
+        outputs[name] = port_types.get(name, "Any")
+        output_meta[name] = IRPort(name, getattr(port, "rate", None))
+
+    # Local name -> IR name; state shadows an input of the same name.
+    scope = {name: name for name in node.inputs}
+    scope.update((name, var.name) for name, var in node._state_vars.items())
+    delay_buffers = {name for name, var in node._state_vars.items() if getattr(var, "is_delay_buffer", False)}
+
+    reactions: List[IRReaction] = []
+    for cr in node.reactions:
+        reads = {scope[v] for v in expr_vars(cr.ast) & scope.keys()}
+        writes = set()
+        explicit_writes = {}
+        has_delay_output = bool(cr.output_name) and isinstance(cr.ast, Var) and cr.ast.name in delay_buffers
+        for local_name, expr in cr.writes.items():
+            if local_name in node._state_vars:
+                global_name = scope[local_name]
+                writes.add(global_name)
+                explicit_writes[global_name] = expr
+                if local_name not in delay_buffers:
+                    reads.update(scope[v] for v in expr_vars(expr) & scope.keys())
+
+        reactions.append(IRReaction(
+            id=cr.name,
+            reads_vars=reads,
+            writes_vars=writes,
+            ast=cr.ast,
+            explicit_writes=explicit_writes,
+            output_port=cr.output_name,
+            has_delay_output=has_delay_output,
+            nonzeno_rank=cr.nonzeno_rank,
+            nonzeno_limit=cr.nonzeno_limit,
+            scoped_reads=scope_reads(node_id, reads, ir.variables),
+        ))
+
+    return IRNode(
+        id=node_id,
+        kind=kind,  # type: ignore
+        inputs=inputs,
+        outputs=outputs,
+        reactions=reactions,
+        input_meta=input_meta,
+        output_meta=output_meta,
+    )
+
+
+def _opaque_node_ir(node_id: Any, node: RawNode, kind: str, ir: IRGraph, policy_traits: Dict[int, tuple]) -> IRNode:
+    """A single opaque `step` reaction carrying the contract/unsafe markers of the method."""
+    step_method = getattr(node, "step", None)
+    inputs: Dict[str, str] = {}
+    outputs: Dict[str, str] = {}
+    input_meta: Dict[str, IRPort] = {}
+    output_meta: Dict[str, IRPort] = {}
+    for name, port in node.inputs.items():
+        inputs[name] = "Any"
+        default = getattr(port, "default", None)
+        input_meta[name] = IRPort(name, getattr(port, "rate", None), default is not None, default)
+    for name, port in node.outputs.items():
+        outputs[name] = "Any"
+        output_meta[name] = IRPort(name, getattr(port, "rate", None))
+
+    reaction = IRReaction(
+        id="step",
+        contract=getattr(step_method, "_contract", None),
+        is_unsafe=getattr(step_method, "_unsafe", False),
+        unsafe_reason=getattr(step_method, "_unsafe_reason", None),
+        python_method=step_method,
+    )
+    return IRNode(
+        id=node_id,
+        kind=kind,  # type: ignore
+        inputs=inputs,
+        outputs=outputs,
+        reactions=[reaction],
+        input_meta=input_meta,
+        output_meta=output_meta,
+    )
+
+
+def _continuous_node_ir(node_id: Any, node: ContinuousWrapper, kind: str, ir: IRGraph, policy_traits: Dict[int, tuple]) -> IRNode:
+    ir_node = _opaque_node_ir(node_id, node, kind, ir, policy_traits)
+    ir_node.continuous_state_names = node.inner._state_names()  # noqa: SLF001
+    return ir_node
+
+
+IRBuilder = Callable[[Any, Any, str, IRGraph, Dict[int, tuple]], IRNode]
+
+# Runtime node class -> (IR kind, builder). A node uses the entry of the nearest class in
+# its MRO, resolved once per class.
+_IR_BUILDERS: Dict[type, Tuple[str, IRBuilder]] = {}
+_IR_BUILDER_CACHE: "WeakKeyDictionary[type, Tuple[str, IRBuilder]]" = WeakKeyDictionary()
+
+
+def _register_ir_builder(cls: type, kind: str, builder: IRBuilder) -> None:
+    _IR_BUILDERS[cls] = (kind, builder)
+    _IR_BUILDER_CACHE.clear()
+
+
+def _ir_builder(cls: type) -> Tuple[str, IRBuilder]:
+    entry = _IR_BUILDER_CACHE.get(cls)
+    if entry is None:
+        entry = next(_IR_BUILDERS[base] for base in cls.__mro__ if base in _IR_BUILDERS)
+        _IR_BUILDER_CACHE[cls] = entry
+    return entry
+
+
+_register_ir_builder(RawNode, "Raw", _opaque_node_ir)
+_register_ir_builder(ExtNode, "Ext", _opaque_node_ir)
+_register_ir_builder(ContinuousWrapper, "Continuous", _continuous_node_ir)
+_register_ir_builder(CoreNode, "Core", _core_node_ir)
+
+
+def _core_ir_values(node: CoreNode) -> Tuple[Any, ...]:
+    # Attributes the Core IR reads that may be reassigned without bumping node._version:
+    # input port defaults, state variable inits and write policies.
+    return (
+        *(port.default for port in node.inputs.values()),
+        *(var.init for var in node._state_vars.values()),
+        *(var.write_policy for var in node._state_vars.values()),
+    )
+
+
+def _same_objects(a: Tuple[Any, ...], b: Tuple[Any, ...]) -> bool:
+    # Identity, not equality: defaults and inits may be arrays without a scalar ==.
+    return len(a) == len(b) and all(x is y for x, y in zip(a, b))
+
+
+EDGE_COST = 0.5  # Relative cost of an incoming edge vs a node when sizing shards.
+
+
 class CompilerPipeline:
     def __init__(self, config: CompilerConfig):
         self.config = config
         self.passes: List[Pass] = []
+        # Core node IR from the previous build_ir, reused while the node object, its
+        # structural version and its _core_ir_values are unchanged:
+        # node id -> (node, version, values, IRNode, variables).
+        self._ir_cache: Dict[Any, Tuple[RawNode, int, Tuple[Any, ...], IRNode, List[IRVariable]]] = {}
+        self._edge_cache: Optional[Tuple[GraphRuntime, int, List[IREdge]]] = None
 
     def add_pass(self, p: Pass):
         self.passes.append(p)
 
     def build_ir(self, runtime: GraphRuntime) -> IRGraph:
         ir = IRGraph(config={"mode": self.config.mode})
+        # Policy traits per policy object. A State's default policy is created once on the
+        # class descriptor, so every instance of a node class shares it; keying by object
+        # rather than class stays correct for parameterized policies. Every policy is held
+        # by a live variable for the whole build, so ids are stable.
+        policy_traits: Dict[int, tuple] = {}
         
+        previous = self._ir_cache
+        cache: Dict[Any, Tuple[RawNode, int, Tuple[Any, ...], IRNode, List[IRVariable]]] = {}
         for node_id, node in runtime.nodes.items():
-            inputs = {}
-            outputs = {}
-            reactions = []
-            kind = "Raw"
-            input_meta = {}
-            output_meta = {}
-            
-            if isinstance(node, CoreNode):
-                kind = "Core"
-                for var_name, var in node._state_vars.items():
-                    policy = var.write_policy
-                    policy_name = type(policy).__name__
-                    has_init = var.init is not None
-                    irvar = IRVariable(
-                        name=var.name,
-                        policy=policy_name,
-                        has_init=has_init,
-                        allows_multiwriter=policy.allows_multiwriter(),
-                        is_monotone=policy.is_monotone(),
-                        height_bound=policy.height_bound(),
-                        is_delay_buffer=getattr(var, "is_delay_buffer", False),
-                        init_value=var.init if has_init else None,
-                    )
-                    ir.variables[var.name] = irvar
-
-                hints = get_type_hints(type(node))
-                for name in node.inputs:
-                    inputs[name] = str(hints.get(name, "Any"))
-                    port = node.inputs[name]
-                    rate = getattr(port, "rate", None)
-                    default = getattr(port, "default", None)
-                    has_default = default is not None
-                    input_meta[name] = IRPort(name, rate, has_default, default)
-                
-                for name in node.outputs:
-                    outputs[name] = str(hints.get(name, "Any"))
-                    port = node.outputs[name]
-                    rate = getattr(port, "rate", None)
-                    output_meta[name] = IRPort(name, rate)
-                        
-                for cr in node.reactions:
-                    ast_vars = collect_expr_vars(cr.ast)
-                    reads = set()
-                    for v in ast_vars:
-                        if v in node._state_vars:
-                            reads.add(node._state_vars[v].name)
-                        elif v in node.inputs:
-                            reads.add(v)
-                    
-                    writes = set()
-                    explicit_writes = {}
-                    has_delay_output = False
-                    if cr.output_name and isinstance(cr.ast, Var):
-                        local_name = cr.ast.name
-                        if local_name in node._state_vars and getattr(node._state_vars[local_name], "is_delay_buffer", False):
-                            has_delay_output = True
-                    for local_name, expr in cr.writes.items():
-                        if local_name in node._state_vars:
-                            state_var = node._state_vars[local_name]
-                            global_name = state_var.name
-                            writes.add(global_name)
-                            explicit_writes[global_name] = expr
-                            
-                            if not getattr(state_var, "is_delay_buffer", False):
-                                write_expr_vars = collect_expr_vars(expr)
-                                for wv in write_expr_vars:
-                                    if wv in node._state_vars:
-                                        reads.add(node._state_vars[wv].name)
-                                    elif wv in node.inputs:
-                                        reads.add(wv)
-
-                    irr = IRReaction(
-                        id=cr.name, 
-                        reads_vars=reads, 
-                        writes_vars=writes, 
-                        ast=cr.ast,
-                        explicit_writes=explicit_writes,
-                        output_port=cr.output_name,
-                        has_delay_output=has_delay_output,
-                        nonzeno_rank=cr.nonzeno_rank,
-                        nonzeno_limit=cr.nonzeno_limit,
-                    )
-                    reactions.append(irr)
-            else:
-                if isinstance(node, ContinuousWrapper):
-                    kind = "Continuous"
-                elif isinstance(node, ExtNode):
-                    kind = "Ext"
-                
-                step_method = getattr(node, "step", None)
-                contract = getattr(step_method, "_contract", None)
-                is_unsafe = getattr(step_method, "_unsafe", False)
-                unsafe_reason = getattr(step_method, "_unsafe_reason", None)
-                
-                for name, port in node.inputs.items():
-                    inputs[name] = "Any"
-                    rate = getattr(port, "rate", None)
-                    default = getattr(port, "default", None)
-                    has_default = default is not None
-                    input_meta[name] = IRPort(name, rate, has_default, default)
-                    
-                for name, port in node.outputs.items():
-                    outputs[name] = "Any"
-                    rate = getattr(port, "rate", None)
-                    output_meta[name] = IRPort(name, rate)
-                
-                reactions.append(IRReaction(
-                    id="step",
-                    contract=contract,
-                    is_unsafe=is_unsafe,
-                    unsafe_reason=unsafe_reason,
-                    python_method=step_method
-                ))
-            continuous_state_names: List[str] = []
-            if isinstance(node, ContinuousWrapper):
-                continuous_state_names = node.inner._state_names()  # noqa: SLF001
-
-            ir_node = IRNode(
-                id=node_id,
-                kind=kind, # type: ignore
-                inputs=inputs,
-                outputs=outputs,
-                reactions=reactions,
-                input_meta=input_meta,
-                output_meta=output_meta,
-                continuous_state_names=continuous_state_names,
-            )
-            ir.nodes[node_id] = ir_node
-            
+            kind, builder = _ir_builder(type(node))
+            if kind != "Core":
+                # Opaque nodes are cheap to describe and may swap their step method at runtime.
+                ir.nodes[node_id] = builder(node_id, node, kind, ir, policy_traits)
+                continue
+            values = _core_ir_values(node)
+            hit = previous.get(node_id)
+            if hit is not None and hit[0] is node and hit[1] == node._version and _same_objects(hit[2], values):
+                ir.nodes[node_id] = hit[3]
+                for variable in hit[4]:
+                    ir.variables[variable.name] = variable
+                cache[node_id] = hit
+                continue
+            ir_node = ir.nodes[node_id] = builder(node_id, node, kind, ir, policy_traits)
+            variables = [ir.variables[var.name] for var in node._state_vars.values()]
+            cache[node_id] = (node, node._version, values, ir_node, variables)
+        self._ir_cache = cache
+
+        edges = self._edge_cache
+        if edges is not None and edges[0] is runtime and edges[1] == runtime._edges_version:
+            ir.edges.extend(edges[2])
+            return ir
         for dst, sources in runtime.edges.items():
             for src in sources:
                 if src.node_id and dst.node_id:
@@ -201,15 +409,103 @@ class CompilerPipeline:
                         dst_port=dst.name
                     )
                     ir.edges.append(edge)
-                
+        self._edge_cache = (runtime, runtime._edges_version, list(ir.edges))
         return ir
 
+    def shard_ir(self, ir: IRGraph, count: int) -> List[IRGraph]:
+        """
+        Split `ir` into at most `count` graphs of contiguous nodes with balanced
+        cost |nodes| + EDGE_COST * |incoming edges|. Each shard owns every edge whose
+        destination it owns and shares the variables and config of `ir`.
+        """
+        incoming: Dict[Any, List[IREdge]] = {node_id: [] for node_id in ir.nodes}
+        orphan_edges: List[IREdge] = []
+        for edge in ir.edges:
+            bucket = incoming.get(edge.dst_node)
+            if bucket is None:
+                orphan_edges.append(edge)
+            else:
+                bucket.append(edge)
+
+        total = sum(1.0 + EDGE_COST * len(edges) for edges in incoming.values())
+        target = total / max(count, 1)
+        shards: List[IRGraph] = []
+        current = IRGraph(variables=ir.variables, config=ir.config)
+        cost = 0.0
+        for node_id, node in ir.nodes.items():
+            if current.nodes and cost >= target and len(shards) < count - 1:
+                shards.append(current)
+                current = IRGraph(variables=ir.variables, config=ir.config)
+                cost = 0.0
+            current.nodes[node_id] = node
+            current.edges.extend(incoming[node_id])
+            cost += 1.0 + EDGE_COST * len(incoming[node_id])
+        shards.append(current)
+        shards[0].edges.extend(orphan_edges)
+        return shards
+
     def run_passes(self, ir: IRGraph) -> CompileResult:
-        diag = DiagnosticSink()
+        diag = DiagnosticSink(self.config.max_diagnostics)
+        ir.edge_index  # Built once up front; every pass below reads the shared index.
+        workers = self.config.max_workers
+        shards: Optional[List[IRGraph]] = None
+        pool: Optional[ThreadPoolExecutor] = None
         
-        for p in self.passes:
-            p.run(ir, diag)
+        try:
+            passes = self.passes
+            i = 0
+            while i < len(passes):
+                if diag.saturated and diag.has_errors():
+                    break  # Already failed and at the cap: later passes would only add noise.
+                p = passes[i]
+                j = i
+                if workers > 1:
+                    while j < len(passes) and passes[j].readonly:
+                        j += 1
+                if j - i > 1:
+                    # A run of read-only passes: one task per pass, and per shard for local
+                    # passes; merged in pass order, then shard order.
+                    if pool is None:
+                        pool = ThreadPoolExecutor(max_workers=workers)
+                    ir.fingerprint()  # Memoize before threads race to compute it.
+                    group = passes[i:j]
+                    if shards is None and any(q.is_local for q in group):
+                        shards = self.shard_ir(ir, workers)
+                    futures = [
+                        [pool.submit(self._run_on_shard, q, graph) for graph in (shards if q.is_local else (ir,))]
+                        for q in group
+                    ]
+                    for pass_futures in futures:
+                        for fut in pass_futures:
+                            diag.merge(fut.result())
+                    i = j
+                    continue
+                i += 1
+                if not (p.is_local and workers > 1):
+                    p.run(ir, diag)
+                    continue
+                if shards is None:
+                    shards = self.shard_ir(ir, workers)
+                if pool is None:
+                    pool = ThreadPoolExecutor(max_workers=workers)
+                for shard_diag in pool.map(lambda shard, p=p: self._run_on_shard(p, shard), shards):
+                    diag.merge(shard_diag)
+        finally:
+            if pool is not None:
+                pool.shutdown()
                 
-        has_errors = any(d.severity == DiagnosticSeverity.ERROR for d in diag.diagnostics)
+        if diag.dropped:
+            diag._append(Diagnostic(
+                DiagnosticSeverity.WARNING,
+                "DIAG001",
+                f"{diag.dropped} further warning(s) suppressed (max_diagnostics={diag.max_diagnostics})",
+            ))
+        has_errors = diag.has_errors()
         
         return CompileResult(success=not has_errors, diagnostics=diag.diagnostics, ir=ir)
+
+    @staticmethod
+    def _run_on_shard(p: Pass, shard: IRGraph) -> DiagnosticSink:
+        shard_diag = DiagnosticSink()
+        p.run(shard, shard_diag)
+        return shard_diag
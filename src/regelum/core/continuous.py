@@ -208,3 +208,19 @@ class ContinuousRuntime:
         if node_id not in self.state:
             raise KeyError(f"Node '{node_id}' not found in continuous runtime")
         return dict(self.state[node_id])
+
+    def step_and_snapshot(
+        self, node_id: NodeId, dt: float, inputs: Dict[str, float]
+    ) -> tuple[Dict[str, float], Dict[str, float]]:
+        """
+        Advance by ``dt`` (or only latch ``inputs`` when dt <= 0) and return (state, y) for ``node_id``.
+        Both dicts are returned without copying: state dicts are replaced, never mutated, on each step,
+        and y is the dict already recorded in the trace. Callers must treat them as read-only.
+        """
+        if node_id not in self.nodes:
+            raise KeyError(f"Node '{node_id}' not found in continuous runtime")
+        if dt > 0.0:
+            self.step(dt, {node_id: inputs})
+            return self.state[node_id], self.traces[node_id][-1][1]
+        self.last_inputs[node_id] = inputs
+        return self.state[node_id], self.outputs(node_id)
@@ -2,15 +2,19 @@ import ast
 import inspect
 import textwrap
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Callable, get_type_hints, Generic, TypeVar, Optional
-from .node import RawNode, Context, IntentContext
+from weakref import WeakKeyDictionary
+from typing import Any, Dict, List, Callable, Tuple, get_type_hints, Generic, TypeVar, Optional
+from .node import RawNode, Context, IntentContext, Port
 from .dsl import Expr, Var, If, BinOp, Cmp, Delay
 from .variables import Variable, WritePolicy, ErrorPolicy
-from .interpreter import eval_expr
+from .interpreter import compile_expr, compile_cached
+from .jit_codegen import compile_expr_numba, with_numba_fast_path
 from .values import ABSENT
 
 T = TypeVar("T")
 
+SLOT_INPUT, SLOT_STATE, SLOT_ABSENT = 0, 1, 2
+
 class State(Generic[T]):
     def __init__(self, init: T, policy: Optional[WritePolicy[T]] = None):
         self.init = init
@@ -46,7 +50,7 @@ class Output(Generic[T]):
     def __init__(self, rate: Optional[int] = None):
         self.rate = rate
 
-@dataclass
+@dataclass(slots=True)
 class CoreReaction:
     name: str
     ast: Expr[Any]
@@ -55,6 +59,32 @@ class CoreReaction:
     writes: Dict[str, Expr[Any]] = field(default_factory=dict)
     nonzeno_rank: Optional[str] = None
     nonzeno_limit: Optional[int] = None
+    # Compiled expressions take a list env: env[i] holds the value of slots[i].
+    compiled: Optional[Callable[[List[Any]], Any]] = field(default=None, repr=False, compare=False)
+    compiled_writes: Dict[str, Callable[[List[Any]], Any]] = field(default_factory=dict, repr=False, compare=False)
+    slots: Tuple[str, ...] = field(default=(), repr=False, compare=False)
+    numba_fn: Optional[Callable[..., Any]] = field(default=None, repr=False, compare=False)
+    # Filled by CoreNode._resolve_reactions once the node's ports and state are registered:
+    # one (SLOT_INPUT, Port) / (SLOT_STATE, Variable) / (SLOT_ABSENT, None) per slot, the
+    # output port if the node has it, and (Variable, compiled expression) per state write.
+    sources: Tuple[Tuple[int, Any], ...] = field(default=(), repr=False, compare=False)
+    output_port: Optional[Port] = field(default=None, repr=False, compare=False)
+    state_writes: Tuple[Tuple[Variable[Any], Callable[[List[Any]], Any]], ...] = field(default=(), repr=False, compare=False)
+
+    def __post_init__(self):
+        # Arguments first, then any other variable the expressions read (delay buffers).
+        slot_of = {name: i for i, name in enumerate(dict.fromkeys(self.input_names))}
+        if self.compiled is None:
+            self.compiled = compile_expr(self.ast, f"<reaction:{self.name}>", slot_of)
+            jitted = compile_expr_numba(self.ast)
+            if jitted is not None:
+                self.numba_fn, args = jitted
+                indices = tuple(slot_of[arg] for arg in args)
+                self.compiled = with_numba_fast_path(self.numba_fn, indices, self.compiled)
+        for state_name, expr in self.writes.items():
+            if state_name not in self.compiled_writes:
+                self.compiled_writes[state_name] = compile_expr(expr, f"<reaction:{self.name}.{state_name}>", slot_of)
+        self.slots = tuple(slot_of)
 
 def reaction(func=None, *, rank: Optional[str] = None, max_microsteps: Optional[int] = None):
     def decorator(f):
@@ -66,6 +96,22 @@ def reaction(func=None, *, rank: Optional[str] = None, max_microsteps: Optional[
         return decorator(func)
     return decorator
 
+# Reaction method names per CoreNode class, base classes first, in declaration order.
+_REACTION_NAMES: "WeakKeyDictionary[type, Tuple[str, ...]]" = WeakKeyDictionary()
+
+
+def _reaction_names(cls: type) -> Tuple[str, ...]:
+    names = _REACTION_NAMES.get(cls)
+    if names is None:
+        seen: Dict[str, None] = {}
+        for klass in reversed(cls.__mro__):
+            for name, attr in klass.__dict__.items():
+                if getattr(attr, "_is_reaction", False):
+                    seen.setdefault(name)
+        names = _REACTION_NAMES[cls] = tuple(seen)
+    return names
+
+
 class CoreNode(RawNode):
     def __init__(self, node_id: str):
         super().__init__(node_id)
@@ -75,8 +121,9 @@ class CoreNode(RawNode):
         self._delay_counter = 0
         self._build_structure()
         self._compile_reactions()
-        # Ensure runtime dispatch uses CoreNode.step even if subclass named a reaction "step".
-        self.step = CoreNode.step.__get__(self, CoreNode)
+        self._resolve_reactions()
+        # Instance attribute, so runtime dispatch bypasses any reaction a subclass named "step".
+        self.step = self._specialize_step()
 
     def _build_structure(self):
         for name, attr in self.__class__.__dict__.items():
@@ -90,8 +137,10 @@ class CoreNode(RawNode):
                 var_name = f"{self.id}.{name}"
                 var = Variable(var_name, attr.init, attr.policy)
                 self._state_vars[name] = var
+                self._version += 1
 
     def _register_state_write(self, name: str, expr: Any):
+        self._version += 1
         if not isinstance(expr, Expr):
             from .dsl import Const
             expr = Const(expr)
@@ -102,12 +151,8 @@ class CoreNode(RawNode):
             self._compile_single_reaction(name, method)
 
     def _iter_reaction_methods(self):
-        seen = set()
-        for cls in reversed(self.__class__.mro()):
-            for name, attr in cls.__dict__.items():
-                if getattr(attr, "_is_reaction", False) and name not in seen:
-                    seen.add(name)
-                    yield name, getattr(self, name)
+        for name in _reaction_names(type(self)):
+            yield name, getattr(self, name)
 
     def _compile_single_reaction(self, name: str, method: Callable):
         hints = get_type_hints(method)
@@ -146,6 +191,7 @@ class CoreNode(RawNode):
         rank_name = getattr(method, "_nonzeno_rank", None)
         rank_limit = getattr(method, "_nonzeno_limit", None)
         
+        self._version += 1
         self.reactions.append(CoreReaction(
             name=name, 
             ast=ast, 
@@ -163,38 +209,109 @@ class CoreNode(RawNode):
         self._current_writes = {}
 
     def step(self, ctx: Context) -> None:
+        # Reference implementation; instances run the generated `_specialize_step` code.
+        if isinstance(ctx, IntentContext):
+            self._step_intent(ctx)
+        else:
+            self._step_runtime(ctx)
+
+    def _step_intent(self, ctx: IntentContext) -> None:
+        read, read_var = ctx.read, ctx.read_var
+        for r in self.reactions:
+            env = [
+                read(obj) if kind == SLOT_INPUT else read_var(obj) if kind == SLOT_STATE else ABSENT
+                for kind, obj in r.sources
+            ]
+            result = r.compiled(env)
+            if r.output_port is not None:
+                ctx.write(r.output_port, result)
+            for var, fn in r.state_writes:
+                ctx.write_var(var, fn(env))
+
+    def _step_runtime(self, ctx: Context) -> None:
+        # Without an IntentContext state reads see the initial values and writes are dropped.
+        read = ctx.read
         for r in self.reactions:
-            env = {}
-            for arg in r.input_names:
-                if arg in self.inputs:
-                    env[arg] = ctx.read(self.inputs[arg])
-                elif arg in self._state_vars:
-                    var = self._state_vars[arg]
-                    if isinstance(ctx, IntentContext):
-                        env[arg] = ctx.read_var(var)
-                    else:
-                        env[arg] = var.init
+            env = [
+                read(obj) if kind == SLOT_INPUT else obj.init if kind == SLOT_STATE else ABSENT
+                for kind, obj in r.sources
+            ]
+            result = r.compiled(env)
+            if r.output_port is not None:
+                ctx.write(r.output_port, result)
+
+    def _resolve_reactions(self) -> None:
+        for r in self.reactions:
+            args = set(r.input_names)
+            sources: List[Tuple[int, Any]] = []
+            for name in r.slots:
+                # Arguments bind to an input port first; anything else only to node state.
+                if name in args and name in self.inputs:
+                    sources.append((SLOT_INPUT, self.inputs[name]))
+                elif name in self._state_vars:
+                    sources.append((SLOT_STATE, self._state_vars[name]))
                 else:
-                    env[arg] = ABSENT # Fallback
+                    sources.append((SLOT_ABSENT, None))
+            r.sources = tuple(sources)
+            r.output_port = self.outputs.get(r.output_name) if r.output_name else None
+            r.state_writes = tuple((self._state_vars[name], fn) for name, fn in r.compiled_writes.items())
+
+    def _specialize_step(self) -> Callable[[Context], None]:
+        """
+        Generate a straight-line equivalent of `step` for this node's reactions. Ports,
+        variables and compiled expressions are bound as globals of the generated function,
+        so a tick does no `self.inputs` / `self._state_vars` lookups and checks the
+        context type once. The source depends only on names, so instances of one class
+        share a single code object.
+        """
+        namespace: Dict[str, Any] = {"IntentContext": IntentContext, "ABSENT": ABSENT}
+        bound: Dict[int, str] = {}
 
-            for state_name, var in self._state_vars.items():
-                if state_name in env:
-                    continue
-                if isinstance(ctx, IntentContext):
-                    env[state_name] = ctx.read_var(var)
+        def bind(prefix: str, obj: Any) -> str:
+            name = bound.get(id(obj))
+            if name is None:
+                name = bound[id(obj)] = f"{prefix}{len(namespace)}"
+                namespace[name] = obj
+            return name
+
+        intent: List[str] = []
+        plain: List[str] = []
+        for r in self.reactions:
+            intent_env: List[str] = []
+            plain_env: List[str] = []
+            for kind, obj in r.sources:
+                if kind == SLOT_INPUT:
+                    read = f"read({bind('_p', obj)})"
+                    intent_env.append(read)
+                    plain_env.append(read)
+                elif kind == SLOT_STATE:
+                    var = bind("_v", obj)
+                    intent_env.append(f"read_var({var})")
+                    plain_env.append(f"{var}.init")
                 else:
-                    env[state_name] = var.init
-            
-            result = eval_expr(r.ast, env)
-            
-            if r.output_name and r.output_name in self.outputs:
-                ctx.write(self.outputs[r.output_name], result)
-                
-            if isinstance(ctx, IntentContext):
-                for state_name, expr in r.writes.items():
-                    val = eval_expr(expr, env)
-                    var = self._state_vars[state_name]
-                    ctx.write_var(var, val)
+                    intent_env.append("ABSENT")
+                    plain_env.append("ABSENT")
+
+            call = f"{bind('_r', r.compiled)}(env)"
+            if r.output_port is not None:
+                call = f"write({bind('_o', r.output_port)}, {call})"
+            intent.append(f"env = [{', '.join(intent_env)}]")
+            intent.append(call)
+            for var, fn in r.state_writes:
+                intent.append(f"write_var({bind('_v', var)}, {bind('_w', fn)}(env))")
+            plain.append(f"env = [{', '.join(plain_env)}]")
+            plain.append(call)
+
+        lines = ["def _step(ctx):", "    read = ctx.read", "    write = ctx.write"]
+        lines.append("    if isinstance(ctx, IntentContext):")
+        lines.append("        read_var = ctx.read_var")
+        lines.append("        write_var = ctx.write_var")
+        lines.extend(f"        {line}" for line in intent)
+        lines.append("        return")
+        lines.extend(f"    {line}" for line in plain)
+        code = compile_cached("\n".join(lines) + "\n", f"<{type(self).__name__}.step>")
+        exec(code, namespace)
+        return namespace["_step"]
 
     def _lower_expr(self, expr: Expr[Any], reaction_name: str) -> Expr[Any]:
         if not isinstance(expr, Expr):
@@ -226,6 +343,7 @@ class CoreNode(RawNode):
         return expr
 
     def _register_delay_state(self, default: Any, reaction_name: str) -> str:
+        self._version += 1
         local_name = f"__delay_{reaction_name}_{self._delay_counter}"
         self._delay_counter += 1
         if local_name not in self._state_vars:
@@ -1,10 +1,18 @@
-from typing import Generic, TypeVar, Literal, Any, Union
+from typing import Generic, TypeVar, Literal, Any, Tuple, Union
 from dataclasses import dataclass
+from weakref import WeakValueDictionary
 
 T = TypeVar("T")
 
-@dataclass
+# AST nodes are immutable and slotted. eq=False keeps Expr.__eq__ (which builds a Cmp)
+# on every subclass; hashing is by identity.
+_node = dataclass(slots=True, frozen=True, eq=False, weakref_slot=True)
+
+
+@_node
 class Expr(Generic[T]):
+    __hash__ = object.__hash__
+
     def __bool__(self) -> bool:
         raise RuntimeError(
             "Expr cannot be evaluated as a boolean. "
@@ -18,91 +26,92 @@ class Expr(Generic[T]):
         )
 
     def __add__(self, other: Union["Expr[T]", T]) -> "Expr[T]":
-        if not isinstance(other, Expr):
-            other = Const(other)
-        return BinOp("+", self, other)
-        
+        return _intern(BinOp, "+", self, _to_expr(other))
+
     def __radd__(self, other: Union["Expr[T]", T]) -> "Expr[T]":
-        if not isinstance(other, Expr):
-            other = Const(other)
-        return BinOp("+", other, self)
+        return _intern(BinOp, "+", _to_expr(other), self)
 
     def __sub__(self, other: Union["Expr[T]", T]) -> "Expr[T]":
-        if not isinstance(other, Expr):
-            other = Const(other)
-        return BinOp("-", self, other)
-        
+        return _intern(BinOp, "-", self, _to_expr(other))
+
     def __rsub__(self, other: Union["Expr[T]", T]) -> "Expr[T]":
-        if not isinstance(other, Expr):
-            other = Const(other)
-        return BinOp("-", other, self)
+        return _intern(BinOp, "-", _to_expr(other), self)
 
     def __mul__(self, other: Union["Expr[T]", T]) -> "Expr[T]":
-        if not isinstance(other, Expr):
-            other = Const(other)
-        return BinOp("*", self, other)
-        
+        return _intern(BinOp, "*", self, _to_expr(other))
+
     def __rmul__(self, other: Union["Expr[T]", T]) -> "Expr[T]":
-        if not isinstance(other, Expr):
-            other = Const(other)
-        return BinOp("*", other, self)
+        return _intern(BinOp, "*", _to_expr(other), self)
 
     def __lt__(self, other: Union["Expr[T]", T]) -> "Expr[bool]":
-        if not isinstance(other, Expr):
-            other = Const(other)
-        return Cmp("<", self, other)
-        
+        return _intern(Cmp, "<", self, _to_expr(other))
+
     def __gt__(self, other: Union["Expr[T]", T]) -> "Expr[bool]":
-        if not isinstance(other, Expr):
-            other = Const(other)
-        return Cmp(">", self, other)
+        return _intern(Cmp, ">", self, _to_expr(other))
 
     def __le__(self, other: Union["Expr[T]", T]) -> "Expr[bool]":
-        if not isinstance(other, Expr):
-            other = Const(other)
-        return Cmp("<=", self, other)
+        return _intern(Cmp, "<=", self, _to_expr(other))
 
     def __ge__(self, other: Union["Expr[T]", T]) -> "Expr[bool]":
-        if not isinstance(other, Expr):
-            other = Const(other)
-        return Cmp(">=", self, other)
-        
+        return _intern(Cmp, ">=", self, _to_expr(other))
+
     def __eq__(self, other: Union["Expr[T]", T]) -> "Expr[bool]":
-        if not isinstance(other, Expr):
-            other = Const(other)
-        return Cmp("==", self, other)
+        return _intern(Cmp, "==", self, _to_expr(other))
 
-@dataclass
+@_node
 class Const(Expr[T]):
     value: T
 
-@dataclass
+@_node
 class Var(Expr[T]):
     name: str
 
-@dataclass
+@_node
 class If(Expr[T]):
     cond: Expr[bool]
     then_: Expr[T]
     else_: Expr[T]
 
-@dataclass
+@_node
 class BinOp(Expr[T]):
     op: Literal["+", "-", "*", "/", "min", "max"]
     left: Expr[T]
     right: Expr[T]
 
-@dataclass
+@_node
 class Cmp(Expr[bool]):
     op: Literal["<", "<=", "==", ">", ">="]
     left: Expr[Any]
     right: Expr[Any]
 
-@dataclass
+@_node
 class Delay(Expr[T]):
     expr: Expr[T]
     default: T
 
+_EXPR_TYPES = frozenset((Const, Var, If, BinOp, Cmp, Delay))
+
+
+def _to_expr(x: Any) -> Expr[Any]:
+    # Exact-type check first: operands are almost always stock nodes, and this skips
+    # both isinstance's MRO walk and the Const wrapper.
+    if type(x) in _EXPR_TYPES or isinstance(x, Expr):
+        return x
+    return Const(x)
+
+# Operator nodes built through the Expr operators, keyed by operand identity: repeating
+# `a + b` over the same operands returns the same node. Entries die with the node, and a
+# live node keeps its operands (and therefore their ids) alive.
+_OP_CACHE: "WeakValueDictionary[Tuple[type, str, int, int], Expr[Any]]" = WeakValueDictionary()
+
+
+def _intern(cls: type, op: str, left: Expr[Any], right: Expr[Any]) -> Any:
+    key = (cls, op, id(left), id(right))
+    node = _OP_CACHE.get(key)
+    if node is None:
+        node = _OP_CACHE[key] = cls(op, left, right)
+    return node
+
 def if_(cond: Expr[bool], then_: Expr[T], else_: Expr[T]) -> Expr[T]:
     return If(cond, then_, else_)
 
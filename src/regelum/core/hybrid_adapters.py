@@ -71,6 +71,16 @@ class ContinuousWrapper(RawNode):
         self._rt = ContinuousRuntime()
         self._rt.add_node(inner)
 
+    def propagate(self, dt: float) -> None:
+        """
+        Integrate the inner node over ``dt`` with the currently held inputs.
+        Used by event-driven drivers between discrete events; no ports are read.
+        """
+        if dt <= 0.0:
+            return
+        max_step = self.inner.max_step
+        self._rt.run(dt, max_step if 0.0 < max_step < dt else dt)
+
     def step(self, ctx: Context) -> None:
         dt = ctx.read(self.dt)
         if dt is ABSENT:
@@ -80,12 +90,7 @@ class ContinuousWrapper(RawNode):
             u_val = {}
         if not isinstance(u_val, dict):
             u_val = {"u": u_val}
-        if dt > 0.0:
-            self._rt.step(dt, {self.inner.id: u_val})
-        else:
-            self._rt.last_inputs[self.inner.id] = u_val
-        state_snapshot = self._rt.get_state(self.inner.id)
-        outputs = self._rt.outputs(self.inner.id)
+        state_snapshot, outputs = self._rt.step_and_snapshot(self.inner.id, dt, u_val)
         ctx.write(self.state_out, state_snapshot)
         ctx.write(self.y_out, outputs)
 
@@ -130,11 +135,6 @@ class HybridContinuousWrapper(ContinuousWrapper):
                 u_norm = u_val
             self._held_u = u_norm
 
-        if dt > 0.0:
-            self._rt.step(dt, {self.inner.id: u_norm})
-        else:
-            self._rt.last_inputs[self.inner.id] = u_norm
-        state_snapshot = self._rt.get_state(self.inner.id)
-        outputs = self._rt.outputs(self.inner.id)
+        state_snapshot, outputs = self._rt.step_and_snapshot(self.inner.id, dt, u_norm)
         ctx.write(self.state_out, state_snapshot)
         ctx.write(self.y_out, outputs)
@@ -1,126 +1,313 @@
-from typing import Any, Dict
+import math
+import operator
+from types import CodeType
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from .dsl import Expr, Const, Var, If, BinOp, Cmp, Delay
-from .ternary import V3, Presence
-from .values import ABSENT, is_absent
+from .ternary import V3, P_BOTTOM, P_ABSENT, P_PRESENT
+from .values import ABSENT
+
+# Raw operators; callers handle ABSENT with a single identity test on the operands.
+_BINOP_FN: Dict[str, Callable[[Any, Any], Any]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "min": min,
+    "max": max,
+}
+_CMP_FN: Dict[str, Callable[[Any, Any], Any]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
 
 def eval_expr(expr: Expr[Any], env: Dict[str, Any]) -> Any:
-    if isinstance(expr, Const):
-        return expr.value
-    
-    if isinstance(expr, Var):
-        return env.get(expr.name, ABSENT)
-        
-    if isinstance(expr, If):
-        cond = eval_expr(expr.cond, env)
-        if is_absent(cond):
-            return ABSENT
-            
-        if cond:
-            return eval_expr(expr.then_, env)
+    """
+    Evaluate `expr` with an explicit post-order work stack instead of recursion.
+    Frames are (expr, phase): phase 0 schedules children, phase 1 combines their values.
+    Only the selected branch of an If is evaluated.
+    """
+    work: List[Tuple[Expr[Any], int]] = [(expr, 0)]
+    vals: List[Any] = []
+    push_work = work.append
+    push_val = vals.append
+    pop_val = vals.pop
+
+    while work:
+        e, phase = work.pop()
+        t = type(e)
+
+        if t is Const:
+            push_val(e.value)
+        elif t is Var:
+            push_val(env.get(e.name, ABSENT))
+        elif t is BinOp or t is Cmp:
+            if phase == 0:
+                left, right = e.left, e.right
+                tl, tr = type(left), type(right)
+                # Leaf operands are read in place instead of taking a trip through the stacks.
+                if (tl is Var or tl is Const) and (tr is Var or tr is Const):
+                    l = env.get(left.name, ABSENT) if tl is Var else left.value
+                    r = env.get(right.name, ABSENT) if tr is Var else right.value
+                else:
+                    push_work((e, 1))
+                    push_work((right, 0))
+                    push_work((left, 0))
+                    continue
+            else:
+                r = pop_val()
+                l = pop_val()
+            fn = (_BINOP_FN if t is BinOp else _CMP_FN).get(e.op)
+            if fn is None:
+                raise ValueError(f"Unknown expression type: {t}")
+            # One identity test covers every operator, including min/max/== which ABSENT
+            # does not absorb on its own, and skips ABSENT's reflected dunders.
+            push_val(ABSENT if l is ABSENT or r is ABSENT else fn(l, r))
+        elif t is If:
+            if phase == 0:
+                push_work((e, 1))
+                push_work((e.cond, 0))
+                continue
+            cond = pop_val()
+            if cond is ABSENT:
+                push_val(ABSENT)
+            else:
+                push_work((e.then_ if cond else e.else_, 0))
+        elif t is Delay:
+            raise RuntimeError("Delay expressions must be lowered before interpretation.")
         else:
-            return eval_expr(expr.else_, env)
-            
-    if isinstance(expr, BinOp):
-        l = eval_expr(expr.left, env)
-        r = eval_expr(expr.right, env)
-        
-        if is_absent(l) or is_absent(r):
-            return ABSENT
-            
-        op = expr.op
-        if op == "+": return l + r
-        if op == "-": return l - r
-        if op == "*": return l * r
-        if op == "/": return l / r
-        if op == "min": return min(l, r)
-        if op == "max": return max(l, r)
-        
-    if isinstance(expr, Cmp):
-        l = eval_expr(expr.left, env)
-        r = eval_expr(expr.right, env)
-        
-        if is_absent(l) or is_absent(r):
-            return ABSENT
-            
-        op = expr.op
-        if op == "<": return l < r
-        if op == "<=": return l <= r
-        if op == "==": return l == r
-        if op == ">": return l > r
-        if op == ">=": return l >= r
-        
-    if isinstance(expr, Delay):
-        raise RuntimeError("Delay expressions must be lowered before interpretation.")
-
-    raise ValueError(f"Unknown expression type: {type(expr)}")
+            raise ValueError(f"Unknown expression type: {t}")
+
+    return vals[-1]
+
+
+_BINOP_SRC = {"+": "{l} + {r}", "-": "{l} - {r}", "*": "{l} * {r}", "/": "{l} / {r}", "min": "min({l}, {r})", "max": "max({l}, {r})"}
+_GUARDED_OPS = frozenset({"min", "max", "=="})
+_CMP_SRC = {"<": "{l} < {r}", "<=": "{l} <= {r}", "==": "{l} == {r}", ">": "{l} > {r}", ">=": "{l} >= {r}"}
+
+
+class _ExprCodegen:
+    """
+    Lowers an Expr tree to the source of `def _expr(env): return ...`.
+    Arithmetic and ordering rely on ABSENT absorbing them; min/max/== and If conditions
+    inline the ABSENT check with walrus temporaries so each operand is evaluated once.
+    Scalar constants whose repr round-trips are inlined as literals (LOAD_CONST); any
+    other constant is bound as a global of the generated function. With `slots`, Vars
+    read list positions `env[i]` instead of dict keys; unseen names get the next slot.
+    """
+
+    def __init__(self, slots: Optional[Dict[str, int]] = None) -> None:
+        self.consts: Dict[str, Any] = {}
+        self.slots = slots
+        self._tmp = 0
+
+    def _fresh(self) -> str:
+        name = f"_t{self._tmp}"
+        self._tmp += 1
+        return name
+
+    def emit(self, expr: Expr[Any]) -> str:
+        if isinstance(expr, Const):
+            value = expr.value
+            if type(value) in _LITERAL_TYPES and (type(value) is not float or math.isfinite(value)):
+                return f"({value!r})"
+            name = f"_c{len(self.consts)}"
+            self.consts[name] = expr.value
+            return name
+        if isinstance(expr, Var):
+            if self.slots is None:
+                return f"_get({expr.name!r}, ABSENT)"
+            return f"env[{self.slots.setdefault(expr.name, len(self.slots))}]"
+        if isinstance(expr, If):
+            c = self._fresh()
+            return (
+                f"(ABSENT if ({c} := {self.emit(expr.cond)}) is ABSENT "
+                f"else ({self.emit(expr.then_)} if {c} else {self.emit(expr.else_)}))"
+            )
+        if isinstance(expr, (BinOp, Cmp)):
+            table = _BINOP_SRC if isinstance(expr, BinOp) else _CMP_SRC
+            if expr.op not in table:
+                raise ValueError(f"Unknown operator: {expr.op}")
+            if expr.op not in _GUARDED_OPS:
+                return f"({table[expr.op].format(l=self.emit(expr.left), r=self.emit(expr.right))})"
+            l, r = self._fresh(), self._fresh()
+            return (
+                f"(ABSENT if ({l} := {self.emit(expr.left)}) is ABSENT "
+                f"or ({r} := {self.emit(expr.right)}) is ABSENT "
+                f"else {table[expr.op].format(l=l, r=r)})"
+            )
+        if isinstance(expr, Delay):
+            raise RuntimeError("Delay expressions must be lowered before interpretation.")
+        raise ValueError(f"Unknown expression type: {type(expr)}")
+
+
+_LITERAL_TYPES = (int, float, bool, str, type(None))
+
+# Code objects keyed by (generated source, filename). Every instance of a CoreNode class
+# lowers its reactions to the same source, so compile() runs once per distinct shape.
+_CODE_CACHE: Dict[tuple[str, str], CodeType] = {}
+_CODE_CACHE_LIMIT = 4096
+
+
+def compile_cached(src: str, name: str) -> CodeType:
+    """compile(src, name, "exec"), memoized on the source text and filename."""
+    key = (src, name)
+    code = _CODE_CACHE.get(key)
+    if code is None:
+        code = compile(src, name, "exec")
+        if len(_CODE_CACHE) >= _CODE_CACHE_LIMIT:
+            _CODE_CACHE.clear()
+        _CODE_CACHE[key] = code
+    return code
+
+
+def compile_expr(expr: Expr[Any], name: str = "<dsl>", slots: Optional[Dict[str, int]] = None) -> Callable[[Any], Any]:
+    """
+    Compile an expression into a Python function `f(env) -> value` with eval_expr semantics.
+    `env` is a name -> value dict, or with `slots` a list indexed by slots[name]; `slots`
+    is extended in place with any variable it does not cover yet.
+    Trees the codegen cannot express (Delay, or nesting beyond the parser limits)
+    fall back to a closure over eval_expr.
+    """
+    gen = _ExprCodegen(slots)
+    try:
+        body = gen.emit(expr)
+        if slots is None:
+            src = f"def _expr(env):\n    _get = env.get\n    return {body}\n"
+        else:
+            src = f"def _expr(env):\n    return {body}\n"
+        code = compile_cached(src, name)
+    except (RuntimeError, ValueError, SyntaxError, MemoryError):
+        if slots is None:
+            return lambda env: eval_expr(expr, env)
+        for var_name in _var_names(expr):
+            slots.setdefault(var_name, len(slots))
+        # The slot table is shared with sibling expressions and may still grow; zip
+        # stops at the list's length.
+        return lambda env: eval_expr(expr, dict(zip(slots, env)))
+    namespace: Dict[str, Any] = {"ABSENT": ABSENT, **gen.consts}
+    exec(code, namespace)
+    return namespace["_expr"]
+
+
+def _var_names(expr: Expr[Any]) -> List[str]:
+    names: List[str] = []
+    stack: List[Any] = [expr]
+    while stack:
+        e = stack.pop()
+        t = type(e)
+        if t is Var:
+            names.append(e.name)
+        elif t is BinOp or t is Cmp:
+            stack.extend((e.right, e.left))
+        elif t is If:
+            stack.extend((e.else_, e.then_, e.cond))
+        elif t is Delay:
+            stack.append(e.expr)
+    return names
+
+
+# Shared results for the 3-valued evaluator; V3 is frozen.
+_BOT: V3[Any] = V3.bottom()
+_ABS: V3[Any] = V3.absent()
+_TRUE: V3[bool] = V3.present(True)
+_FALSE: V3[bool] = V3.present(False)
+
 
 def eval_expr_3val(expr: Expr[Any], env: Dict[str, V3[Any]]) -> V3[Any]:
-    if isinstance(expr, Const):
-        return V3.present(expr.value)
-    
-    if isinstance(expr, Var):
-        return env.get(expr.name, V3.bottom())
-    
-    if isinstance(expr, If):
-        cond = eval_expr_3val(expr.cond, env)
-        
-        if cond.presence == Presence.BOTTOM:
-            t = eval_expr_3val(expr.then_, env)
-            e = eval_expr_3val(expr.else_, env)
-            if t.presence == Presence.PRESENT and e.presence == Presence.PRESENT and t.value == e.value:
-                return t
-            if t.presence == Presence.ABSENT and e.presence == Presence.ABSENT:
-                return V3.absent()
-            return V3.bottom()
-        
-        if cond.presence == Presence.ABSENT:
-            return V3.absent()
-        
-        if cond.value:
-            return eval_expr_3val(expr.then_, env)
-        return eval_expr_3val(expr.else_, env)
-            
-    if isinstance(expr, BinOp):
-        l = eval_expr_3val(expr.left, env)
-        r = eval_expr_3val(expr.right, env)
-        
-        if l.presence == Presence.BOTTOM or r.presence == Presence.BOTTOM:
-            return V3.bottom()
-        if l.presence == Presence.ABSENT or r.presence == Presence.ABSENT:
-            return V3.absent()
-            
-        # Both known, compute standard
-        op = expr.op
-        lv, rv = l.value, r.value
-        res = None
-        if op == "+": res = lv + rv
-        elif op == "-": res = lv - rv
-        elif op == "*": res = lv * rv
-        elif op == "/": res = lv / rv
-        elif op == "min": res = min(lv, rv)
-        elif op == "max": res = max(lv, rv)
-        return V3.present(res)
-
-    if isinstance(expr, Cmp):
-        l = eval_expr_3val(expr.left, env)
-        r = eval_expr_3val(expr.right, env)
-        
-        if l.presence == Presence.BOTTOM or r.presence == Presence.BOTTOM:
-            return V3.bottom()
-        if l.presence == Presence.ABSENT or r.presence == Presence.ABSENT:
-            return V3.absent()
-            
-        op = expr.op
-        lv, rv = l.value, r.value
-        res = None
-        if op == "<": res = lv < rv
-        elif op == "<=": res = lv <= rv
-        elif op == "==": res = lv == rv
-        elif op == ">": res = lv > rv
-        elif op == ">=": res = lv >= rv
-        return V3.present(res)
-
-    if isinstance(expr, Delay):
-        raise RuntimeError("Delay expressions must be lowered before ternary evaluation.")
-
-    return V3.bottom()
+    handler = _3VAL_HANDLERS.get(type(expr))
+    if handler is None:
+        handler = _3val_handler_for(type(expr))
+    return handler(expr, env)
+
+
+def _3val_const(expr: Const[Any], env: Dict[str, V3[Any]]) -> V3[Any]:
+    return V3.present(expr.value)
+
+
+def _3val_var(expr: Var[Any], env: Dict[str, V3[Any]]) -> V3[Any]:
+    return env.get(expr.name, _BOT)
+
+
+def _3val_if(expr: If[Any], env: Dict[str, V3[Any]]) -> V3[Any]:
+    cond = eval_expr_3val(expr.cond, env)
+    cc = cond.code
+
+    if cc == P_BOTTOM:
+        t = eval_expr_3val(expr.then_, env)
+        e = eval_expr_3val(expr.else_, env)
+        if t.code == P_PRESENT == e.code and t.value == e.value:
+            return t
+        if t.code == P_ABSENT == e.code:
+            return _ABS
+        return _BOT
+
+    if cc == P_ABSENT:
+        return _ABS
+
+    if cond.value:
+        return eval_expr_3val(expr.then_, env)
+    return eval_expr_3val(expr.else_, env)
+
+
+def _3val_binop(expr: BinOp[Any], env: Dict[str, V3[Any]]) -> V3[Any]:
+    return _3val_binary(expr, env, _BINOP_FN)
+
+
+def _3val_cmp(expr: Cmp, env: Dict[str, V3[Any]]) -> V3[Any]:
+    return _3val_binary(expr, env, _CMP_FN)
+
+
+def _3val_binary(expr: Any, env: Dict[str, V3[Any]], table: Dict[str, Callable[[Any, Any], Any]]) -> V3[Any]:
+    l = eval_expr_3val(expr.left, env)
+    # BOTTOM absorbs every operator: the right subtree cannot change the result.
+    if l.code == P_BOTTOM:
+        return _BOT
+    r = eval_expr_3val(expr.right, env)
+
+    if l.code != P_PRESENT or r.code != P_PRESENT:
+        if r.code == P_BOTTOM:
+            return _BOT
+        return _ABS
+
+    # Both known, compute standard
+    fn = table.get(expr.op)
+    res = None if fn is None else fn(l.value, r.value)
+    if res is True:
+        return _TRUE
+    if res is False:
+        return _FALSE
+    return V3.present(res)
+
+
+def _3val_delay(expr: Delay[Any], env: Dict[str, V3[Any]]) -> V3[Any]:
+    raise RuntimeError("Delay expressions must be lowered before ternary evaluation.")
+
+
+def _3val_unknown(expr: Expr[Any], env: Dict[str, V3[Any]]) -> V3[Any]:
+    return _BOT
+
+
+_3VAL_HANDLERS: Dict[type, Callable[[Any, Dict[str, V3[Any]]], V3[Any]]] = {
+    Const: _3val_const,
+    Var: _3val_var,
+    If: _3val_if,
+    BinOp: _3val_binop,
+    Cmp: _3val_cmp,
+    Delay: _3val_delay,
+}
+
+
+def _3val_handler_for(cls: type) -> Callable[[Any, Dict[str, V3[Any]]], V3[Any]]:
+    # Subclasses of the DSL node types resolve through the MRO once and are then cached.
+    for base in cls.__mro__:
+        if base in _3VAL_HANDLERS:
+            handler = _3VAL_HANDLERS[base]
+            break
+    else:
+        handler = _3val_unknown
+    _3VAL_HANDLERS[cls] = handler
+    return handler
@@ -0,0 +1,160 @@
+"""
+Numba-compiled fast path for numeric CoreReaction expressions.
+
+Optional: `compile_expr_numba` returns None unless numba is installed
+(`pip install regelum[jit]`). Expressions over float variables built from + - * / min
+max, comparisons and If are lowered to a positional function `f(a, b, ...)` and compiled
+eagerly with an explicit float64 signature. The result is wrapped in a dispatcher that
+takes the jitted path only when every variable in the env is a concrete Python float,
+and otherwise defers to the regular compiled closure, so ABSENT propagation and
+non-float values keep eval_expr semantics.
+"""
+
+import math
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .dsl import Expr, Const, Var, If, BinOp, Cmp
+from .interpreter import compile_cached
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
+
+# Scalar kinds of the lowered subset: float64, int64 (constants only) and boolean.
+_F, _I, _B = "float64", "int64", "boolean"
+_INT_LIMIT = 1 << 31
+
+_BINOP_SRC = {"+": "{l} + {r}", "-": "{l} - {r}", "*": "{l} * {r}", "/": "{l} / {r}", "min": "_min({l}, {r})", "max": "_max({l}, {r})"}
+_CMP_SRC = {"<": "<", "<=": "<=", "==": "==", ">": ">", ">=": ">="}
+
+
+class _NumbaCodegen:
+    """
+    Lowers an Expr to a Numba-compatible expression string and infers its scalar kind.
+    Raises NotImplementedError for anything outside the float subset, including
+    constructs whose Python result type would differ from the jitted one.
+    """
+
+    def __init__(self) -> None:
+        self.args: List[str] = []
+
+    def emit(self, expr: Expr[Any]) -> Tuple[str, str]:
+        if isinstance(expr, Const):
+            value = expr.value
+            if type(value) is bool:
+                return repr(value), _B
+            if type(value) is int and -_INT_LIMIT < value < _INT_LIMIT:
+                return f"({value!r})", _I
+            if type(value) is float and math.isfinite(value):
+                return f"({value!r})", _F
+            raise NotImplementedError(f"constant of type {type(value).__name__}")
+        if isinstance(expr, Var):
+            if not expr.name.isidentifier():
+                raise NotImplementedError(f"variable name {expr.name!r}")
+            if expr.name not in self.args:
+                self.args.append(expr.name)
+            return f"a_{expr.name}", _F
+        if isinstance(expr, If):
+            cond, kc = self.emit(expr.cond)
+            then_, kt = self.emit(expr.then_)
+            else_, ke = self.emit(expr.else_)
+            if kc != _B or kt != ke or kt == _I:
+                raise NotImplementedError("If needs a boolean condition and matching float/bool branches")
+            return f"({then_} if {cond} else {else_})", kt
+        if isinstance(expr, BinOp):
+            l, kl = self.emit(expr.left)
+            r, kr = self.emit(expr.right)
+            if _B in (kl, kr) or expr.op not in _BINOP_SRC:
+                raise NotImplementedError(f"operator {expr.op} over {kl}, {kr}")
+            # int64 arithmetic could overflow where Python ints do not; min/max could
+            # return an int operand unchanged.
+            if kl == _I and kr == _I or expr.op in ("min", "max") and kl != kr:
+                raise NotImplementedError(f"operator {expr.op} over {kl}, {kr}")
+            return f"({_BINOP_SRC[expr.op].format(l=l, r=r)})", _F
+        if isinstance(expr, Cmp):
+            l, kl = self.emit(expr.left)
+            r, kr = self.emit(expr.right)
+            if _B in (kl, kr) or expr.op not in _CMP_SRC:
+                raise NotImplementedError(f"comparison {expr.op}")
+            return f"({l} {_CMP_SRC[expr.op]} {r})", _B
+        raise NotImplementedError(f"expression type {type(expr).__name__}")
+
+
+# Spelled out so the jitted code picks the same operand as Python's min/max on ties and NaN.
+def _min(l: float, r: float) -> float:
+    return r if r < l else l
+
+
+def _max(l: float, r: float) -> float:
+    return r if r > l else l
+
+
+def numba_source(expr: Expr[Any]) -> Optional[Tuple[str, Tuple[str, ...], str]]:
+    """
+    Returns (source of `def _jit(...)`, argument names, signature string), or None when
+    the expression is outside the float subset or reads no variables.
+    """
+    gen = _NumbaCodegen()
+    try:
+        body, kind = gen.emit(expr)
+    except (NotImplementedError, RecursionError):
+        return None
+    if not gen.args or kind == _I:
+        return None
+    params = ", ".join(f"a_{name}" for name in gen.args)
+    src = f"def _jit({params}):\n    return {body}\n"
+    signature = f"{kind}({', '.join([_F] * len(gen.args))})"
+    return src, tuple(gen.args), signature
+
+
+if njit is not None:  # pragma: no cover - depends on the environment
+    _jit_min = njit(nogil=True)(_min)
+    _jit_max = njit(nogil=True)(_max)
+
+# Jitted functions keyed by source, so every instance of a node class compiles once.
+_JIT_CACHE: Dict[str, Callable[..., Any]] = {}
+
+
+def compile_expr_numba(expr: Expr[Any]) -> Optional[Tuple[Callable[..., Any], Tuple[str, ...]]]:
+    """
+    Returns (jitted function, argument names) or None when numba is missing, the
+    expression is outside the float subset, or Numba rejects it.
+    """
+    if njit is None:
+        return None
+    lowered = numba_source(expr)
+    if lowered is None:
+        return None
+    src, args, signature = lowered
+    fn = _JIT_CACHE.get(src)
+    if fn is None:  # pragma: no cover - depends on the environment
+        namespace: Dict[str, Any] = {"_min": _jit_min, "_max": _jit_max}
+        exec(compile_cached(src, "<numba-expr>"), namespace)
+        try:
+            fn = njit(signature, nogil=True)(namespace["_jit"])
+        except Exception:
+            return None
+        _JIT_CACHE[src] = fn
+    return fn, args
+
+
+def with_numba_fast_path(
+    jitted: Callable[..., Any], indices: Tuple[int, ...], fallback: Callable[[List[Any]], Any]
+) -> Callable[[List[Any]], Any]:
+    """
+    Wrap a slot-env `fallback` so envs whose jitted arguments (at `indices`, in argument
+    order) are all Python floats run `jitted` instead.
+    """
+    names = [f"a{k}" for k in range(len(indices))]
+    guard = " and ".join(f"type({name}) is float" for name in names)
+    src = (
+        "def _expr(env):\n"
+        f"    {', '.join(names)}, = {', '.join(f'env[{i}]' for i in indices)},\n"
+        f"    if {guard}:\n"
+        f"        return _jitted({', '.join(names)})\n"
+        "    return _fallback(env)\n"
+    )
+    namespace: Dict[str, Any] = {"_jitted": jitted, "_fallback": fallback}
+    exec(compile_cached(src, "<numba-dispatch>"), namespace)
+    return namespace["_expr"]
@@ -1,12 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, TYPE_CHECKING, Union
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING, Union
 from .types import NodeId
+from .values import ABSENT
 
 if TYPE_CHECKING:
     from .variables import Variable
     from .runtime import GraphRuntime
 
 class Port:
+    # One per input/output of every node; slots keep them small and attribute reads cheap.
+    __slots__ = ("name", "node_id", "rate", "default", "_runtime", "is_delay_output", "delay_state_name", "_source", "_resolver")
+
     def __init__(self, name: str, default: Any = None):
         self.name = name
         self.node_id: Optional[NodeId] = None
@@ -15,6 +19,10 @@ class Port:
         self._runtime: Optional['GraphRuntime'] = None 
         self.is_delay_output: bool = False
         self.delay_state_name: Optional[str] = None
+        # The output feeding this input, and resolver(port_state) -> value read from this
+        # port. GraphRuntime.build_schedule rebuilds both from its edges.
+        self._source: Optional['Port'] = None
+        self._resolver: Callable[[Dict['Port', Any]], Any] = _unconnected_resolver(self)
 
     def __repr__(self) -> str:
         return f"Port(name={self.name}, node={self.node_id}, default={self.default})"
@@ -32,7 +40,20 @@ class Port:
         
         return other
 
+def _unconnected_resolver(port: Port) -> Callable[[Dict[Port, Any]], Any]:
+    # Unconnected: a value provided externally via run_tick inputs, else the default.
+    # port.default is read at call time, so later changes to it take effect.
+    def resolve(port_state: Dict[Port, Any]) -> Any:
+        if port in port_state:
+            return port_state[port]
+        default = port.default
+        return ABSENT if default is None else default
+
+    return resolve
+
 class Context(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def read(self, port: Port) -> Any:
         """Read value from a port."""
@@ -44,6 +65,8 @@ class Context(ABC):
         ...
 
 class IntentContext(Context):
+    __slots__ = ()
+
     @abstractmethod
     def read_var(self, var: "Variable[Any]") -> Any:
         """Read current value of a variable."""
@@ -74,6 +97,9 @@ class RawNode(ABC):
         self.outputs: Dict[str, Port] = {}
         self._runtime: Optional['GraphRuntime'] = None
         self._no_instant_loop: bool = False
+        # Bumped on every structural change (ports, reactions, state); lets the compiler
+        # reuse IR built for an unchanged node.
+        self._version = 0
 
     @property
     def i(self) -> PortAccessor:
@@ -92,12 +118,14 @@ class RawNode(ABC):
         port = Port(name, default=default)
         port.node_id = self.id
         self.inputs[name] = port
+        self._version += 1
         return port
 
     def add_output(self, name: str) -> Port:
         port = Port(name)
         port.node_id = self.id
         self.outputs[name] = port
+        self._version += 1
         return port
     
     def bind_runtime(self, runtime: 'GraphRuntime'):
@@ -1,64 +1,59 @@
-from typing import Any, Dict, List, TypeVar, Set
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Set
+import heapq
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from .types import NodeId
-from .node import RawNode, Port, IntentContext
+from .node import RawNode, Port, IntentContext, _unconnected_resolver
 from .variables import Variable, Intent
 from .values import ABSENT
 
 T = TypeVar("T")
 
+# Proposed writes grouped by variable as nodes emit them, in proposal order per variable;
+# the resolve phase merges each group directly.
+GroupedIntents = Dict[Variable[Any], List[Intent[Any]]]
+
+# One node of a compiled SCC: id, node, the context reused for its singleton runs and its
+# output ports. `step` is looked up per call, not cached, so a step reassigned on the
+# node after build_schedule still takes effect.
+NodeRecord = Tuple[NodeId, RawNode, "RuntimeIntentContext", Tuple[Port, ...]]
+
+# Compiled SCC: (runs as a plain singleton, node records, tightest reaction microstep
+# limit or None). The limit is capped by max_microsteps at run time.
+SccPlan = Tuple[bool, List[NodeRecord], Optional[int]]
+
 class ZenoRuntimeError(RuntimeError):
     """Raised when an instantaneous loop exceeds the allowed microsteps."""
 
 
 class RuntimeIntentContext(IntentContext):
+    # Allocated per node for every SCC microstep; slots keep it small.
+    __slots__ = ("node_id", "port_state", "var_state", "intents", "snapshot")
+
     def __init__(
         self,
         node_id: NodeId,
         port_state: Dict[Port, Any],
-        edges: Dict[Port, Port],
         var_state: Dict[str, Any],
-        intents: List[Intent[Any]],
+        intents: GroupedIntents,
         snapshot: Dict[Port, Any] | None = None,
     ):
         self.node_id = node_id
         self.port_state = port_state
-        self.edges = edges
         self.var_state = var_state
         self.intents = intents
         self.snapshot = snapshot
 
     def read(self, port: Port) -> Any:
-        # If port is an input, find connected output(s).
-        sources = self.edges.get(port, [])
-        
-        if not sources:
-            # No connection
-            # Check if provided externally via inputs in run_tick
-            if port in self.port_state:
-                return self.port_state[port]
-            
-            if port.default is not None:
-                return port.default
-            return ABSENT
-
-        if len(sources) == 1:
-            # Single source
-            source_port = sources[0]
-            if self.snapshot is not None and source_port in self.snapshot:
-                return self.snapshot[source_port]
-            val = self.port_state.get(source_port, ABSENT)
-            if val is ABSENT and port.default is not None:
-                return port.default
-            return val
-        
-        source_port = sources[-1]
-        if self.snapshot is not None and source_port in self.snapshot:
-            return self.snapshot[source_port]
-        val = self.port_state.get(source_port, ABSENT)
-        if val is ABSENT and port.default is not None:
-            return port.default
-        return val
+        # Source lookup and default handling are baked into the port's resolver; only
+        # tickwise runs carry a snapshot, which takes precedence for connected ports.
+        snapshot = self.snapshot
+        if snapshot is not None:
+            source = port._source
+            if source is not None and source in snapshot:
+                return snapshot[source]
+        return port._resolver(self.port_state)
 
     def write(self, port: Port, value: Any) -> None:
         self.port_state[port] = value
@@ -70,19 +65,83 @@ class RuntimeIntentContext(IntentContext):
         return var.init
 
     def write_var(self, var: Variable[T], value: T) -> None:
-        self.intents.append(Intent(var, self.node_id, value))
+        intent = Intent(var, self.node_id, value)
+        group = self.intents.get(var)
+        if group is None:
+            self.intents[var] = [intent]
+        else:
+            group.append(intent)
+
+def _source_resolver(source: Port, port: Port) -> Callable[[Dict[Port, Any]], Any]:
+    # Resolver for `port` fed by `source`. port.default is only consulted when the source
+    # is silent, and at call time, so later changes to it take effect.
+    def resolve(port_state: Dict[Port, Any]) -> Any:
+        val = port_state.get(source, ABSENT)
+        if val is ABSENT:
+            default = port.default
+            if default is not None:
+                return default
+        return val
+    return resolve
+
+
+def _extend_grouped(into: GroupedIntents, grouped: GroupedIntents) -> None:
+    for var, group in grouped.items():
+        existing = into.get(var)
+        if existing is None:
+            into[var] = group
+        else:
+            existing.extend(group)
+
+
+def _differs(old: Any, new: Any) -> bool:
+    # Identity first: values carried over unchanged skip __eq__ entirely.
+    if old is new:
+        return False
+    try:
+        return bool(old != new)
+    except ValueError:
+        # Elementwise != (numpy arrays) has no single truth value.
+        return not np.array_equal(old, new)
+
 
 class GraphRuntime:
     def __init__(self):
         self.nodes: Dict[NodeId, RawNode] = {}
-        self.edges: Dict[Port, List[Port]] = defaultdict(list)
+        self.edges: Dict[Port, List[Port]] = {}  # Input port -> sources, in connection order.
         self.schedule: List[List[NodeId]] = [] # List of SCCs
+        # Parallel to schedule. Built once by build_schedule so ticks do no node lookups,
+        # self-loop scans or reaction walks.
+        self._compiled_schedule: List[SccPlan] = []
         self.port_state: Dict[Port, Any] = {}
+        self._edges_version = 0  # Bumped by connect(); keys the compiler's IR edge cache.
+        self._self_loop_nodes: Set[NodeId] = set()  # Nodes with an edge into themselves.
         self.var_state: Dict[str, Any] = {} # Variable.name -> Value
         self.max_microsteps = 20
         self.current_time = 0.0
         self.tickwise_mode = False
         self._tickwise_outputs: Dict[Port, Any] = {}
+        self._absent_outputs: Dict[Port, Any] = {}  # Every output port -> ABSENT.
+        self._dt_ports: Tuple[Port, ...] = ()  # Inputs named "dt", fed by run_tick(dt=...).
+        # Delay outputs and the state variable each one republishes at tick start.
+        self._delay_prefills: List[Tuple[Port, Variable[Any]]] = []
+        # Frontiers group schedule positions whose SCCs share no dependencies and can
+        # be proposed concurrently when workers > 1.
+        self.frontiers: List[List[int]] = []
+        self.workers = 1
+        self._executor: ThreadPoolExecutor | None = None
+
+    def close(self) -> None:
+        """Shut down the frontier worker threads; a later parallel tick starts new ones."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def __enter__(self) -> "GraphRuntime":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def add_node(self, node: RawNode) -> None:
         if node.id in self.nodes:
@@ -91,7 +150,14 @@ class GraphRuntime:
         node.bind_runtime(self) # Bind runtime to node and its ports
 
     def connect(self, src: Port, dst: Port) -> None:
-        self.edges[dst].append(src)
+        sources = self.edges.get(dst)
+        if sources is None:
+            self.edges[dst] = [src]
+        else:
+            sources.append(src)
+        self._edges_version += 1
+        if src.node_id == dst.node_id:
+            self._self_loop_nodes.add(src.node_id)
 
     def build_schedule(self) -> None:
         # Build two graphs:
@@ -119,8 +185,9 @@ class GraphRuntime:
             adj_full.setdefault(node_id, [])
             adj_scc.setdefault(node_id, [])
 
-        # Tarjan on adj_scc to keep no_instant_loop nodes as SCC boundaries.
-        visited: Set[NodeId] = set()
+        # Tarjan on adj_scc to keep no_instant_loop nodes as SCC boundaries. Iterative, with
+        # an explicit stack of (node, successor iterator) frames, so deep chains do not hit
+        # the recursion limit.
         stack: List[NodeId] = []
         on_stack: Set[NodeId] = set()
         ids: Dict[NodeId, int] = {}
@@ -128,34 +195,42 @@ class GraphRuntime:
         id_counter = 0
         sccs: List[List[NodeId]] = []
 
-        def dfs(at: NodeId):
-            nonlocal id_counter
-            stack.append(at)
-            on_stack.add(at)
-            visited.add(at)
-            ids[at] = low[at] = id_counter
+        for root in self.nodes:
+            if root in ids:
+                continue
+            ids[root] = low[root] = id_counter
             id_counter += 1
-
-            for to in adj_scc[at]:
-                if to not in visited:
-                    dfs(to)
-                    low[at] = min(low[at], low[to])
-                elif to in on_stack:
-                    low[at] = min(low[at], ids[to])
-
-            if ids[at] == low[at]:
-                scc: List[NodeId] = []
-                while stack:
-                    node = stack.pop()
-                    on_stack.remove(node)
-                    scc.append(node)
-                    if node == at:
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(adj_scc[root]))]
+            while work:
+                at, successors = work[-1]
+                for to in successors:
+                    if to not in ids:
+                        ids[to] = low[to] = id_counter
+                        id_counter += 1
+                        stack.append(to)
+                        on_stack.add(to)
+                        work.append((to, iter(adj_scc[to])))
                         break
-                sccs.append(scc)
-
-        for node_id in self.nodes:
-            if node_id not in visited:
-                dfs(node_id)
+                    if to in on_stack and ids[to] < low[at]:
+                        low[at] = ids[to]
+                else:
+                    # Successors exhausted: close the SCC rooted here, then report to the parent.
+                    work.pop()
+                    if ids[at] == low[at]:
+                        scc: List[NodeId] = []
+                        while stack:
+                            node = stack.pop()
+                            on_stack.remove(node)
+                            scc.append(node)
+                            if node == at:
+                                break
+                        sccs.append(scc)
+                    if work:
+                        parent = work[-1][0]
+                        if low[at] < low[parent]:
+                            low[parent] = low[at]
 
         # Map node -> SCC index
         scc_index: Dict[NodeId, int] = {}
@@ -178,71 +253,115 @@ class GraphRuntime:
         for idx in range(len(sccs)):
             indeg.setdefault(idx, 0)
 
-        # Kahn topological order on SCC DAG.
+        # Kahn topological order on SCC DAG; the min-heap keeps it deterministic
+        # (smallest ready SCC index first).
         ready = [idx for idx, deg in indeg.items() if deg == 0]
-        ready.sort()
+        heapq.heapify(ready)
         topo_scc: List[int] = []
         while ready:
-            current = ready.pop(0)
+            current = heapq.heappop(ready)
             topo_scc.append(current)
             for nbr in cond_adj.get(current, ()):
                 indeg[nbr] -= 1
                 if indeg[nbr] == 0:
-                    ready.append(nbr)
-                    ready.sort()
+                    heapq.heappush(ready, nbr)
 
-        if len(topo_scc) != len(sccs):
+        acyclic = len(topo_scc) == len(sccs)
+        if not acyclic:
             topo_scc = list(range(len(sccs)))
 
         self.schedule = [sccs[idx] for idx in topo_scc]
-
-    def _prefill_delay_outputs(self) -> None:
+        self._compile_schedule()
+
+        if not acyclic:
+            # No valid level structure; keep the fallback order strictly serial.
+            self.frontiers = [[pos] for pos in range(len(sccs))]
+            return
+
+        # Frontier = longest-path level in the SCC DAG; members of one level are independent.
+        level: Dict[int, int] = {}
+        for idx in topo_scc:
+            lvl = level.setdefault(idx, 0)
+            for nbr in cond_adj.get(idx, ()):
+                if level.get(nbr, 0) < lvl + 1:
+                    level[nbr] = lvl + 1
+        frontiers: Dict[int, List[int]] = defaultdict(list)
+        for pos, idx in enumerate(topo_scc):
+            frontiers[level[idx]].append(pos)
+        self.frontiers = [frontiers[lvl] for lvl in sorted(frontiers)]
+
+    def _compile_schedule(self) -> None:
+        self_loops = self._self_loop_nodes
+        compiled: List[SccPlan] = []
+        for scc in self.schedule:
+            members: List[NodeRecord] = []
+            for node_id in scc:
+                node = self.nodes[node_id]
+                ctx = RuntimeIntentContext(node_id, self.port_state, self.var_state, {})
+                members.append((node_id, node, ctx, tuple(node.outputs.values())))
+            singleton = len(scc) == 1 and scc[0] not in self_loops
+            compiled.append((singleton, members, None if singleton else self._reaction_limit(scc)))
+        self._compiled_schedule = compiled
+        self._wire_ports()
+        self._delay_prefills = []
         for node in self.nodes.values():
             state_vars = getattr(node, "_state_vars", None)
             if not state_vars:
                 continue
             for port in node.outputs.values():
-                delay_state = getattr(port, "delay_state_name", None)
-                if not delay_state:
-                    continue
-                if delay_state not in state_vars:
-                    continue
-                var = state_vars[delay_state]
-                value = self.var_state.get(var.name, var.init)
-                self.port_state[port] = value
+                delay_state = port.delay_state_name
+                if delay_state and delay_state in state_vars:
+                    self._delay_prefills.append((port, state_vars[delay_state]))
+        self._dt_ports = tuple(
+            port for node in self.nodes.values() for name, port in node.inputs.items() if name == "dt"
+        )
+        self._absent_outputs = dict.fromkeys(
+            (port for node in self.nodes.values() for port in node.outputs.values()), ABSENT
+        )
+
+    def _wire_ports(self) -> None:
+        # Input ports carry their resolvers, so they are rebuilt from self.edges on every
+        # build: edits to edges and ports shared with another runtime take effect here.
+        for node in self.nodes.values():
+            for port in node.inputs.values():
+                port._source = None
+                port._resolver = _unconnected_resolver(port)
+        for dst, sources in self.edges.items():
+            if sources:
+                # With several connected outputs the last connection wins.
+                src = sources[-1]
+                dst._source = src
+                dst._resolver = _source_resolver(src, dst)
+
+    def _prefill_delay_outputs(self) -> None:
+        port_state, var_state = self.port_state, self.var_state
+        for port, var in self._delay_prefills:
+            port_state[port] = var_state.get(var.name, var.init)
 
     def run_step(self) -> None:
-        for scc in self.schedule:
-            for node_id in scc:
-                node = self.nodes[node_id]
-                ctx = RuntimeIntentContext(
-                    node_id,
-                    self.port_state,
-                    self.edges,
-                    self.var_state,
-                    [] 
-                )
+        for _, members, _ in self._compiled_schedule:
+            for _, node, ctx, _ in members:
+                ctx.intents = {}
+                ctx.snapshot = None
                 node.step(ctx)
 
     def run_tick(self, inputs: Dict[Port, Any] | None = None, dt: float | None = None) -> None:
         # Stage 6: Clear ports at start of tick.
-        snapshot: Dict[Port, Any] | None = None
-        if self.tickwise_mode:
-            snapshot = dict(self._tickwise_outputs)
+        # The tickwise snapshot is read-only during the tick and replaced, never mutated,
+        # at its end, so the previous tick's dict can be shared without a copy.
+        snapshot = self._tickwise_outputs if self.tickwise_mode else None
         self.port_state.clear()
         self._prefill_delay_outputs()
 
         if dt is not None:
-            for node in self.nodes.values():
-                for name, port in node.inputs.items():
-                    if name == "dt":
-                        self.port_state[port] = dt
+            for port in self._dt_ports:
+                self.port_state[port] = dt
         
         # Apply external inputs if provided
         if inputs:
             self.port_state.update(inputs)
         
-        intents: List[Intent[Any]] = []
+        intents: GroupedIntents = {}
         
         # 1. Propose Phase
         self._propose_phase(intents, snapshot)
@@ -253,119 +372,147 @@ class GraphRuntime:
         # 3. Commit Phase
         self._commit_phase(updates)
         if self.tickwise_mode:
-            outputs: Dict[Port, Any] = {}
-            for node in self.nodes.values():
-                for port in node.outputs.values():
-                    val = self.port_state.get(port, ABSENT)
-                    outputs[port] = val
+            # Every output maps to its value this tick, or ABSENT if unwritten. Both steps
+            # are C-level dict copies; the input ports this also carries over are never
+            # looked up, since snapshot reads go by source port.
+            outputs = dict(self._absent_outputs)
+            outputs.update(self.port_state)
             self._tickwise_outputs = outputs
         if dt is not None:
             self.current_time += dt
 
-    def _propose_phase(self, intents: List[Intent[Any]], snapshot: Dict[Port, Any] | None) -> None:
-        for scc in self.schedule:
-            if len(scc) == 1 and not self._has_self_loop(scc[0]):
-                self._run_node(scc[0], intents, snapshot)
-            else:
-                self._run_scc_loop(scc, intents, snapshot)
+    def _propose_phase(self, intents: GroupedIntents, snapshot: Dict[Port, Any] | None) -> None:
+        if self.workers > 1 and self.frontiers:
+            self._propose_frontiers(intents, snapshot)
+            return
+        for plan in self._compiled_schedule:
+            self._propose_scc(plan, intents, snapshot)
 
-    def _has_self_loop(self, node_id: NodeId) -> bool:
-        for dst_port, src_ports in self.edges.items():
-            if dst_port.node_id == node_id:
-                for src_port in src_ports:
-                    if src_port.node_id == node_id:
-                        return True
-        return False
-
-    def _run_node(self, node_id: NodeId, intents: List[Intent[Any]], snapshot: Dict[Port, Any] | None) -> None:
-        node = self.nodes[node_id]
-        ctx = RuntimeIntentContext(
-            node_id, 
-            self.port_state, 
-            self.edges,
-            self.var_state, 
-            intents,
-            snapshot,
-        )
-        node.step(ctx)
-    
-    def _run_node_with_state(
+    def _propose_scc(
         self,
-        node_id: NodeId,
-        intents: List[Intent[Any]],
-        var_state: Dict[str, Any],
+        plan: SccPlan,
+        intents: GroupedIntents,
         snapshot: Dict[Port, Any] | None,
     ) -> None:
-        node = self.nodes[node_id]
-        ctx = RuntimeIntentContext(
-            node_id, 
-            self.port_state, 
-            self.edges,
-            var_state, 
-            intents,
-            snapshot,
-        )
+        singleton, members, reaction_limit = plan
+        if singleton:
+            self._run_node(members[0], intents, snapshot)
+        else:
+            limit = self.max_microsteps
+            if reaction_limit is not None and reaction_limit < limit:
+                limit = reaction_limit
+            self._run_scc_loop(members, limit, intents, snapshot)
+
+    def _propose_frontiers(self, intents: GroupedIntents, snapshot: Dict[Port, Any] | None) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="rg-tick")
+        # Intents are collected per SCC across all frontiers and merged once, in schedule
+        # position order, so order-sensitive policies resolve exactly as in the serial
+        # schedule; frontier (level) order can differ from it.
+        plans = self._compiled_schedule
+        per_scc: Dict[int, GroupedIntents] = {pos: {} for pos in range(len(plans))}
+        for frontier in self.frontiers:
+            if len(frontier) == 1:
+                pos = frontier[0]
+                self._propose_scc(plans[pos], per_scc[pos], snapshot)
+                continue
+            futures = [
+                self._executor.submit(self._propose_batch, batch, per_scc, snapshot)
+                for batch in self._batch_frontier(frontier)
+            ]
+            for fut in futures:
+                fut.result()
+        for pos in range(len(plans)):
+            _extend_grouped(intents, per_scc[pos])
+
+    def _batch_frontier(self, frontier: List[int]) -> List[List[int]]:
+        # Longest-processing-time packing with cost = number of nodes in the SCC.
+        n_batches = min(self.workers, len(frontier))
+        batches: List[List[int]] = [[] for _ in range(n_batches)]
+        loads = [0] * n_batches
+        for pos in sorted(frontier, key=lambda p: -len(self.schedule[p])):
+            target = loads.index(min(loads))
+            batches[target].append(pos)
+            loads[target] += len(self.schedule[pos])
+        return [sorted(batch) for batch in batches if batch]
+
+    def _propose_batch(
+        self,
+        batch: List[int],
+        per_scc: Dict[int, GroupedIntents],
+        snapshot: Dict[Port, Any] | None,
+    ) -> None:
+        for pos in batch:
+            self._propose_scc(self._compiled_schedule[pos], per_scc[pos], snapshot)
+
+    def _run_node(self, record: NodeRecord, intents: GroupedIntents, snapshot: Dict[Port, Any] | None) -> None:
+        # port_state and var_state are never rebound, so only the per-tick fields change.
+        _, node, ctx, _ = record
+        ctx.intents = intents
+        ctx.snapshot = snapshot
         node.step(ctx)
 
     def _run_scc_loop(
         self,
-        scc: List[NodeId],
-        global_intents: List[Intent[Any]],
+        members: List[NodeRecord],
+        limit: int,
+        global_intents: GroupedIntents,
         snapshot: Dict[Port, Any] | None,
     ) -> None:
+        scc = [node_id for node_id, _, _, _ in members]
         prev_outputs: Dict[Port, Any] = {}
         working_vars: Dict[str, Any] = dict(self.var_state)
-        last_intents: List[Intent[Any]] = []
-        limit = self._scc_limit(scc)
+        last_intents: GroupedIntents = {}
+        port_state = self.port_state
+        # One context per node for the whole loop, bound to working_vars rather than
+        # var_state; each microstep only swaps in a fresh intents map.
+        contexts = [
+            (node, RuntimeIntentContext(node_id, port_state, working_vars, {}, snapshot), outputs)
+            for node_id, node, _, outputs in members
+        ]
         for _ in range(limit):
-            current_intents: List[Intent[Any]] = []
+            current_intents: GroupedIntents = {}
+            # working_vars only moves through the update loop below, so this flag alone
+            # decides convergence; no snapshot of the vars is needed.
             changed = False
-            before_vars = dict(working_vars)
-            
-            for node_id in scc:
-                self._run_node_with_state(node_id, current_intents, working_vars, snapshot)
-                
-                node = self.nodes[node_id]
-                for port in node.outputs.values():
-                    new_val = self.port_state.get(port, ABSENT)
-                    old_val = prev_outputs.get(port, ABSENT)
-                    
-                    if new_val != old_val:
+
+            for node, ctx, outputs in contexts:
+                ctx.intents = current_intents
+                node.step(ctx)
+                for port in outputs:
+                    new_val = port_state.get(port, ABSENT)
+                    if _differs(prev_outputs.get(port, ABSENT), new_val):
                         changed = True
                         prev_outputs[port] = new_val
-            
+
             updates = self._resolve_phase(current_intents)
             for name, val in updates.items():
-                prev_val = working_vars.get(name, ABSENT)
-                if prev_val != val:
+                if _differs(working_vars.get(name, ABSENT), val):
                     changed = True
                     working_vars[name] = val
-            
+
             last_intents = current_intents
-            if not changed and before_vars == working_vars:
-                global_intents.extend(last_intents)
+            if not changed:
+                _extend_grouped(global_intents, last_intents)
                 return
                 
         raise ZenoRuntimeError(f"Instantaneous loop {scc} exceeded {limit} microsteps without convergence.")
 
-    def _resolve_phase(self, intents: List[Intent[Any]]) -> Dict[str, Any]:
-        grouped: Dict[Variable[Any], List[Intent[Any]]] = defaultdict(list)
-        for intent in intents:
-            grouped[intent.variable].append(intent)
-            
+    def _resolve_phase(self, intents: GroupedIntents) -> Dict[str, Any]:
         updates: Dict[str, Any] = {}
-        
-        for var, var_intents in grouped.items():
-            merged_val = var.write_policy.merge(var_intents)
-            updates[var.name] = merged_val
-            
+        for var, group in intents.items():
+            policy = var.write_policy
+            if len(group) == 1 and policy.single_intent_is_value:
+                updates[var.name] = group[0].value
+            else:
+                updates[var.name] = policy.merge(group)
         return updates
 
     def _commit_phase(self, updates: Dict[str, Any]) -> None:
         self.var_state.update(updates)
 
-    def _scc_limit(self, scc: List[NodeId]) -> int:
-        limit = self.max_microsteps
+    def _reaction_limit(self, scc: List[NodeId]) -> Optional[int]:
+        limit: Optional[int] = None
         for node_id in scc:
             node = self.nodes[node_id]
             reactions = getattr(node, "reactions", None)
@@ -373,6 +520,6 @@ class GraphRuntime:
                 continue
             for reaction in reactions:
                 rank_limit = getattr(reaction, "nonzeno_limit", None)
-                if rank_limit is not None:
-                    limit = min(limit, rank_limit)
+                if rank_limit is not None and (limit is None or rank_limit < limit):
+                    limit = rank_limit
         return limit
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Generic, Optional, TypeVar
 
@@ -13,18 +13,35 @@ class Presence(Enum):
     PRESENT = "✓"
 
 
+# Integer mirrors of Presence, stored on V3.code for cheap comparisons in hot loops.
+P_BOTTOM = 0
+P_ABSENT = 1
+P_PRESENT = 2
+
+_PRESENCE_CODE = {
+    Presence.BOTTOM: P_BOTTOM,
+    Presence.ABSENT: P_ABSENT,
+    Presence.PRESENT: P_PRESENT,
+}
+
+
 @dataclass(frozen=True)
 class V3(Generic[T]):
     presence: Presence
     value: Optional[T] = None
+    code: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "code", _PRESENCE_CODE[self.presence])
     
+    # bottom() and absent() carry no value, and V3 is frozen, so they return shared instances.
     @classmethod
     def bottom(cls) -> V3[T]:
-        return cls(Presence.BOTTOM, None)
+        return _BOTTOM if cls is V3 else cls(Presence.BOTTOM, None)
     
     @classmethod
     def absent(cls) -> V3[T]:
-        return cls(Presence.ABSENT, None)
+        return _ABSENT if cls is V3 else cls(Presence.ABSENT, None)
     
     @classmethod
     def present(cls, val: T) -> V3[T]:
@@ -32,8 +49,12 @@ class V3(Generic[T]):
     
     @property
     def known(self) -> bool:
-        return self.presence == Presence.PRESENT
+        return self.code == P_PRESENT
     
     def is_bottom(self) -> bool:
-        return self.presence == Presence.BOTTOM
+        return self.code == P_BOTTOM
+
+
 
+_BOTTOM: V3 = V3(Presence.BOTTOM, None)
+_ABSENT: V3 = V3(Presence.ABSENT, None)
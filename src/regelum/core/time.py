@@ -1,3 +1,6 @@
+import heapq
+from typing import Any, Iterable, List, Optional, Tuple
+
 class Tag:
     def __init__(self, t: float, micro: int):
         self.t = t
@@ -23,3 +26,29 @@ class Tag:
     
     def __hash__(self):
         return hash((self.t, self.micro))
+
+
+class EventQueue:
+    """Min-heap of timestamped discrete events; events with equal time pop in push order."""
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._seq = 0
+
+    def push(self, t: float, event: Any = None) -> None:
+        heapq.heappush(self._heap, (t, self._seq, event))
+        self._seq += 1
+
+    def extend(self, events: Iterable[Tuple[float, Any]]) -> None:
+        for t, event in events:
+            self.push(t, event)
+
+    def pop(self) -> Tuple[float, Any]:
+        t, _, event = heapq.heappop(self._heap)
+        return t, event
+
+    def peek_time(self) -> Optional[float]:
+        return self._heap[0][0] if self._heap else None
+
+    def __len__(self) -> int:
+        return len(self._heap)
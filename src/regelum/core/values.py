@@ -1,9 +1,21 @@
 from typing import Any
 
+def _absorb(self, other): return self
+
 class AbsentType:
+    """
+    Arithmetic and ordering with ABSENT yield ABSENT, so `l + r` propagates absence
+    without an explicit check. Equality keeps identity semantics (ABSENT == ABSENT).
+    """
+    __array_ufunc__ = None  # numpy defers to the reflected dunders below instead of broadcasting.
+
     def __repr__(self): return "ABSENT"
     def __bool__(self): return False
 
+    __add__ = __radd__ = __sub__ = __rsub__ = _absorb
+    __mul__ = __rmul__ = __truediv__ = __rtruediv__ = _absorb
+    __lt__ = __le__ = __gt__ = __ge__ = _absorb
+
 ABSENT = AbsentType()
 
 def is_absent(val: Any) -> bool:
@@ -5,13 +5,23 @@ from .types import NodeId
 
 T = TypeVar("T")
 
-@dataclass
+@dataclass(slots=True)
 class Intent(Generic[T]):
     variable: "Variable[T]"
     producer: NodeId
     value: T
 
 class WritePolicy(ABC, Generic[T]):
+    # True when merge([intent]) is always intent.value; the runtime then resolves
+    # single-writer ticks without calling merge.
+    single_intent_is_value: bool = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # A subclass that redefines merge must opt back in explicitly.
+        if "merge" in cls.__dict__ and "single_intent_is_value" not in cls.__dict__:
+            cls.single_intent_is_value = False
+
     @abstractmethod
     def merge(self, intents: List[Intent[T]]) -> T:
         """Merge multiple intents into one value."""
@@ -27,6 +37,8 @@ class WritePolicy(ABC, Generic[T]):
         return False
 
 class ErrorPolicy(WritePolicy[T]):
+    single_intent_is_value = True
+
     def merge(self, intents: List[Intent[T]]) -> T:
         if len(intents) > 1:
             producers = [i.producer for i in intents]
@@ -54,6 +66,8 @@ class SumPolicy(WritePolicy[Any]):
         return True
 
 class LWWPolicy(WritePolicy[T]):
+    single_intent_is_value = True
+
     def __init__(self, priority_order: List[NodeId]):
         self.priority_map = {nid: i for i, nid in enumerate(priority_order)}
 
@@ -1,9 +1,21 @@
-from dataclasses import dataclass, field
-from typing import List, Dict, Set, Optional, Literal, Any
+import hashlib
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import cached_property
+from typing import List, Dict, Set, FrozenSet, Iterable, Optional, Literal, Any, Tuple
 from regelum.core.types import NodeId
 from regelum.core.dsl import Expr
 from regelum.core.contracts import Contract
 
+# Causality-graph vertex kinds, shared by lowering and CausalityPass.
+KIND_REACTION = 0
+KIND_PORT = 1
+KIND_VAR = 2
+
+# (kind, owner, member, is_delay): a read resolved to a variable (KIND_VAR, name, None, _)
+# or to a port of the reading node (KIND_PORT, node_id, port, False).
+ScopedRead = Tuple[int, str, Optional[str], bool]
+
+
 @dataclass
 class IRReaction:
     id: str
@@ -19,8 +31,20 @@ class IRReaction:
     python_method: Optional[Any] = None
     nonzeno_rank: Optional[str] = None
     nonzeno_limit: Optional[int] = None
+    # Filled by lowering (see `scope_reads`); None on hand-built IR.
+    scoped_reads: Optional[Tuple[ScopedRead, ...]] = None
 
-@dataclass
+    # Snapshots taken on first access and shared by every pass in a run; reactions are
+    # not mutated once lowered, so the cache stays valid.
+    @cached_property
+    def reads_vars_set(self) -> FrozenSet[str]:
+        return frozenset(self.reads_vars)
+
+    @cached_property
+    def writes_vars_set(self) -> FrozenSet[str]:
+        return frozenset(self.writes_vars)
+
+@dataclass(slots=True)
 class IRPort:
     name: str
     rate: Optional[int] = None
@@ -38,14 +62,14 @@ class IRNode:
     reactions: List[IRReaction] = field(default_factory=list)
     continuous_state_names: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class IREdge:
     src_node: NodeId
     src_port: str
     dst_node: NodeId
     dst_port: str
 
-@dataclass
+@dataclass(slots=True)
 class IRVariable:
     name: str
     policy: str
@@ -56,9 +80,127 @@ class IRVariable:
     is_delay_buffer: bool = False
     init_value: Any = None
 
+PortKey = tuple  # (node_id, port_name)
+
+
+def scope_reads(node_id: NodeId, reads_vars: Iterable[str], variables: Dict[str, "IRVariable"]) -> Tuple[ScopedRead, ...]:
+    """Classify a reaction's reads as IR variables or ports of its own node, in read order."""
+    scoped: List[ScopedRead] = []
+    for v in reads_vars:
+        var = variables.get(v)
+        if var is not None:
+            scoped.append((KIND_VAR, v, None, bool(var.is_delay_buffer)))
+        else:
+            scoped.append((KIND_PORT, node_id, v, False))
+    return tuple(scoped)
+
+
+@dataclass
+class EdgeIndex:
+    """
+    Edge-derived facts shared by compiler passes, built in one walk over `IRGraph.edges`.
+    Dict orders follow first occurrence in the edge list.
+    """
+    dst_counts: Dict[PortKey, int] = field(default_factory=dict)
+    port_direction: Dict[PortKey, str] = field(default_factory=dict)
+    adj_fwd: Dict[PortKey, List[PortKey]] = field(default_factory=dict)
+    ports_in_by_node: Dict[NodeId, Set[str]] = field(default_factory=dict)
+    ports_out_by_node: Dict[NodeId, Set[str]] = field(default_factory=dict)
+    delay_ports: Set[PortKey] = field(default_factory=set)
+
+    @classmethod
+    def build(cls, ir: "IRGraph") -> "EdgeIndex":
+        index = cls()
+        dst_counts = index.dst_counts
+        count_of = dst_counts.get
+        port_direction = index.port_direction
+        adj_fwd = index.adj_fwd
+        # One fused walk: fan-in counts, port directions and forwarding lists together.
+        for edge in ir.edges:
+            src = (edge.src_node, edge.src_port)
+            dst = (edge.dst_node, edge.dst_port)
+            dst_counts[dst] = count_of(dst, 0) + 1
+            port_direction[src] = "out"
+            port_direction[dst] = "in"
+            adj_fwd.setdefault(src, []).append(dst)
+
+        for (node_id, port_name), direction in port_direction.items():
+            by_node = index.ports_in_by_node if direction == "in" else index.ports_out_by_node
+            by_node.setdefault(node_id, set()).add(port_name)
+
+        for node_id, node in ir.nodes.items():
+            for r in node.reactions:
+                if r.has_delay_output and r.output_port:
+                    index.delay_ports.add((node_id, r.output_port))
+        return index
+
+
+_SCALARS = (type(None), bool, int, float, complex, str, bytes)
+
+
+def _digest(root: Any) -> str:
+    """
+    Stable blake2b digest of an IR value tree (dataclasses, containers, scalars, arrays).
+    Walks with an explicit stack so deep expression trees are fine. Dicts and lists are
+    hashed in order (it affects diagnostic order); sets are sorted by repr.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    update = h.update
+    stack: List[Any] = [root]
+    while stack:
+        obj = stack.pop()
+        t = type(obj)
+        if t in _SCALARS:
+            update(f"{t.__name__}:{obj!r};".encode())
+        elif t is list or t is tuple:
+            update(f"{t.__name__}[{len(obj)};".encode())
+            stack.extend(reversed(obj))
+        elif t is dict:
+            update(f"dict[{len(obj)};".encode())
+            for k, v in reversed(list(obj.items())):
+                stack.append(v)
+                stack.append(k)
+        elif t is set or t is frozenset:
+            update(f"set[{len(obj)};".encode())
+            stack.extend(sorted(obj, key=repr, reverse=True))
+        elif is_dataclass(obj) and not isinstance(obj, type):
+            update(f"{t.__qualname__}(;".encode())
+            stack.extend(reversed([getattr(obj, f.name) for f in fields(obj)]))
+        elif hasattr(obj, "tobytes"):
+            update(f"{t.__name__}:{getattr(obj, 'dtype', '')}:{getattr(obj, 'shape', '')};".encode())
+            update(obj.tobytes())
+        else:
+            update(f"{t.__qualname__}:{obj!r};".encode())
+    return h.hexdigest()
+
+
 @dataclass
 class IRGraph:
     nodes: Dict[NodeId, IRNode] = field(default_factory=dict)
     edges: List[IREdge] = field(default_factory=list)
     variables: Dict[str, IRVariable] = field(default_factory=dict)
     config: Dict[str, Any] = field(default_factory=dict)
+
+    def fingerprint(self) -> str:
+        """
+        Content digest of nodes, edges, variables and config, memoized on the instance.
+        """
+        fp = self.__dict__.get("_fingerprint")
+        if fp is None:
+            fp = _digest((self.nodes, self.edges, self.variables, self.config))
+            self.__dict__["_fingerprint"] = fp
+        return fp
+
+    @property
+    def edge_index(self) -> EdgeIndex:
+        """Lazily built EdgeIndex; dropped by `invalidate()`."""
+        index = self.__dict__.get("_edge_index")
+        if index is None:
+            index = EdgeIndex.build(self)
+            self.__dict__["_edge_index"] = index
+        return index
+
+    def invalidate(self) -> None:
+        """Drop derived data (fingerprint, edge index) after the graph was mutated."""
+        self.__dict__.pop("_fingerprint", None)
+        self.__dict__.pop("_edge_index", None)
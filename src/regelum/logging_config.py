@@ -11,11 +11,12 @@ from loguru import logger
 _CONFIGURED = False
 
 
-def _level_filter(level: str) -> Callable[[dict], bool]:
-    def _filter(record: dict) -> bool:
-        return record["level"].name == level
+_NO = {"DEBUG": 10, "INFO": 20}
 
-    return _filter
+
+def _level_filter(*levels: str) -> Callable[[dict], bool]:
+    nos = frozenset(_NO[level] for level in levels)
+    return lambda record: record["level"].no in nos
 
 
 def configure_logging(
@@ -24,28 +25,30 @@ def configure_logging(
     environment: str = os.getenv("RG_ENV", "dev"),
 ) -> None:
     """
-    Configure Loguru sinks:
-      • logs/YYYY-MM-DD/debug.json
-      • logs/YYYY-MM-DD/info.json
-      • logs/YYYY-MM-DD/error.json
+    Configure Loguru sinks.
+    Default: a single stderr sink (no serialization, no queue).
+    With RG_ENABLE_FILE_LOGS=1 (and RG_DISABLE_FILE_LOGS unset), JSON lines are also written to:
+      • logs/YYYY-MM-DD/debug.json  (DEBUG and INFO records, one serialization per record)
+      • logs/YYYY-MM-DD/error.json  (ERROR and above)
     All files are JSON lines with mandatory metadata fields.
     """
     global _CONFIGURED
     if _CONFIGURED:
         return
 
-    if os.getenv("RG_DISABLE_FILE_LOGS") == "1":
+    extra = {
+        "service": service,
+        "version": version,
+        "env": environment,
+        "request_id": None,
+        "user_id": None,
+    }
+
+    file_logs = os.getenv("RG_ENABLE_FILE_LOGS") == "1" and os.getenv("RG_DISABLE_FILE_LOGS") != "1"
+    if not file_logs:
         logger.remove()
         logger.add(sys.stderr, level="INFO", colorize=sys.stderr.isatty(), enqueue=False)
-        logger.configure(
-            extra={
-                "service": service,
-                "version": version,
-                "env": environment,
-                "request_id": None,
-                "user_id": None,
-            }
-        )
+        logger.configure(extra=extra)
         _CONFIGURED = True
         return
 
@@ -58,39 +61,24 @@ def configure_logging(
         "serialize": True,
         "rotation": "10 MB",
         "retention": "30 days",
-        "enqueue": True,
+        "enqueue": False,
     }
 
     logger.add(
         day_dir / "debug.json",
         level="DEBUG",
-        filter=_level_filter("DEBUG"),
-        **common_kwargs,
-    )
-    logger.add(
-        day_dir / "info.json",
-        level="INFO",
-        filter=_level_filter("INFO"),
+        filter=_level_filter("DEBUG", "INFO"),
         **common_kwargs,
     )
     logger.add(
         day_dir / "error.json",
         level="ERROR",
-        filter=_level_filter("ERROR"),
         **common_kwargs,
     )
 
     if sys.stderr.isatty():
-        logger.add(sys.stderr, level="INFO", colorize=True, enqueue=True)
-
-    logger.configure(
-        extra={
-            "service": service,
-            "version": version,
-            "env": environment,
-            "request_id": None,
-            "user_id": None,
-        }
-    )
+        logger.add(sys.stderr, level="INFO", colorize=True, enqueue=False)
+
+    logger.configure(extra=extra)
 
     _CONFIGURED = True
@@ -1,7 +1,11 @@
+import threading
+
 import pytest
 from typing import Any
 from regelum.core.node import RawNode, Context
-from regelum.core.runtime import GraphRuntime
+from regelum.core.runtime import GraphRuntime, RuntimeIntentContext
+from regelum.core.values import ABSENT
+from regelum.core.variables import Variable, LWWPolicy
 
 class AdderNode(RawNode):
     def __init__(self, node_id: str, val: int = 1):
@@ -153,3 +157,178 @@ def test_cycle_detection():
     assert "A" in scc
     assert "B" in scc
 
+
+def test_parallel_frontiers_match_serial():
+    # A fans out to many independent adders that all feed a sink chain.
+    def build(workers: int):
+        runtime = GraphRuntime()
+        runtime.workers = workers
+        src = SourceNode("A", start_val=10)
+        runtime.add_node(src)
+        adders = [AdderNode(f"B{i}", val=i) for i in range(8)]
+        for adder in adders:
+            runtime.add_node(adder)
+            runtime.connect(src.output, adder.input)
+        sinks = [SinkNode(f"C{i}") for i in range(8)]
+        for adder, sink in zip(adders, sinks):
+            runtime.add_node(sink)
+            runtime.connect(adder.output, sink.input)
+        runtime.build_schedule()
+        return runtime, sinks
+
+    serial, serial_sinks = build(1)
+    parallel, parallel_sinks = build(4)
+
+    assert [len(f) for f in parallel.frontiers] == [1, 8, 8]
+
+    for _ in range(3):
+        serial.run_tick()
+        parallel.run_tick()
+        assert [s.last_received for s in parallel_sinks] == [s.last_received for s in serial_sinks]
+
+    with parallel:
+        parallel.run_tick()
+        assert parallel._executor is not None
+    assert parallel._executor is None
+    assert not any(t.name.startswith("rg-tick") for t in threading.enumerate())
+
+
+def test_parallel_frontiers_merge_intents_in_schedule_order():
+    # b (level 1) and z (level 0) tie on an LWW variable, so the first proposal wins;
+    # the serial schedule [A, B, Z] proposes b before z.
+    shared = Variable("shared", None, LWWPolicy(priority_order=[]))
+
+    class Writer(RawNode):
+        def __init__(self, node_id: str):
+            super().__init__(node_id)
+            self.input = self.add_input("in")
+
+        def step(self, ctx: Context) -> None:
+            ctx.write_var(shared, self.id)
+
+    def build(workers: int) -> GraphRuntime:
+        runtime = GraphRuntime()
+        runtime.workers = workers
+        a, b, z = SourceNode("A"), Writer("B"), Writer("Z")
+        for n in [a, b, z]:
+            runtime.add_node(n)
+        runtime.connect(a.output, b.input)
+        runtime.build_schedule()
+        return runtime
+
+    serial, parallel = build(1), build(2)
+    assert serial.schedule == [["A"], ["B"], ["Z"]]
+    assert parallel.frontiers == [[0, 2], [1]]
+
+    with parallel:
+        serial.run_tick()
+        parallel.run_tick()
+    assert serial.var_state["shared"] == parallel.var_state["shared"] == "B"
+
+
+def test_compiled_schedule_marks_self_loops():
+    runtime = GraphRuntime()
+    a = SourceNode("A")
+    b = AdderNode("B")
+    loop = AdderNode("L")
+    for n in [a, b, loop]:
+        runtime.add_node(n)
+    runtime.connect(a.output, b.input)
+    runtime.connect(loop.output, loop.input)
+    runtime.build_schedule()
+
+    plans = {members[0][0]: singleton for singleton, members, _ in runtime._compiled_schedule}
+    assert plans == {"A": True, "B": True, "L": False}
+    assert [[record[0] for record in members] for _, members, _ in runtime._compiled_schedule] == runtime.schedule
+
+
+def test_build_schedule_handles_deep_chains():
+    # Deeper than the default recursion limit.
+    runtime = GraphRuntime()
+    prev = SourceNode("S")
+    runtime.add_node(prev)
+    port = prev.output
+    for i in range(3000):
+        node = AdderNode(f"N{i}")
+        runtime.add_node(node)
+        runtime.connect(port, node.input)
+        port = node.output
+    runtime.build_schedule()
+    runtime.run_tick()
+
+    assert [scc[0] for scc in runtime.schedule] == ["S"] + [f"N{i}" for i in range(3000)]
+    assert runtime.port_state[port] == 3000
+
+
+def test_port_reads_follow_latest_connection_and_defaults():
+    runtime = GraphRuntime()
+    a = SourceNode("A", start_val=1)
+    b = SourceNode("B", start_val=7)
+    sink = SinkNode("S")
+    idle = SinkNode("I")
+    for n in [a, b, sink, idle]:
+        runtime.add_node(n)
+    fallback = idle.add_input("fallback", default=5)
+    runtime.connect(a.output, sink.input)
+    runtime.connect(b.output, sink.input)
+    runtime.build_schedule()
+    runtime.run_tick()
+
+    assert sink.last_received == 7
+    assert idle.last_received is ABSENT
+    ctx = RuntimeIntentContext("I", runtime.port_state, runtime.var_state, {})
+    assert ctx.read(fallback) == 5
+
+    # Port wiring follows runtime.edges as of the last build, however they were edited.
+    runtime.edges[sink.input].pop()
+    runtime.build_schedule()
+    runtime.run_tick()
+    assert sink.last_received == a.val - 1
+    del runtime.edges[sink.input]
+    runtime.build_schedule()
+    runtime.run_tick()
+    assert sink.last_received is ABSENT
+
+
+def test_scc_loop_converges_on_array_outputs():
+    np = pytest.importorskip("numpy")
+
+    class ArrayNode(RawNode):
+        def __init__(self, node_id: str):
+            super().__init__(node_id)
+            self.input = self.add_input("in")
+            self.output = self.add_output("out")
+
+        def step(self, ctx: Context) -> None:
+            ctx.read(self.input)
+            ctx.write(self.output, np.ones(3))  # Fresh array every microstep.
+
+    runtime = GraphRuntime()
+    a, b = ArrayNode("A"), ArrayNode("B")
+    runtime.add_node(a)
+    runtime.add_node(b)
+    runtime.connect(a.output, b.input)
+    runtime.connect(b.output, a.input)
+    runtime.build_schedule()
+    runtime.run_tick()
+
+    assert np.array_equal(runtime.port_state[b.output], np.ones(3))
+
+
+def test_port_default_changed_after_wiring_is_honoured():
+    runtime = GraphRuntime()
+    silent = SinkNode("Silent")  # Has no outputs written: its consumers see ABSENT.
+    silent.out = silent.add_output("out")
+    sink = SinkNode("S")
+    idle = SinkNode("I")
+    for n in [silent, sink, idle]:
+        runtime.add_node(n)
+    runtime.connect(silent.out, sink.input)
+    runtime.build_schedule()
+
+    sink.input.default = 4
+    idle.input.default = 9
+    runtime.run_tick()
+
+    assert sink.last_received == 4
+    assert idle.last_received == 9
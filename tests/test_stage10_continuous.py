@@ -87,6 +87,22 @@ def test_step_respects_max_step():
         runtime.step(0.01)
 
 
+def test_step_and_snapshot_matches_separate_queries():
+    node = DrivenNode("driven")
+    runtime = ContinuousRuntime()
+    runtime.add_node(node)
+
+    state, y = runtime.step_and_snapshot(node.id, 0.01, {"u": 2.0})
+    assert state == runtime.get_state(node.id)
+    assert y == runtime.outputs(node.id)
+    assert state["x"] == pytest.approx(0.02)
+
+    state, y = runtime.step_and_snapshot(node.id, 0.0, {"u": 5.0})
+    assert runtime.t == pytest.approx(0.01)
+    assert runtime.last_inputs[node.id] == {"u": 5.0}
+    assert y == {"x": pytest.approx(0.02)}
+
+
 def test_continuous_pass_accepts_wrapper():
     wrapper = ContinuousWrapper("cw", DecayNode("inner"), default_dt=0.01)
     pipe = Pipeline(mode="strict")
@@ -129,3 +145,29 @@ def test_wrapper_applies_control_input():
     pipe.run(ticks=10, inputs={wrapper.i.u: {"u": 2.0}})
     assert sink.last is not None
     assert sink.last.get("x") == pytest.approx(2.0, rel=1e-2)
+
+
+def test_run_events_propagates_between_events():
+    wrapper = ContinuousWrapper("cw_events", DecayNode("inner_events"), default_dt=0.01)
+    pipe = Pipeline(mode="strict")
+    pipe.add(wrapper)
+    pipe.events.extend([(0.5, None), (1.0, None)])
+
+    pipe.run_events()
+
+    expected = math.exp(-1.5 * 1.0)
+    assert pipe.runtime.current_time == pytest.approx(1.0)
+    assert pipe.runtime.port_state[wrapper.state_out]["x"] == pytest.approx(expected, abs=1e-6)
+    assert len(pipe.events) == 0
+
+
+def test_run_events_stops_at_horizon():
+    wrapper = ContinuousWrapper("cw_horizon", DecayNode("inner_horizon"), default_dt=0.01)
+    pipe = Pipeline(mode="strict")
+    pipe.add(wrapper)
+    pipe.events.extend([(0.2, None), (2.0, None)])
+
+    pipe.run_events(until=1.0)
+
+    assert pipe.runtime.current_time == pytest.approx(0.2)
+    assert len(pipe.events) == 1
@@ -100,3 +100,35 @@ def test_hybrid_pipeline_injects_global_dt():
     final_x = sink.last.get("x")
     assert final_x == pytest.approx(1.0, rel=1e-3, abs=1e-4)
     assert pipe.runtime.current_time == pytest.approx(1.0, rel=1e-9)
+
+
+class GatedSource(RawNode):
+    def __init__(self, node_id: str):
+        super().__init__(node_id)
+        self.out = self.add_output("out")
+        self.value: float | None = None
+
+    def step(self, ctx: Context) -> None:
+        if self.value is not None:
+            ctx.write(self.out, self.value)
+
+
+def test_zoh_holds_across_silent_upstream():
+    src = GatedSource("gate")
+    # No default on the input, so a silent upstream reaches the hold as ABSENT.
+    zoh = ZeroOrderHold("zoh_hold", init=None)
+    pipe = Pipeline(mode="pragmatic")
+    pipe.add(src, zoh)
+    src.o.out >> zoh.i.inp
+
+    src.value = 1.0
+    pipe.run(ticks=3)
+    assert pipe.runtime.port_state[zoh.out] == 1.0
+
+    src.value = None
+    pipe.run(ticks=3)
+    assert pipe.runtime.port_state[zoh.out] == 1.0
+
+    src.value = 3.0
+    pipe.run(ticks=1)
+    assert pipe.runtime.port_state[zoh.out] == 3.0
@@ -48,3 +48,15 @@ def test_pipeline_facade():
     pipe.run(ticks=1)
     
     assert pipe.runtime.port_state[n2.outputs["out"]] == 2
+
+def test_recompile_reuses_compiler_and_sees_default_changes():
+    pipe = Pipeline(mode="pragmatic")
+    n1 = IncSafe("N1")
+    pipe.add(n1)
+
+    assert pipe.compile()
+    compiler = pipe._compiler
+    n1.inputs["inp"].default = None
+    assert not pipe.compile()
+    assert pipe._compiler is compiler
+    assert "STRUCT001" in [d.code for d in pipe.report.diagnostics]
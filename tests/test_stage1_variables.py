@@ -105,3 +105,22 @@ def test_lww_policy():
     # W1 wins
     assert runtime2.var_state["last2"] == 100
 
+
+
+def test_single_writer_fast_path_respects_overridden_merge():
+    class DoublingPolicy(ErrorPolicy[int]):
+        def merge(self, intents):
+            return 2 * super().merge(intents)
+
+    assert ErrorPolicy.single_intent_is_value
+    assert not DoublingPolicy.single_intent_is_value
+
+    plain = Variable("plain", 0, ErrorPolicy())
+    doubled = Variable("doubled", 0, DoublingPolicy())
+    runtime = GraphRuntime()
+    runtime.add_node(VarWriterNode("W1", plain, 5))
+    runtime.add_node(VarWriterNode("W2", doubled, 5))
+    runtime.build_schedule()
+    runtime.run_tick()
+
+    assert runtime.var_state == {"plain": 5, "doubled": 10}
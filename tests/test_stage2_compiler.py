@@ -94,3 +94,284 @@ def test_structural_pass_connected():
     assert result2.success
     assert len(result2.diagnostics) == 0
 
+
+
+def test_sharded_local_passes_match_sequential():
+    runtime = GraphRuntime()
+    nodes = [SimpleNode(f"N{i}") for i in range(12)]
+    for n in nodes:
+        runtime.add_node(n)
+    for i in range(0, 10, 2):
+        runtime.connect(nodes[i].output, nodes[i + 1].input)
+    runtime.connect(nodes[0].output, nodes[11].input)
+    runtime.connect(nodes[2].output, nodes[11].input)
+
+    def diagnostics(workers):
+        compiler = CompilerPipeline(CompilerConfig(max_workers=workers))
+        compiler.add_pass(StructuralPass())
+        ir = compiler.build_ir(runtime)
+        res = compiler.run_passes(ir)
+        return res.success, sorted((d.code, d.message) for d in res.diagnostics)
+
+    sequential = diagnostics(1)
+    assert not sequential[0]
+    assert any(code == "STRUCT002" for code, _ in sequential[1])
+    assert diagnostics(4) == sequential
+
+    compiler = CompilerPipeline(CompilerConfig(max_workers=4))
+    shards = compiler.shard_ir(compiler.build_ir(runtime), 4)
+    assert len(shards) <= 4
+    assert sum(len(s.nodes) for s in shards) == 12
+    assert sum(len(s.edges) for s in shards) == 7
+
+
+def test_readonly_passes_run_concurrently_in_pass_order():
+    import threading
+    from regelum.compiler.pipeline import Pass
+
+    seen = []
+
+    class Probe(Pass):
+        readonly = True
+
+        def __init__(self, code):
+            self.name = code
+
+        def run(self, ir, diag):
+            seen.append(threading.current_thread().name)
+            diag.warning(self.name, self.name)
+
+    compiler = CompilerPipeline(CompilerConfig(max_workers=3))
+    for code in ("P1", "P2", "P3"):
+        compiler.add_pass(Probe(code))
+    res = compiler.run_passes(compiler.build_ir(GraphRuntime()))
+    assert [d.code for d in res.diagnostics] == ["P1", "P2", "P3"]
+    assert threading.main_thread().name not in seen
+
+
+def test_local_passes_shard_inside_readonly_groups():
+    from regelum.compiler.pipeline import Pass
+
+    class Recorder(Pass):
+        readonly = True
+
+        def __init__(self, name, is_local):
+            self.name = name
+            self.is_local = is_local
+            self.graphs = []
+
+        def run(self, ir, diag):
+            self.graphs.append(sorted(ir.nodes))
+
+    runtime = GraphRuntime()
+    for i in range(8):
+        runtime.add_node(SimpleNode(f"N{i}"))
+    local, whole = Recorder("local", True), Recorder("whole", False)
+    compiler = CompilerPipeline(CompilerConfig(max_workers=2))
+    compiler.add_pass(local)
+    compiler.add_pass(whole)
+    assert compiler.run_passes(compiler.build_ir(runtime)).success
+
+    assert len(local.graphs) == 2
+    assert sorted(n for g in local.graphs for n in g) == [f"N{i}" for i in range(8)]
+    assert whole.graphs == [[f"N{i}" for i in range(8)]]
+
+def test_cached_passes_replay_diagnostics_for_unchanged_ir(monkeypatch):
+    from regelum.compiler.passes import CausalityPass
+
+    runtime = GraphRuntime()
+    a, b = SimpleNode("A"), SimpleNode("B")
+    runtime.add_node(a)
+    runtime.add_node(b)
+    runtime.connect(a.output, b.input)
+    runtime.connect(b.output, a.input)
+
+    CausalityPass.clear_cache()
+    compiler = CompilerPipeline(CompilerConfig())
+    compiler.add_pass(CausalityPass())
+    first = compiler.run_passes(compiler.build_ir(runtime))
+    assert [d.code for d in first.diagnostics] == ["CAUS001"]
+
+    calls = []
+    monkeypatch.setattr(CausalityPass, "analyze", lambda self, ir, diag: calls.append(ir))
+    second = compiler.run_passes(compiler.build_ir(runtime))
+    assert calls == []
+    assert [d.code for d in second.diagnostics] == ["CAUS001"]
+
+    ir = compiler.build_ir(runtime)
+    ir.config["mode"] = "strict"
+    compiler.run_passes(ir)
+    assert len(calls) == 1
+
+
+def test_fused_node_local_pass_matches_separate_passes():
+    from regelum.ir.graph import IRGraph, IRNode, IRReaction, IRVariable
+    from regelum.compiler.pipeline import DiagnosticSink
+    from regelum.compiler.passes import ContinuousPass, FusedNodeLocalPass, InitPass, NonZenoPass
+
+    ir = IRGraph(config={"mode": "strict"})
+    ir.variables["N.x"] = IRVariable(name="N.x", policy="ErrorPolicy", has_init=False)
+    loop = IRReaction(id="r", reads_vars={"N.x"}, writes_vars={"N.x"})
+    ir.nodes["N"] = IRNode(id="N", kind="Core", reactions=[loop])
+    ir.nodes["C"] = IRNode(id="C", kind="Continuous", outputs={"state": "Any"})
+
+    separate = DiagnosticSink()
+    for p in (InitPass(), NonZenoPass(), ContinuousPass()):
+        p.run(ir, separate)
+    fused = DiagnosticSink()
+    FusedNodeLocalPass().run(ir, fused)
+
+    codes = sorted(d.code for d in separate.diagnostics)
+    assert codes == ["CT001", "INIT001", "ZEN001"]
+    assert sorted(d.code for d in fused.diagnostics) == codes
+
+
+def test_lazy_diagnostics_format_on_read():
+    from regelum.compiler.pipeline import DiagnosticSink
+
+    class Loud:
+        rendered = 0
+
+        def __str__(self):
+            Loud.rendered += 1
+            return "loud"
+
+    diag = DiagnosticSink()
+    diag.warning_lazy("W1", "value {} is {}", Loud(), 3, location="X")
+    assert not diag.has_errors()
+    diag.error_lazy("E1", "broken {}", Loud())
+    assert diag.has_errors()
+    assert Loud.rendered == 0
+
+    messages = [d.message for d in diag.diagnostics]
+    assert messages == ["value loud is 3", "broken loud"]
+    assert diag.diagnostics[0].severity == DiagnosticSeverity.WARNING
+    assert Loud.rendered == 2
+
+def test_expr_vars_is_memoized_per_ast():
+    from regelum.compiler.expr_utils import clear_expr_vars_cache, expr_vars
+    from regelum.core.dsl import Var
+
+    expr = Var("a") + Var("b") * Var("a")
+    first = expr_vars(expr)
+    assert first == frozenset({"a", "b"})
+    assert expr_vars(expr) is first
+    clear_expr_vars_cache()
+    assert expr_vars(expr) is not first
+
+def test_expr_vars_survive_recompiles_and_die_with_the_ast():
+    import gc
+    from regelum.compiler import expr_utils
+    from regelum.core.core_node import CoreNode, Input, Output, reaction
+    from regelum.core.dsl import Var
+
+    class Adder(CoreNode):
+        x = Input[float]()
+        out = Output[float]()
+
+        @reaction
+        def add(self, x):
+            return x + 1.0
+
+    runtime = GraphRuntime()
+    runtime.add_node(Adder("A"))
+    compiler = CompilerPipeline(CompilerConfig())
+    compiler.build_ir(runtime)
+    ast = runtime.nodes["A"].reactions[0].ast
+    cached = expr_utils.expr_vars(ast)
+    compiler.build_ir(runtime)
+    assert expr_utils.expr_vars(ast) is cached
+
+    before = len(expr_utils._EXPR_VARS_CACHE)
+    expr_utils.expr_vars(Var("tmp") + Var("other"))
+    gc.collect()
+    assert len(expr_utils._EXPR_VARS_CACHE) == before
+
+def test_narrow_pass_fingerprints_ignore_unrelated_edits(monkeypatch):
+    from regelum.ir.graph import IRVariable
+
+    runtime = GraphRuntime()
+    a, b = SimpleNode("A"), SimpleNode("B")
+    runtime.add_node(a)
+    runtime.add_node(b)
+    runtime.connect(a.output, b.input)
+
+    StructuralPass.clear_cache()
+    compiler = CompilerPipeline(CompilerConfig())
+    compiler.add_pass(StructuralPass())
+    first = compiler.run_passes(compiler.build_ir(runtime))
+
+    calls = []
+    monkeypatch.setattr(StructuralPass, "analyze", lambda self, ir, diag: calls.append(ir))
+    ir = compiler.build_ir(runtime)
+    ir.variables["unrelated"] = IRVariable(name="unrelated", policy="LWWPolicy")
+    second = compiler.run_passes(ir)
+    assert calls == []
+    assert [d.code for d in second.diagnostics] == [d.code for d in first.diagnostics] == ["STRUCT001"]
+
+def test_diagnostic_cap_drops_warnings_and_stops_after_errors():
+    from regelum.compiler.pipeline import Pass
+
+    ran = []
+
+    class Noisy(Pass):
+        def __init__(self, name, error):
+            self.name = name
+            self.error = error
+
+        def run(self, ir, diag):
+            ran.append(self.name)
+            for i in range(5):
+                diag.warning("W", f"{self.name} {i}")
+            if self.error:
+                diag.error("E", self.name)
+
+    compiler = CompilerPipeline(CompilerConfig(max_diagnostics=3))
+    compiler.add_pass(Noisy("first", error=True))
+    compiler.add_pass(Noisy("second", error=False))
+    res = compiler.run_passes(compiler.build_ir(GraphRuntime()))
+
+    assert ran == ["first"]
+    assert [d.code for d in res.diagnostics] == ["W", "W", "W", "E", "DIAG001"]
+    assert "2 further warning(s)" in res.diagnostics[-1].message
+    assert not res.success
+
+def test_build_ir_reuses_unchanged_core_nodes_and_edges():
+    from regelum.core.core_node import CoreNode, Input, Output, reaction
+
+    class Gain(CoreNode):
+        x = Input[float]()
+        out = Output[float]()
+
+        @reaction
+        def scale(self, x):
+            return x * 2.0
+
+    runtime = GraphRuntime()
+    a, b, sink = Gain("A"), Gain("B"), SimpleNode("S")
+    for node in (a, b, sink):
+        runtime.add_node(node)
+    runtime.connect(a.outputs["out"], b.inputs["x"])
+    compiler = CompilerPipeline(CompilerConfig())
+
+    first = compiler.build_ir(runtime)
+    second = compiler.build_ir(runtime)
+    assert second.nodes["A"] is first.nodes["A"]
+    assert second.variables == first.variables
+    assert second.edges == first.edges and second.edges is not first.edges
+
+    b.add_input("extra")
+    runtime.connect(b.outputs["out"], sink.input)
+    third = compiler.build_ir(runtime)
+    assert third.nodes["A"] is first.nodes["A"]
+    assert third.nodes["B"] is not first.nodes["B"] and "extra" in third.nodes["B"].inputs
+    assert len(third.edges) == 2
+
+    # Defaults, inits and policies can be reassigned without a structural change.
+    a.inputs["x"].default = 1.0
+    fourth = compiler.build_ir(runtime)
+    assert fourth.nodes["A"] is not first.nodes["A"]
+    assert fourth.nodes["A"].input_meta["x"].has_default
+    assert fourth.nodes["B"] is third.nodes["B"]
+    a.inputs["x"].default = None
+    assert not compiler.build_ir(runtime).nodes["A"].input_meta["x"].has_default
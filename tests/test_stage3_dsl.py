@@ -117,3 +117,28 @@ class OrderedReactionsNode(CoreNode):
 def test_reactions_preserve_declaration_order():
     node = OrderedReactionsNode("Order")
     assert [r.name for r in node.reactions] == ["first", "second"]
+
+
+def test_eval_expr_handles_deep_trees_without_recursion():
+    from regelum.core.dsl import Var, Const
+    from regelum.core.interpreter import eval_expr
+
+    expr = Var("x")
+    for _ in range(5000):
+        expr = expr + Const(1)
+    assert eval_expr(expr, {"x": 0}) == 5000
+
+
+def test_expr_nodes_are_slotted_frozen_and_interned():
+    import dataclasses
+    from regelum.core.dsl import BinOp, Cmp, Var
+
+    x, y = Var("x"), Var("y")
+    total = x + y
+    assert total is x + y
+    assert total is not y + x
+    assert not hasattr(total, "__dict__")
+    assert isinstance(x == y, Cmp) and isinstance(total, BinOp)
+    assert len({x, y, total}) == 3
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        total.op = "-"
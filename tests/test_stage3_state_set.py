@@ -53,3 +53,19 @@ def test_state_isolation():
     
     assert runtime.var_state["N1.val"] == 10
     assert runtime.var_state["N2.val"] == 20
+
+
+def test_specialized_step_matches_generic_step():
+    def run(step_of):
+        runtime = GraphRuntime()
+        nodes = [InputStateNode("N1"), ExplicitStateNode("N2")]
+        for node in nodes:
+            node.step = step_of(node)
+            runtime.add_node(node)
+        runtime.build_schedule()
+        for value in (10, 20, 5):
+            runtime.run_tick(inputs={nodes[0].inputs["inp"]: value})
+        return dict(runtime.var_state), {(p.node_id, p.name): v for p, v in runtime.port_state.items()}
+
+    assert run(lambda node: node.step) == run(lambda node: CoreNode.step.__get__(node))
+    assert InputStateNode("A").step.__code__ is InputStateNode("B").step.__code__
@@ -66,3 +66,19 @@ def test_write_conflict_pass_manual():
     assert d.code == "WRITE001"
     assert "Multiple writers" in d.message
 
+
+def test_write_conflict_ignores_duplicate_writes_within_one_reaction():
+    from regelum.ir.graph import IRGraph, IRNode
+
+    ir = IRGraph()
+    ir.variables["v1"] = IRVariable(name="v1", policy="ErrorPolicy")
+    r1 = IRReaction(id="r1", writes_vars=["v1", "v1"])
+    ir.nodes["N1"] = IRNode(id="N1", kind="Core", reactions=[r1])
+
+    compiler = CompilerPipeline(CompilerConfig())
+    compiler.add_pass(WriteConflictPass())
+    result = compiler.run_passes(ir)
+
+    assert result.success
+    assert r1.writes_vars_set == frozenset({"v1"})
+    assert r1.writes_vars_set is r1.writes_vars_set
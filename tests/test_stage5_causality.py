@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from regelum.core.dsl import If, Const, Var, BinOp
 from regelum.core.ternary import V3
 from regelum.core.interpreter import eval_expr_3val
@@ -65,3 +66,100 @@ def test_causality_pass_no_cycle():
     
     assert len(diag.diagnostics) == 0
 
+
+def test_tarjan_handles_long_chains_and_cycles():
+    n = 20000
+    vertices = list(range(n))
+    adj = [[i + 1] for i in range(n - 1)] + [[]]
+    sccs = CausalityPass()._tarjan(vertices, adj)
+    assert len(sccs) == n
+
+    adj[vertices[-1]] = [vertices[0]]
+    sccs = CausalityPass()._tarjan(vertices, adj)
+    assert len(sccs) == 1
+    assert sorted(sccs[0]) == sorted(vertices)
+
+def test_csr_adjacency_preserves_arc_order():
+    from regelum.compiler.passes import _CSR
+
+    arcs = [(2, 0), (0, 1), (2, 1), (0, 2), (3, 3)]
+    csr = _CSR.from_arcs(4, arcs)
+    assert [list(csr[v]) for v in range(len(csr))] == [[1, 2], [], [0, 1], [3]]
+    sccs = CausalityPass()._tarjan(list(range(4)), csr)
+    assert sorted(sorted(c) for c in sccs) == [[0, 2], [1], [3]]
+
+    # Only the subgraph induced by the given vertices is searched.
+    sccs = CausalityPass()._tarjan([0, 2], csr)
+    assert sorted(sorted(c) for c in sccs) == [[0, 2]]
+
+def test_kahn_residual_is_empty_for_dags_and_covers_cycles():
+    from regelum.compiler.passes import _CSR
+
+    dag = _CSR.from_arcs(4, [(0, 1), (1, 2), (0, 3)])
+    assert CausalityPass._cyclic_residual(dag) == []
+
+    cyclic = _CSR.from_arcs(5, [(0, 1), (1, 2), (2, 1), (2, 3), (4, 4)])
+    assert CausalityPass._cyclic_residual(cyclic) == [1, 2, 3, 4]
+
+def test_trim_sinks_keeps_cycles_and_bridges_between_them():
+    from regelum.compiler import _causality_native as native
+    from regelum.compiler.passes import _CSR
+
+    cyclic = _CSR.from_arcs(5, [(0, 1), (1, 2), (2, 1), (2, 3), (4, 4)])
+    residual = CausalityPass._cyclic_residual(cyclic)
+    assert native.trim_sinks(residual, cyclic.offsets, cyclic.neighbors) == [1, 2, 4]
+
+    bridged = _CSR.from_arcs(6, [(0, 1), (1, 0), (1, 2), (2, 3), (3, 4), (4, 3), (4, 5)])
+    residual = CausalityPass._cyclic_residual(bridged)
+    assert native.trim_sinks(residual, bridged.offsets, bridged.neighbors) == [0, 1, 2, 3, 4]
+
+def _core_var_cycle(x_expr):
+    from regelum.ir.graph import IRVariable
+
+    ir = IRGraph()
+    for name in ("N.x", "N.y"):
+        ir.variables[name] = IRVariable(name=name, policy="LWWPolicy", has_init=False, is_monotone=True)
+    r1 = IRReaction(id="r1", reads_vars={"N.y"}, writes_vars={"N.x"}, explicit_writes={"N.x": x_expr})
+    r2 = IRReaction(id="r2", reads_vars={"N.x"}, writes_vars={"N.y"}, explicit_writes={"N.y": Var("x")})
+    ir.nodes["N"] = IRNode(id="N", kind="Core", reactions=[r1, r2])
+    return ir
+
+def test_constructive_check_without_information_sources():
+    diag = DiagnosticSink()
+    CausalityPass().run(_core_var_cycle(Var("y")), diag)
+    assert [d.code for d in diag.diagnostics] == ["CAUS003"]
+
+    diag = DiagnosticSink()
+    CausalityPass().run(_core_var_cycle(If(Var("y"), Const(1), Const(1))), diag)
+    assert diag.diagnostics == []
+
+def test_array_tarjan_kernel_matches_native_order():
+    import random
+    from regelum.compiler import _causality_jit as jit
+    from regelum.compiler import _causality_native as native
+    from regelum.compiler.passes import _CSR
+
+    rng = random.Random(7)
+    for _ in range(30):
+        n = rng.randint(1, 25)
+        arcs = [(rng.randrange(n), rng.randrange(n)) for _ in range(rng.randint(0, 50))]
+        csr = _CSR.from_arcs(n, arcs)
+        vertices = rng.sample(range(n), rng.randint(1, n))
+        expected = native.tarjan(vertices, csr.offsets, csr.neighbors)
+        offsets, neighbors = csr.as_numpy()
+        got = jit._split(*jit._tarjan_kernel(np.asarray(vertices, dtype=np.int32), offsets, neighbors))
+        assert got == expected
+
+def test_tarjan_skip_trivial_drops_only_loopless_singletons():
+    import random
+    from regelum.compiler import _causality_native as native
+    from regelum.compiler.passes import _CSR
+
+    rng = random.Random(3)
+    for _ in range(30):
+        n = rng.randint(1, 25)
+        arcs = [(rng.randrange(n), rng.randrange(n)) for _ in range(rng.randint(0, 40))]
+        csr = _CSR.from_arcs(n, arcs)
+        full = native.tarjan(list(range(n)), csr.offsets, csr.neighbors)
+        expected = [scc for scc in full if len(scc) > 1 or scc[0] in csr[scc[0]]]
+        assert native.tarjan(list(range(n)), csr.offsets, csr.neighbors, None, True) == expected
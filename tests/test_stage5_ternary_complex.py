@@ -1,5 +1,5 @@
 import pytest
-from regelum.core.dsl import If, Const, Var, BinOp
+from regelum.core.dsl import If, Const, Var, BinOp, Delay
 from regelum.core.ternary import V3
 from regelum.core.interpreter import eval_expr_3val
 
@@ -57,3 +57,14 @@ def test_ternary_arithmetic_propagation():
     # Verify Step 3
     res3 = eval_expr_3val(outer, env)
     assert not res3.known
+
+def test_bottom_left_operand_skips_right_subtree():
+    # The right operand would raise if evaluated (unlowered Delay).
+    expr = BinOp("+", Var("x"), Delay(Const(1), 0))
+    res = eval_expr_3val(expr, {"x": V3.bottom()})
+    assert res.is_bottom()
+
+    # ABSENT on the left still lets a BOTTOM right operand dominate.
+    expr2 = BinOp("+", Var("x"), Var("y"))
+    res2 = eval_expr_3val(expr2, {"x": V3.absent(), "y": V3.bottom()})
+    assert res2.is_bottom()
@@ -71,3 +71,75 @@ def test_reset_behavior():
     runtime.run_tick()
     assert r.last_read is ABSENT
 
+
+
+def test_compiled_expr_matches_interpreter_on_absent():
+    from regelum.core.dsl import Var, Const, If, BinOp, Cmp
+    from regelum.core.interpreter import compile_expr, eval_expr
+
+    x, y = Var("x"), Var("y")
+    exprs = [
+        x + y * Const(2),
+        If(Cmp(">", x, Const(0)), BinOp("max", x, y), BinOp("min", x, Const(-1.5))),
+        Cmp("==", x - y, Const(0)),
+        If(Var("flag"), Const([1, 2]), Const(None)),
+    ]
+    envs = [
+        {"x": 3, "y": 4, "flag": True},
+        {"x": -2, "y": 1, "flag": False},
+        {"x": ABSENT, "y": 1, "flag": ABSENT},
+        {"x": 5},
+    ]
+    for expr in exprs:
+        fn = compile_expr(expr)
+        for env in envs:
+            assert fn(env) == eval_expr(expr, env)
+
+
+def test_compile_expr_shares_code_between_identical_expressions():
+    from regelum.core.dsl import Var, Const, BinOp
+    from regelum.core.interpreter import compile_expr
+
+    first = compile_expr(BinOp("+", Var("x"), Const(1.5)), "<shared>")
+    second = compile_expr(BinOp("+", Var("x"), Const(1.5)), "<shared>")
+    assert first is not second
+    assert first.__code__ is second.__code__
+    assert second({"x": 1.0}) == 2.5
+    assert compile_expr(BinOp("+", Var("x"), Const(float("nan"))))({"x": 1.0}) != 0
+
+
+def test_numba_lowering_matches_interpreter_on_floats():
+    from regelum.core.dsl import Var, Const, If, BinOp, Cmp
+    from regelum.core.interpreter import compile_expr, eval_expr
+    from regelum.core.jit_codegen import _max, _min, numba_source, with_numba_fast_path
+
+    x, y = Var("x"), Var("y")
+    expr = If(Cmp(">", x, Const(0)), BinOp("max", x * Const(2), y), BinOp("/", BinOp("min", x, Const(-1.5)), y))
+    src, args, signature = numba_source(expr)
+    assert args == ("x", "y") and signature == "float64(float64, float64)"
+    namespace = {"_min": _min, "_max": _max}
+    exec(src, namespace)
+    slots = {"y": 0}
+    fn = with_numba_fast_path(namespace["_jit"], (1, 0), compile_expr(expr, slots=slots))
+    assert slots == {"y": 0, "x": 1}
+    for env in ({"x": 3.0, "y": 4.0}, {"x": -2.0, "y": 0.5}, {"x": 1.0, "y": ABSENT}, {"x": 2, "y": 1.0}):
+        assert fn([env["y"], env["x"]]) == eval_expr(expr, env)
+
+    assert numba_source(Const(1) + Const(2)) is None
+    assert numba_source(If(Cmp("<", x, y), x, Const(0))) is None
+    assert numba_source(BinOp("min", x, Const(1))) is None
+
+
+def test_absent_absorbs_arithmetic_and_ordering():
+    import numpy as np
+
+    assert ABSENT + 1 is ABSENT
+    assert 2.5 - ABSENT is ABSENT
+    assert ABSENT * ABSENT is ABSENT
+    assert 1 / ABSENT is ABSENT
+    assert (3 < ABSENT) is ABSENT
+    assert (ABSENT >= 0) is ABSENT
+    assert np.array([1.0, 2.0]) + ABSENT is ABSENT
+    assert np.float64(1.0) * ABSENT is ABSENT
+    assert ABSENT == ABSENT
+    assert (ABSENT == 0) is False